@@ -0,0 +1,431 @@
+"""
+Streaming bulk loader for catalog imports (see the bulk_import command).
+
+Records are read lazily from JSON (a plain array or a Django fixture), NDJSON
+or CSV, validated a chunk at a time and written with PostgreSQL COPY (or
+bulk_create). Memory is bounded by the chunk size and no per-row queries or
+signals run. Foreign keys are resolved with one query per chunk and relation,
+and each ImportSpec creates the derived rows (tags, ledgers, ...) its model's
+signals would have, a chunk at a time.
+"""
+import csv
+import io
+import json
+import operator
+import re
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time
+
+from django.core.exceptions import ValidationError
+from django.db import connections, models, transaction
+from django.utils import timezone
+
+FORMATS = ('json', 'ndjson', 'csv')
+
+_WHITESPACE = re.compile(r'\s*')
+
+
+def detect_format(path):
+    for file_format in FORMATS:
+        if path.lower().endswith(f'.{file_format}'):
+            return file_format
+    return None
+
+
+def iter_json_array(stream, buffer_size=1 << 16):
+    """Yield the items of a top-level JSON array without loading the whole document."""
+    decoder = json.JSONDecoder()
+    buffer, position, eof = '', 0, False
+    state = 'open'  # then 'first', 'item' or 'separator'
+
+    while True:
+        position = _WHITESPACE.match(buffer, position).end()
+        if position == len(buffer):
+            if eof:
+                raise ValueError('Unexpected end of JSON input.')
+            buffer, position = stream.read(buffer_size), 0
+            eof = not buffer
+            continue
+
+        char = buffer[position]
+        if state == 'open':
+            if char != '[':
+                raise ValueError('Expected a JSON array of records.')
+            position += 1
+            state = 'first'
+        elif state in ('first', 'separator') and char == ']':
+            return
+        elif state == 'separator':
+            if char != ',':
+                raise ValueError(f'Expected "," or "]" in the JSON array, found {char!r}.')
+            position += 1
+            state = 'item'
+        else:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                end = None
+            # An item cut off by the buffer (a number may be, too) continues in the next read.
+            if end is None or (end == len(buffer) and not eof):
+                chunk = stream.read(buffer_size)
+                eof = not chunk
+                buffer, position = buffer[position:] + chunk, 0
+                continue
+            position = end
+            state = 'separator'
+            yield item
+
+
+def iter_records(stream, file_format):
+    """Yield (record number, record dict) pairs from an open text stream."""
+    if file_format == 'json':
+        items = iter_json_array(stream)
+    elif file_format == 'ndjson':
+        items = (json.loads(line) for line in stream if line.strip())
+    elif file_format == 'csv':
+        items = csv.DictReader(stream)
+    else:
+        raise ValueError(f'Unsupported format: {file_format}')
+
+    for number, item in enumerate(items, start=1):
+        if not isinstance(item, dict):
+            raise ValueError(f'Record {number} is not an object.')
+        yield number, item
+
+
+def split_record(record, default_label=None):
+    """Return (model label, source key, fields) for a fixture entry or a plain record."""
+    if 'model' in record and isinstance(record.get('fields'), dict):
+        return record['model'].lower(), record.get('pk'), record['fields']
+    return default_label, record.get('pk', record.get('id')), record
+
+
+@dataclass
+class ImportRow:
+    number: int
+    source_key: str | None
+    fields: dict
+    obj: models.Model | None = None
+
+
+class ImportSpec:
+    """
+    How one model is loaded.
+
+    `references` maps a foreign key to (referenced model label, natural key
+    field or None). A reference may be given as the source key of a record
+    loaded earlier in the same run, as the referenced row's primary key, or by
+    natural key in a `<field>_<natural key>` column (e.g. user_email).
+    """
+    model = None
+    references = {}
+    validation_exclude = ()
+
+    @property
+    def label(self):
+        return self.model._meta.label_lower
+
+    def prepare(self, fields):
+        """Adjust a record's raw fields before they are converted; raise ValidationError to reject it."""
+        return fields
+
+    def after_insert(self, objs, insert):
+        """
+        Create the rows the model's signals would have created for a chunk of
+        inserted objects; `insert(model, objs)` writes them the same way.
+        """
+
+
+def to_python(field, raw):
+    if raw == '' and (field.null or not isinstance(field, (models.CharField, models.TextField))):
+        return None if field.null else field.get_default()
+    value = field.to_python(raw)
+    if isinstance(value, datetime) and timezone.is_naive(value):
+        value = timezone.make_aware(value)
+    return value
+
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+# Values of these fields are already in their database form after to_python().
+_PLAIN_FIELDS = (models.CharField, models.TextField, models.IntegerField, models.BooleanField, models.ForeignKey)
+
+
+def copy_text(value):
+    """Encode a database value for COPY ... FROM STDIN in text format."""
+    if value is None:
+        return r'\N'
+    if value is True or value is False:
+        return 't' if value else 'f'
+    if isinstance(value, (datetime, date, dt_time)):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def copy_encoder(field, connection):
+    """Return a function turning a model attribute into its COPY text, resolved once per field."""
+    if isinstance(field, models.JSONField):
+        return lambda value: copy_text(None if value is None else json.dumps(value, cls=field.encoder))
+    if isinstance(field, _PLAIN_FIELDS):
+        return copy_text
+    return lambda value: copy_text(field.get_db_prep_save(value, connection))
+
+
+def copy_objects(model, objs, using='default'):
+    """Write fully built instances (primary keys included) with a single COPY."""
+    connection = connections[using]
+    fields = [field for field in model._meta.concrete_fields if not field.generated]
+    columns = []
+    for field in fields:
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            # Keep imported timestamps; stamp only the missing ones.
+            def read(obj, field=field):
+                return getattr(obj, field.attname) or field.pre_save(obj, add=True)
+        elif type(field).pre_save is not models.Field.pre_save:
+            def read(obj, field=field):
+                return field.pre_save(obj, add=True)
+        else:
+            read = operator.attrgetter(field.attname)
+        columns.append((read, copy_encoder(field, connection)))
+
+    buffer = io.StringIO()
+    for obj in objs:
+        buffer.write('\t'.join([encode(read(obj)) for read, encode in columns]))
+        buffer.write('\n')
+    buffer.seek(0)
+
+    quote = connection.ops.quote_name
+    names = ', '.join(quote(field.column) for field in fields)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY {quote(model._meta.db_table)} ({names}) FROM STDIN', buffer)
+
+
+def allocate_ids(model, count, using='default'):
+    """Reserve `count` values of the model's primary key sequence in one round trip."""
+    with connections[using].cursor() as cursor:
+        cursor.execute(
+            'SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)',
+            [model._meta.db_table, model._meta.pk.column, count],
+        )
+        return [row[0] for row in cursor.fetchall()]
+
+
+@dataclass
+class ImportStats:
+    inserted: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rate(self):
+        return self.inserted / self.seconds if self.seconds else 0.0
+
+
+class BulkImporter:
+    """
+    Buffers records per model and loads them in chunks. A model's references
+    are flushed before it, so parents that appear earlier in the input can be
+    referenced by their source keys.
+    """
+
+    def __init__(self, specs, chunk_size=5000, method='copy', max_errors=1000, on_chunk=None, on_error=None):
+        self.specs = {spec.label: spec for spec in specs}
+        self.chunk_size = chunk_size
+        self.method = method
+        self.max_errors = max_errors
+        self.on_chunk = on_chunk
+        self.on_error = on_error
+        self.buffers = {label: [] for label in self.specs}
+        self.stats = {label: ImportStats() for label in self.specs}
+        referenced = {target for spec in specs for target, _ in spec.references.values()}
+        # Source key -> primary key, only for models other records can reference.
+        self.source_keys = {label: {} for label in referenced}
+        self.errors = 0
+
+    def add(self, label, number, fields, source_key=None):
+        if label not in self.specs:
+            raise ValueError(f'Record {number}: no importer for model "{label}".')
+        buffer = self.buffers[label]
+        buffer.append(ImportRow(number, None if source_key in (None, '') else str(source_key), fields))
+        if len(buffer) >= self.chunk_size:
+            self.flush(label)
+
+    def finish(self):
+        for label in self.specs:
+            self.flush(label)
+
+    def flush(self, label):
+        spec = self.specs[label]
+        for target, _ in spec.references.values():
+            if target in self.buffers and target != label:
+                self.flush(target)
+        rows, self.buffers[label] = self.buffers[label], []
+        if rows:
+            self.load_chunk(spec, rows)
+
+    def reject(self, spec, row, error):
+        self.stats[spec.label].rejected += 1
+        self.errors += 1
+        if self.on_error:
+            self.on_error(spec.label, row.number, error)
+        if self.errors > self.max_errors:
+            raise RuntimeError(f'More than {self.max_errors} invalid records; import stopped.')
+
+    def load_chunk(self, spec, rows):
+        started = time.monotonic()
+        rows = self.build(spec, rows)
+        rows = self.resolve_references(spec, rows)
+        rows = self.validate(spec, rows)
+        rows = self.check_unique(spec, rows)
+
+        if rows:
+            objs = [row.obj for row in rows]
+            with transaction.atomic():
+                self.insert(spec.model, objs)
+                spec.after_insert(objs, self.insert)
+            if spec.label in self.source_keys:
+                keys = self.source_keys[spec.label]
+                for row in rows:
+                    if row.source_key is not None:
+                        keys[row.source_key] = row.obj.pk
+
+        stats = self.stats[spec.label]
+        stats.inserted += len(rows)
+        stats.seconds += time.monotonic() - started
+        if self.on_chunk:
+            self.on_chunk(spec.label, len(rows), stats)
+
+    def build(self, spec, rows):
+        fields = {
+            field.name: field for field in spec.model._meta.concrete_fields
+            if not field.generated and not field.primary_key
+        }
+        built = []
+        for row in rows:
+            try:
+                data = spec.prepare(dict(row.fields))
+                values = {}
+                for name, field in fields.items():
+                    if name in spec.references:
+                        continue
+                    if name in data:
+                        values[field.attname] = to_python(field, data[name])
+                row.obj = spec.model(**values)
+            except ValidationError as e:
+                self.reject(spec, row, e)
+                continue
+            built.append(row)
+        return built
+
+    def resolve_references(self, spec, rows):
+        """Set foreign keys with one lookup per relation for the whole chunk."""
+        invalid = {}
+        for name, (target, natural_key) in spec.references.items():
+            field = spec.model._meta.get_field(name)
+            related = field.related_model
+            source_keys = self.source_keys.get(target, {})
+
+            wanted = {}
+            for row in rows:
+                if natural_key and row.fields.get(f'{name}_{natural_key}') not in (None, ''):
+                    wanted[row.number] = ('natural', row.fields[f'{name}_{natural_key}'])
+                elif row.fields.get(name) not in (None, ''):
+                    raw = str(row.fields[name])
+                    wanted[row.number] = ('source', source_keys[raw]) if raw in source_keys else ('pk', raw)
+                elif not field.null:
+                    invalid[row.number] = f'{name}: this field is required.'
+
+            natural = {value for kind, value in wanted.values() if kind == 'natural'}
+            by_natural_key = dict(
+                related._default_manager.filter(**{f'{natural_key}__in': natural}).values_list(natural_key, 'pk')
+            ) if natural else {}
+
+            pks = set()
+            for kind, value in wanted.values():
+                if kind == 'pk':
+                    try:
+                        pks.add(related._meta.pk.to_python(value))
+                    except ValidationError:
+                        pass
+            existing = set(related._default_manager.filter(pk__in=pks).values_list('pk', flat=True)) if pks else set()
+
+            for row in rows:
+                if row.number not in wanted:
+                    continue
+                kind, value = wanted[row.number]
+                if kind == 'source':
+                    pk = value
+                elif kind == 'natural':
+                    pk = by_natural_key.get(value)
+                else:
+                    try:
+                        pk = related._meta.pk.to_python(value)
+                    except ValidationError:
+                        pk = None
+                    pk = pk if pk in existing else None
+                if pk is None:
+                    invalid[row.number] = f'{name}: {value} does not match any {related._meta.verbose_name}.'
+                else:
+                    setattr(row.obj, field.attname, pk)
+
+        resolved = []
+        for row in rows:
+            if row.number in invalid:
+                self.reject(spec, row, ValidationError(invalid[row.number]))
+            else:
+                resolved.append(row)
+        return resolved
+
+    def validate(self, spec, rows):
+        """Field validation and Model.clean() only; uniqueness is checked per chunk in check_unique()."""
+        exclude = [
+            *spec.references, *spec.validation_exclude,
+            *(field.name for field in spec.model._meta.concrete_fields if field.generated),
+        ]
+        valid = []
+        for row in rows:
+            try:
+                row.obj.clean_fields(exclude=exclude)
+                row.obj.clean()
+            except ValidationError as e:
+                self.reject(spec, row, e)
+                continue
+            valid.append(row)
+        return valid
+
+    def check_unique(self, spec, rows):
+        """Reject rows whose unique values repeat within the chunk or already exist: one query per field."""
+        for field in spec.model._meta.concrete_fields:
+            if not field.unique or field.primary_key:
+                continue
+            values = {getattr(row.obj, field.attname) for row in rows} - {None}
+            taken = set(
+                spec.model._default_manager.filter(**{f'{field.attname}__in': values})
+                .values_list(field.attname, flat=True)
+            ) if values else set()
+            kept = []
+            for row in rows:
+                value = getattr(row.obj, field.attname)
+                if value is not None and value in taken:
+                    self.reject(spec, row, ValidationError(f'{field.name}: {value} already exists.'))
+                    continue
+                if value is not None:
+                    taken.add(value)
+                kept.append(row)
+            rows = kept
+        return rows
+
+    def insert(self, model, objs):
+        if not objs:
+            return
+        if self.method == 'bulk':
+            model._default_manager.bulk_create(objs, batch_size=1000)
+            return
+        pk = model._meta.pk
+        if isinstance(pk, models.AutoField):
+            for obj, pk_value in zip(objs, allocate_ids(model, len(objs))):
+                obj.pk = pk_value
+        copy_objects(model, objs)
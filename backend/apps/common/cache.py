@@ -0,0 +1,84 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.core.cache import cache
+
+
+def get_or_set_coalesced(key, producer, timeout, lock_timeout=10, wait_timeout=2.0, poll_interval=0.05):
+    """
+    Read-through cache lookup that coalesces concurrent misses for the same key.
+
+    The first caller to miss takes a short-lived lock (an atomic cache.add) and
+    recomputes the value; the others poll the cache until it appears instead of
+    all hitting the database at once. If the value does not show up within
+    wait_timeout (e.g. the lock holder died), callers fall back to computing it.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = f'{key}:lock'
+    if cache.add(lock_key, 1, lock_timeout):
+        try:
+            value = producer()
+            cache.set(key, value, timeout)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+    deadline = time.monotonic() + wait_timeout
+    while time.monotonic() < deadline:
+        time.sleep(poll_interval)
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+    return producer()
+
+
+class LRUCache:
+    """
+    Small thread-safe in-process cache with a size bound and a per-entry TTL.
+
+    It saves a round trip where even the shared cache would cost more than the
+    lookup it avoids. Entries are local to the process, so writers invalidate
+    their own process and the TTL bounds how stale other processes can be.
+    """
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete(self, key):
+        """Drop key; returns whether it was cached."""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,77 @@
+import hashlib
+import posixpath
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+LOGO_VARIANT_WIDTHS = (64, 128, 256)
+WEBP_QUALITY = 80
+
+
+def build_webp_variants(field_file, directory, widths=LOGO_VARIANT_WIDTHS):
+    """
+    Render WebP copies of an uploaded image at fixed widths.
+
+    Files are stored as <directory>/<content hash>_<width>w.webp, so identical
+    uploads share variants and a new upload never overwrites a cached URL.
+    Images are never upscaled. Returns {str(width): storage name}.
+    """
+    storage = field_file.storage
+    with field_file.open('rb') as source:
+        content = source.read()
+    digest = hashlib.sha256(content).hexdigest()[:20]
+
+    image = ImageOps.exif_transpose(Image.open(BytesIO(content)))
+    if image.mode not in ('RGB', 'RGBA'):
+        image = image.convert('RGBA' if image.mode in ('LA', 'P', 'PA') else 'RGB')
+
+    variants = {}
+    for width in widths:
+        name = posixpath.join(directory, f'{digest}_{width}w.webp')
+        if not storage.exists(name):
+            target_width = min(width, image.width)
+            target_height = max(1, round(image.height * target_width / image.width))
+            buffer = BytesIO()
+            image.resize((target_width, target_height), Image.LANCZOS).save(
+                buffer, 'WEBP', quality=WEBP_QUALITY, method=6
+            )
+            name = storage.save(name, ContentFile(buffer.getvalue()))
+        variants[str(width)] = name
+    return variants
+
+
+def generate_logo_variants(model, pk, directory):
+    """
+    Background task: build WebP variants for a profile logo and record them in
+    `logo_variants` as {'source': <logo name>, 'webp': {width: name}}.
+
+    updated_at is bumped so cached payloads and ETags pick up the new variants.
+    The update is skipped if the logo changed again in the meantime.
+    """
+    instance = model.objects.filter(pk=pk).only('logo', 'logo_variants').first()
+    if instance is None or not instance.logo or instance.logo_variants.get('source') == instance.logo.name:
+        return
+
+    variants = build_webp_variants(instance.logo, directory)
+    model.objects.filter(pk=pk, logo=instance.logo.name).update(
+        logo_variants={'source': instance.logo.name, 'webp': variants},
+        updated_at=timezone.now(),
+    )
+
+
+def logo_variants_outdated(instance):
+    return bool(instance.logo) and instance.logo_variants.get('source') != instance.logo.name
+
+
+def srcset_from_variants(storage, logo_name, variants):
+    """{width: url} of the logo's variants, or {} while they are being generated."""
+    variants = variants or {}
+    if not logo_name or variants.get('source') != logo_name:
+        return {}
+    return {width: storage.url(name) for width, name in variants.get('webp', {}).items()}
+
+
+def logo_srcset(instance):
+    return srcset_from_variants(instance.logo.storage, instance.logo.name, instance.logo_variants)
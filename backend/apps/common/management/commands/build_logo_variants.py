@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from apps.common.images import generate_logo_variants, logo_variants_outdated
+from apps.investors.models import InvestorProfile
+from apps.startups.models import StartupProfile
+
+LOGO_MODELS = (
+    (StartupProfile, 'media/startup_logos/variants'),
+    (InvestorProfile, 'media/Investor_logos/variants'),
+)
+
+
+class Command(BaseCommand):
+    """Django command to build missing logo variants for existing profiles."""
+
+    help = 'Generate WebP logo variants for startup and investor profiles that lack them.'
+
+    def handle(self, *args, **options):
+        for model, directory in LOGO_MODELS:
+            built = failed = 0
+            profiles = model.objects.exclude(logo='').only('logo', 'logo_variants')
+            for profile in profiles.iterator(chunk_size=500):
+                if not logo_variants_outdated(profile):
+                    continue
+                try:
+                    generate_logo_variants(model, profile.pk, directory)
+                    built += 1
+                except (OSError, ValueError) as e:
+                    failed += 1
+                    self.stderr.write(f'{model.__name__} {profile.pk}: {e}')
+
+            self.stdout.write(self.style.SUCCESS(
+                f'{model._meta.verbose_name_plural}: built {built}, failed {failed}.'
+            ))
@@ -0,0 +1,164 @@
+from collections import Counter, defaultdict
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.common.bulk_import import FORMATS, BulkImporter, ImportSpec, detect_format, iter_records, split_record
+from apps.facets.engine import INVESTOR, STARTUP, apply_facet_deltas, investor_facets, startup_facets
+from apps.investors.models import Industry, InvestorIndustry, InvestorProfile
+from apps.projects.models import Pledge, Project
+from apps.startups.models import StartupProfile, StartupTag, Tag
+
+User = get_user_model()
+
+
+def link_names(objs, attname, named):
+    """{obj pk: {related id: position}} for the comma-separated names in `attname`, as the sync_* methods build it."""
+    names = {obj.pk: named.objects.split_names(getattr(obj, attname)) for obj in objs}
+    resolved = named.objects.resolve([name for obj_names in names.values() for name in obj_names])
+    return {
+        pk: {resolved[name.lower()].id: position for position, name in enumerate(obj_names)}
+        for pk, obj_names in names.items()
+    }
+
+
+class UserSpec(ImportSpec):
+    model = User
+
+    def prepare(self, fields):
+        password = fields.get('password')
+        if password in (None, ''):
+            fields['password'] = make_password(None)
+        else:
+            try:
+                identify_hasher(password)
+            except ValueError:
+                raise ValidationError('password: expected a password hash, not a raw password.')
+        return fields
+
+
+class StartupSpec(ImportSpec):
+    model = StartupProfile
+    references = {'user': ('users.user', 'email')}
+    validation_exclude = ('logo',)
+
+    def after_insert(self, objs, insert):
+        links = link_names(objs, 'partners_brands', Tag)
+        insert(StartupTag, [
+            StartupTag(startup_id=pk, tag_id=tag_id, position=position)
+            for pk, wanted in links.items() for tag_id, position in wanted.items()
+        ])
+        added = Counter(tag_id for wanted in links.values() for tag_id in wanted)
+        by_delta = defaultdict(list)
+        for tag_id, delta in added.items():
+            by_delta[delta].append(tag_id)
+        for delta, tag_ids in by_delta.items():
+            Tag.objects.filter(pk__in=tag_ids).adjust_startups_count(delta)
+
+        apply_facet_deltas(STARTUP, Counter(facet for obj in objs for facet in startup_facets(obj.city)))
+
+
+class InvestorSpec(ImportSpec):
+    model = InvestorProfile
+    references = {'user': ('users.user', 'email')}
+    validation_exclude = ('logo',)
+
+    def after_insert(self, objs, insert):
+        links = link_names(objs, 'preferred_industries', Industry)
+        insert(InvestorIndustry, [
+            InvestorIndustry(investor_id=pk, industry_id=industry_id, position=position)
+            for pk, wanted in links.items() for industry_id, position in wanted.items()
+        ])
+
+        apply_facet_deltas(INVESTOR, Counter(
+            facet for obj in objs
+            for facet in investor_facets(obj.region, obj.city, obj.preferred_industries)
+        ))
+
+
+class ProjectSpec(ImportSpec):
+    model = Project
+    references = {'startup': ('startups.startupprofile', None)}
+
+    def after_insert(self, objs, insert):
+        # Imported totals become opening balances, as for projects created with money raised.
+        insert(Pledge, [
+            Pledge(project_id=obj.pk, kind='opening_balance', amount=obj.raised_amount)
+            for obj in objs if obj.raised_amount
+        ])
+
+
+# Parents first: records may reference users and startups loaded earlier in the same file.
+IMPORT_SPECS = (UserSpec, StartupSpec, InvestorSpec, ProjectSpec)
+
+
+class Command(BaseCommand):
+    """Django command to bulk load users, startups, investors and projects from a file."""
+
+    help = (
+        'Stream records from a JSON (plain array or Django fixture), NDJSON or CSV file, validate them '
+        'in chunks and load them with COPY (or bulk_create). Per-row signals are not sent; '
+        'tags, industries, facet counts and pledge ledgers are maintained per chunk.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=FORMATS, help='Defaults to the file extension.')
+        parser.add_argument('--model', help='Model label (e.g. startups.startupprofile) of records that are not fixture entries.')
+        parser.add_argument('--chunk-size', type=int, default=5000)
+        parser.add_argument('--method', choices=('copy', 'bulk'), default='copy')
+        parser.add_argument('--max-errors', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        file_format = options['format'] or detect_format(options['path'])
+        if file_format is None:
+            raise CommandError('Cannot tell the file format from its name; pass --format.')
+
+        importer = BulkImporter(
+            [spec() for spec in IMPORT_SPECS],
+            chunk_size=options['chunk_size'],
+            method=options['method'],
+            max_errors=options['max_errors'],
+            on_chunk=self.report_chunk,
+            on_error=self.report_error,
+        )
+        default_label = options['model'].lower() if options['model'] else None
+        self.verbosity = options['verbosity']
+
+        try:
+            with open(options['path'], encoding='utf-8-sig', newline='') as stream:
+                for number, record in iter_records(stream, file_format):
+                    label, source_key, fields = split_record(record, default_label)
+                    if label is None:
+                        raise ValueError(f'Record {number} is not a fixture entry; pass --model.')
+                    importer.add(label, number, fields, source_key)
+                importer.finish()
+        except (OSError, ValueError, RuntimeError) as e:
+            raise CommandError(str(e))
+        finally:
+            self.report_totals(importer)
+
+        self.stdout.write(
+            'Run refresh_recommendations and compute_trending to include the imported rows in rankings.'
+        )
+
+    def report_chunk(self, label, inserted, stats):
+        if self.verbosity > 1:
+            self.stdout.write(f'{label}: +{inserted} ({stats.inserted} total, {stats.rate:.0f} rows/s)')
+
+    def report_error(self, label, number, error):
+        if hasattr(error, 'error_dict'):
+            messages = [f'{field}: {message}' for field, errors in error.message_dict.items() for message in errors]
+        else:
+            messages = error.messages
+        self.stderr.write(f'Record {number} ({label}): {"; ".join(messages)}')
+
+    def report_totals(self, importer):
+        for label, stats in importer.stats.items():
+            if stats.inserted or stats.rejected:
+                self.stdout.write(self.style.SUCCESS(
+                    f'{label}: inserted {stats.inserted}, rejected {stats.rejected} '
+                    f'in {stats.seconds:.2f}s ({stats.rate:.0f} rows/s).'
+                ))
@@ -0,0 +1,70 @@
+from django.db import models, transaction
+from django.db.models.functions import Lower
+
+from apps.common.utils import split_comma_list
+
+
+class CaseInsensitiveNameQuerySet(models.QuerySet):
+    """For models with a `name` field that is unique on LOWER(name)."""
+
+    def split_names(self, value):
+        """split_comma_list() of a comma-separated text field, with items cut to fit the name column."""
+        return split_comma_list(value, self.model._meta.get_field('name').max_length)
+
+    def resolve(self, names):
+        """
+        Return {lowercased name: instance} for the given names, creating missing rows.
+        Lookups go through the unique index on LOWER(name).
+        """
+        wanted = {name.lower(): name for name in names}
+        if not wanted:
+            return {}
+
+        def fetch(keys):
+            return {
+                obj.lower_name: obj
+                for obj in self.annotate(lower_name=Lower('name')).filter(lower_name__in=keys)
+            }
+
+        found = fetch(wanted)
+        missing = [key for key in wanted if key not in found]
+        if missing:
+            self.bulk_create([self.model(name=wanted[key]) for key in missing], ignore_conflicts=True)
+            found.update(fetch(missing))
+        return found
+
+
+def sync_name_links(links, value, target):
+    """
+    Mirror the comma-separated names in `value` into `links`, a related manager of
+    position-ordered junction rows (e.g. startup.startup_tags) whose `target`
+    foreign key points at a CaseInsensitiveNameQuerySet model. Only added, removed
+    and moved links are written. Returns the (added, removed) target ids.
+    """
+    link_model = links.model
+    target_field = link_model._meta.get_field(target)
+    named = target_field.related_model.objects
+    names = named.split_names(value)
+    resolved = named.resolve(names)
+    wanted = {resolved[name.lower()].id: position for position, name in enumerate(names)}
+    existing = {getattr(link, target_field.attname): link for link in links.all()}
+
+    removed = [pk for pk in existing if pk not in wanted]
+    added = [pk for pk in wanted if pk not in existing]
+    moved = []
+    for pk, link in existing.items():
+        if pk in wanted and link.position != wanted[pk]:
+            link.position = wanted[pk]
+            moved.append(link)
+
+    with transaction.atomic():
+        if removed:
+            links.filter(**{f'{target_field.attname}__in': removed}).delete()
+        if added:
+            link_model.objects.bulk_create([
+                link_model(**{links.field.name: links.instance, target_field.attname: pk, 'position': wanted[pk]})
+                for pk in added
+            ])
+        if moved:
+            link_model.objects.bulk_update(moved, ['position'])
+    return added, removed
@@ -0,0 +1,57 @@
+import hashlib
+
+from django.http import Http404
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+
+class ConditionalGetMixin:
+    """
+    Conditional GET support for retrieve actions.
+
+    Last-Modified and a weak ETag are derived from a few cheap columns read with a
+    single `.values()` lookup, so a matching If-None-Match / If-Modified-Since is
+    answered with 304 Not Modified before the object is loaded or serialized.
+
+    Viewsets configure `last_modified_field` and `etag_fields` and may override
+    get_fresh_response() to build the 200 response (e.g. from a cache).
+    """
+    last_modified_field = 'updated_at'
+    etag_fields = ('updated_at',)
+
+    def get_lookup_filter(self):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        return {self.lookup_field: self.kwargs[lookup_url_kwarg]}
+
+    def get_validator_values(self):
+        fields = dict.fromkeys(('pk', self.last_modified_field, *self.etag_fields))
+        queryset = self.get_queryset().prefetch_related(None).order_by()
+        try:
+            values = queryset.filter(**self.get_lookup_filter()).values(*fields).first()
+        except (TypeError, ValueError):
+            raise Http404
+        if values is None:
+            raise Http404
+        return values
+
+    def get_validators(self, values):
+        digest = hashlib.md5(
+            '|'.join(str(values[field]) for field in self.etag_fields).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        return f'W/"{digest}"', int(values[self.last_modified_field].timestamp())
+
+    def get_fresh_response(self, request, validator_values, *args, **kwargs):
+        return super().retrieve(request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        values = self.get_validator_values()
+        etag, last_modified = self.get_validators(values)
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = self.get_fresh_response(request, values, *args, **kwargs)
+
+        response['ETag'] = etag
+        response['Last-Modified'] = http_date(last_modified)
+        return response
@@ -0,0 +1,129 @@
+import base64
+import json
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination over a fixed ordering.
+
+    The cursor encodes the ordering values of the last row on the page, so the
+    next page is fetched with a range condition that an index on the ordering
+    columns can serve directly, instead of an OFFSET that scans skipped rows.
+    The last ordering field must be unique (usually 'id').
+
+    Views may override the ordering with a `keyset_ordering` attribute.
+    """
+    ordering = ('-created_at', '-id')
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    cursor_query_param = 'cursor'
+    invalid_cursor_message = 'Invalid cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.ordering = tuple(getattr(view, 'keyset_ordering', self.ordering))
+        self.model = queryset.model
+
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.get_seek_filter(position))
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_position = self.get_position(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except (TypeError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ('next', self.get_next_link()),
+            ('results', data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'results': schema,
+            },
+        }
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
+
+    @staticmethod
+    def _field_name(ordering_field):
+        return ordering_field.lstrip('-')
+
+    def get_position(self, row):
+        position = []
+        for ordering_field in self.ordering:
+            name = self._field_name(ordering_field)
+            value = row[name] if isinstance(row, dict) else getattr(row, name)
+            position.append(value)
+        return position
+
+    def get_seek_filter(self, position):
+        """
+        Build `(a, b) < (x, y)` style row comparison as an OR of prefixes.
+
+        A non-strict bound on the leading column is added so the planner can
+        turn the condition into a single index range scan.
+        """
+        names = [self._field_name(field) for field in self.ordering]
+        operators = ['lt' if field.startswith('-') else 'gt' for field in self.ordering]
+
+        condition = Q()
+        for index, name in enumerate(names):
+            prefix = {names[i]: position[i] for i in range(index)}
+            prefix[f'{name}__{operators[index]}'] = position[index]
+            condition |= Q(**prefix)
+
+        leading_bound = Q(**{f'{names[0]}__{operators[0]}e': position[0]})
+        return leading_bound & condition
+
+    def encode_cursor(self, position):
+        values = [value.isoformat() if hasattr(value, 'isoformat') else value for value in position]
+        payload = json.dumps(values, default=str, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+
+        try:
+            values = json.loads(base64.urlsafe_b64decode(encoded.encode()).decode())
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError
+            return [
+                self.model._meta.get_field(self._field_name(field)).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, UnicodeDecodeError, DjangoValidationError):
+            raise NotFound(self.invalid_cursor_message)
@@ -0,0 +1,52 @@
+from apps.common.utils import split_comma_list
+
+
+class SparseFieldsetsMixin:
+    """
+    ModelSerializer mixin that lets clients trim the representation with
+    `?fields=a,b` (whitelist) and/or `?omit=c` (blacklist). Unknown names are ignored.
+
+    `model_field_sources` maps output fields to the model fields they read
+    (fields not listed read the model field of the same name), so views can
+    push the selection down into the queryset with `.only()` or `.values()`.
+    """
+    fields_query_param = 'fields'
+    omit_query_param = 'omit'
+    model_field_sources = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        request = self.context.get('request')
+        if request is not None:
+            selected = set(self.get_requested_fields(request))
+            for name in list(self.fields):
+                if name not in selected:
+                    self.fields.pop(name)
+
+    @classmethod
+    def get_requested_fields(cls, request):
+        """Output fields requested by the client, in declaration order."""
+        names = list(cls.Meta.fields)
+        params = getattr(request, 'query_params', {})
+
+        requested = split_comma_list(params.get(cls.fields_query_param))
+        if requested:
+            names = [name for name in names if name in requested]
+
+        omitted = split_comma_list(params.get(cls.omit_query_param))
+        return [name for name in names if name not in omitted]
+
+    @classmethod
+    def get_model_fields(cls, field_names):
+        """Model fields needed to render the given output fields."""
+        model_fields = []
+        for name in field_names:
+            for source in cls.model_field_sources.get(name, (name,)):
+                if source not in model_fields:
+                    model_fields.append(source)
+        return model_fields
+
+    @classmethod
+    def trim(cls, data, request):
+        """Apply the requested fieldset to an already rendered full representation."""
+        return {name: data[name] for name in cls.get_requested_fields(request) if name in data}
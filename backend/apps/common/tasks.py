@@ -0,0 +1,50 @@
+"""
+Minimal off-request-path execution for work triggered by model changes.
+
+Tasks are handed to a process-wide thread pool once the surrounding transaction
+commits, so they never see uncommitted rows and never delay the response. Set
+BACKGROUND_TASKS_EAGER=True (tests, management commands) to run them inline.
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=settings.BACKGROUND_TASK_WORKERS,
+                thread_name_prefix='background-task',
+            )
+    return _executor
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception('Background task %s failed', func.__name__)
+    finally:
+        # Worker threads own their database connections.
+        connections.close_all()
+
+
+def run_in_background(func, *args, **kwargs):
+    """Run func(*args, **kwargs) off the request path after the current transaction commits."""
+    def submit():
+        if settings.BACKGROUND_TASKS_EAGER:
+            func(*args, **kwargs)
+        else:
+            _get_executor().submit(_run, func, args, kwargs)
+
+    transaction.on_commit(submit)
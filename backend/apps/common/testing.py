@@ -0,0 +1,70 @@
+"""Model fixtures shared by the app test suites; keyword arguments override the defaults."""
+from django.utils.text import slugify
+
+from apps.investors.models import InvestorProfile
+from apps.projects.models import Project
+from apps.startups.models import StartupProfile
+from apps.users.models import User
+
+
+def create_user(email, **extra):
+    data = dict(password="password123", first_name="Test", last_name="User")
+    data.update(extra)
+    return User.objects.create_user(email=email, **data)
+
+
+def create_startup(company_name, user=None, **extra):
+    email = f"{slugify(company_name)}@example.com"
+    data = dict(
+        user=user or create_user(email),
+        company_name=company_name,
+        description="Startup.",
+        founded_year=2020,
+        team_size=5,
+        website="https://startup.com",
+        email=email,
+        phone="+380441234567",
+        city="Kyiv",
+        partners_brands="",
+        audit_status="approved",
+    )
+    data.update(extra)
+    return StartupProfile.objects.create(**data)
+
+
+def create_investor(email, user=None, **extra):
+    data = dict(
+        user=user or create_user(email),
+        company_name=f"{email} capital",
+        full_name="Investor",
+        description="Invests.",
+        investment_range_min=10000,
+        investment_range_max=50000,
+        preferred_industries="",
+        website="https://invest.com",
+        email=email,
+        phone="+380501234567",
+        country="Ukraine",
+        region=8,  # Kyiv
+        city="Kyiv",
+        address="Street 1",
+        postal_code="01001",
+        partners_brands="",
+    )
+    data.update(extra)
+    return InvestorProfile.objects.create(**data)
+
+
+def create_project(startup, slug, **extra):
+    data = dict(
+        startup=startup,
+        title=slug.title(),
+        slug=slug,
+        short_description="Round.",
+        description="Round.",
+        status="in_progress",
+        target_amount=10000,
+        tags="",
+    )
+    data.update(extra)
+    return Project.objects.create(**data)
@@ -0,0 +1,175 @@
+import csv
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from apps.facets.models import FacetCount
+from apps.investors.models import InvestorProfile
+from apps.projects.models import Project
+from apps.startups.models import StartupProfile, Tag
+from apps.users.models import User
+from .bulk_import import iter_json_array
+
+PASSWORD_HASH = 'pbkdf2_sha256$1000000$salt$hash='
+
+
+def user_record(pk, email):
+    return {'model': 'users.user', 'pk': pk, 'fields': {
+        'email': email, 'password': PASSWORD_HASH, 'first_name': 'Bulk', 'last_name': 'User',
+        'date_joined': '2025-01-01T00:00:00Z',
+    }}
+
+
+def startup_fields(name, **extra):
+    fields = {
+        'company_name': name, 'description': 'Builds things.', 'founded_year': 2020, 'team_size': 5,
+        'website': 'https://startup.com', 'email': f'{name.lower()}@example.com', 'phone': '1111111111',
+        'city': 'Lviv', 'address': 'Street 1', 'postal_code': '79000', 'partners_brands': 'Fintech, AI',
+        'audit_status': 'approved', 'created_at': '2024-05-01T10:00:00Z', 'updated_at': '2024-05-02T10:00:00Z',
+    }
+    fields.update(extra)
+    return fields
+
+
+class IterJsonArrayTest(TestCase):
+    """Tests for the streaming JSON array reader"""
+
+    def test_items_split_across_reads(self):
+        items = [{'name': 'a]b,c', 'n': 12345}, 67890, [1, [2]], 'tail"]', None]
+        text = ' [ ' + ' , '.join(json.dumps(item) for item in items) + ' ] '
+
+        for buffer_size in (1, 2, 7, 1 << 16):
+            self.assertEqual(list(iter_json_array(StringIO(text), buffer_size=buffer_size)), items)
+
+    def test_empty_array(self):
+        self.assertEqual(list(iter_json_array(StringIO('[ ]'), buffer_size=1)), [])
+
+    def test_rejects_malformed_input(self):
+        for text in ('{"a": 1}', '[1 2]', '[1, {"a": ', '[1,'):
+            with self.assertRaises(ValueError):
+                list(iter_json_array(StringIO(text), buffer_size=3))
+
+
+class BulkImportCommandTest(TestCase):
+    """Tests for the bulk_import management command"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def write(self, name, content):
+        path = os.path.join(self.directory, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def run_import(self, path, *args):
+        out, err = StringIO(), StringIO()
+        call_command('bulk_import', path, *args, stdout=out, stderr=err)
+        return out.getvalue(), err.getvalue()
+
+    def fixture(self):
+        return [
+            user_record(1, 'founder@example.com'),
+            user_record(2, 'investor@example.com'),
+            {'model': 'startups.startupprofile', 'pk': 1, 'fields': {'user': 1, **startup_fields('PayFlow')}},
+            {'model': 'investors.investorprofile', 'pk': 1, 'fields': {
+                'user': 2, 'company_name': 'Capital', 'full_name': 'Investor', 'description': 'Invests.',
+                'investment_range_min': '10000.00', 'investment_range_max': '50000.00',
+                'preferred_industries': 'Fintech, Health', 'website': 'https://invest.com',
+                'email': 'fund@example.com', 'phone': '+380501234567', 'country': 'Ukraine', 'region': 8,
+                'city': 'Kyiv', 'address': 'Street 1', 'postal_code': '01001', 'partners_brands': 'Monobank',
+            }},
+            {'model': 'projects.project', 'pk': 1, 'fields': {
+                'startup': 1, 'title': 'Seed', 'slug': 'payflow-seed', 'short_description': 'Seed.',
+                'description': 'Seed round.', 'status': 'in_progress', 'target_amount': '20000.00',
+                'raised_amount': '5000.00', 'tags': 'fintech',
+            }},
+        ]
+
+    def test_fixture_maps_source_keys_to_new_rows(self):
+        path = self.write('catalog.json', json.dumps(self.fixture()))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            out, err = self.run_import(path, '--chunk-size', '2')
+
+        self.assertEqual(err, '')
+        self.assertIn('users.user: inserted 2, rejected 0', out)
+        self.assertIn('projects.project: inserted 1, rejected 0', out)
+
+        startup = StartupProfile.objects.get(company_name='PayFlow')
+        self.assertEqual(startup.user.email, 'founder@example.com')
+        self.assertEqual(startup.created_at, datetime(2024, 5, 1, 10, tzinfo=timezone.utc))
+        self.assertEqual(startup.updated_at, datetime(2024, 5, 2, 10, tzinfo=timezone.utc))
+        self.assertIsNotNone(startup.search_vector)
+        self.assertEqual(list(startup.startup_tags.values_list('tag__name', 'position')), [('Fintech', 0), ('AI', 1)])
+        self.assertEqual(Tag.objects.get(name='AI').startups_count, 1)
+
+        investor = InvestorProfile.objects.get(email='fund@example.com')
+        self.assertEqual(investor.user.email, 'investor@example.com')
+        self.assertEqual(list(investor.industries.values_list('name', flat=True)), ['Fintech', 'Health'])
+        self.assertTrue(FacetCount.objects.filter(entity='investor', dimension='industry', value='health').exists())
+
+        project = Project.objects.get(slug='payflow-seed')
+        self.assertEqual(project.startup, startup)
+        self.assertEqual(project.pledges.get().kind, 'opening_balance')
+        self.assertEqual(project.raised_amount, Decimal('5000.00'))
+
+    def test_invalid_records_are_reported_and_skipped(self):
+        records = self.fixture()
+        records[1]['fields']['password'] = 'plain-text'
+        records[4]['fields']['status'] = 'Pending'
+        path = self.write('catalog.json', json.dumps(records))
+
+        out, err = self.run_import(path)
+
+        self.assertIn('Record 2 (users.user): password: expected a password hash', err)
+        self.assertIn('Record 4 (investors.investorprofile): user: 2 does not match any User.', err)
+        self.assertIn("Record 5 (projects.project): status: Value 'Pending' is not a valid choice.", err)
+        self.assertEqual(StartupProfile.objects.count(), 1)
+        self.assertFalse(InvestorProfile.objects.exists())
+        self.assertFalse(Project.objects.exists())
+
+    def test_duplicate_unique_values_are_rejected(self):
+        User.objects.create_user(email='taken@example.com', password='password123', first_name='A', last_name='B')
+        lines = [json.dumps(user_record(n, email)['fields']) for n, email in
+                 enumerate(['taken@example.com', 'new@example.com', 'new@example.com'])]
+        path = self.write('users.ndjson', '\n'.join(lines) + '\n')
+
+        out, err = self.run_import(path, '--model', 'users.user')
+
+        self.assertIn('users.user: inserted 1, rejected 2', out)
+        self.assertEqual(User.objects.filter(email='new@example.com').count(), 1)
+
+    def test_csv_resolves_users_by_email(self):
+        user = User.objects.create_user(email='founder@example.com', password='password123',
+                                        first_name='A', last_name='B')
+        columns = ['user_email', *startup_fields('PayFlow')]
+        rows = [
+            ['founder@example.com', *startup_fields('PayFlow').values()],
+            ['missing@example.com', *startup_fields('LedgerX').values()],
+        ]
+        content = StringIO()
+        csv.writer(content).writerows([columns, *rows])
+        path = self.write('startups.csv', content.getvalue())
+
+        for method in ('copy', 'bulk'):
+            StartupProfile.objects.all().delete()
+            out, err = self.run_import(path, '--model', 'startups.startupprofile', '--method', method)
+
+            self.assertIn('startups.startupprofile: inserted 1, rejected 1', out)
+            self.assertIn('user: missing@example.com does not match any User.', err)
+            self.assertEqual(StartupProfile.objects.get().user, user)
+
+    def test_requires_model_for_plain_records(self):
+        path = self.write('startups.ndjson', json.dumps(startup_fields('PayFlow')) + '\n')
+
+        with self.assertRaisesMessage(CommandError, 'Record 1 is not a fixture entry; pass --model.'):
+            self.run_import(path)
@@ -0,0 +1,19 @@
+def split_comma_list(value, max_length=None):
+    """
+    Split a comma-separated text field into stripped, non-empty items.
+    Duplicates (case-insensitive) are dropped, keeping the first spelling and the original order.
+    Items longer than max_length are cut to it, so they fit a bounded name column.
+    """
+    items = []
+    seen = set()
+    for item in (value or '').split(','):
+        item = item.strip()[:max_length].strip()
+        if item and item.lower() not in seen:
+            seen.add(item.lower())
+            items.append(item)
+    return items
+
+
+def saves_any(update_fields, fields):
+    """Whether a save() with these `update_fields` (None: every field) writes any of `fields`."""
+    return update_fields is None or not set(fields).isdisjoint(update_fields)
@@ -0,0 +1,30 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.startups.managers import saved_startups_bulk_changed
+from apps.startups.models import SavedStartup
+from apps.user_messages.managers import notifications_bulk_changed
+from apps.user_messages.models import Notification
+from .summary import invalidate_dashboards
+
+
+@receiver(post_save, sender=SavedStartup)
+@receiver(post_delete, sender=SavedStartup)
+def saved_startup_changed(sender, instance, **kwargs):
+    invalidate_dashboards([instance.investor_id])
+
+
+@receiver(saved_startups_bulk_changed)
+def saved_startups_bulk_changed_receiver(sender, investor_ids, **kwargs):
+    invalidate_dashboards(investor_ids)
+
+
+@receiver(post_save, sender=Notification)
+@receiver(post_delete, sender=Notification)
+def notification_changed(sender, instance, **kwargs):
+    invalidate_dashboards([instance.user_id])
+
+
+@receiver(notifications_bulk_changed)
+def notifications_bulk_changed_receiver(sender, investor_ids, **kwargs):
+    invalidate_dashboards(investor_ids)
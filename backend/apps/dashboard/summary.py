@@ -0,0 +1,169 @@
+"""
+Investor dashboard payload.
+
+Every widget is gathered with a fixed number of queries regardless of the
+portfolio size: one SELECT of scalar subqueries for the counters and totals
+of each part (the unread count is the stored InvestorProfile counter), plus
+one bounded query per "latest items" list.
+
+Both parts are cached per investor and dropped by apps.dashboard.signals when
+the investor's own saved startups or notifications change. The followed
+projects part also depends on rows the investor does not own (projects,
+pledges, startup names), so it is served from a short TTL instead: a write
+to a popular project never has to reach every follower's cache.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import DecimalField, F, Func, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.common.cache import get_or_set_coalesced
+from apps.investors.models import InvestorProfile
+from apps.projects.models import Project
+from apps.startups.models import SavedStartup
+from apps.user_messages.models import Notification
+
+LATEST_ITEMS = 5
+DASHBOARD_CACHE_PREFIX = 'dashboard:investor'
+
+
+def dashboard_cache_key(investor_id):
+    return f'{DASHBOARD_CACHE_PREFIX}:{investor_id}'
+
+
+def followed_projects_cache_key(investor_id):
+    return f'{DASHBOARD_CACHE_PREFIX}:{investor_id}:projects'
+
+
+def invalidate_dashboards(investor_ids):
+    """Drop the cached dashboards of the given investors once the transaction commits."""
+    keys = [
+        key
+        for investor_id in set(investor_ids)
+        for key in (dashboard_cache_key(investor_id), followed_projects_cache_key(investor_id))
+    ]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def followed_projects(investor):
+    """
+    Public, non-draft projects of the startups an investor saved. A join rather
+    than an IN subquery, so an OuterRef investor resolves against the dashboard
+    query; (investor, startup) is unique, so no project appears twice.
+    """
+    return Project.objects.listed().filter(startup__savedstartup__investor=investor)
+
+
+def aggregate_subquery(queryset, function, field, output_field):
+    """
+    Scalar subquery aggregating the whole queryset, e.g. SELECT COUNT(id) FROM ...
+    A plain Func (not an Aggregate) keeps Django from adding a GROUP BY.
+    """
+    total = Func(F(field), function=function, output_field=output_field)
+    return Coalesce(Subquery(queryset.order_by().annotate(total=total).values('total')), 0, output_field=output_field)
+
+
+def build_dashboard(investor):
+    """Saved startups and notifications widgets."""
+    saved = SavedStartup.objects.filter(investor=OuterRef('pk'))
+    counters = InvestorProfile.objects.filter(pk=investor.pk).annotate(
+        saved_count=aggregate_subquery(saved, 'COUNT', 'id', IntegerField()),
+    ).values('saved_count', 'unread_notifications_count').get()
+
+    latest_saved = (
+        SavedStartup.objects
+        .filter(investor=investor)
+        .order_by('-created_at', '-id')
+        .values('startup_id', 'startup__company_name', 'startup__city', 'created_at')[:LATEST_ITEMS]
+    )
+    latest_notifications = (
+        Notification.objects
+        .filter(user=investor, is_read=False)
+        .order_by('-created_at', '-id')
+        .values('id', 'notification_type', 'title', 'link_url', 'created_at')[:LATEST_ITEMS]
+    )
+
+    return {
+        'saved_startups': {
+            'count': counters['saved_count'],
+            'latest': [
+                {
+                    'startup_id': row['startup_id'],
+                    'company_name': row['startup__company_name'],
+                    'city': row['startup__city'],
+                    'saved_at': row['created_at'],
+                }
+                for row in latest_saved
+            ],
+        },
+        'notifications': {
+            'unread_count': counters['unread_notifications_count'],
+            'latest_unread': list(latest_notifications),
+        },
+    }
+
+
+def build_followed_projects(investor):
+    """Funding widget over the listed projects of the startups an investor saved."""
+    count = IntegerField()
+    amount = DecimalField(max_digits=14, decimal_places=2)
+    projects = followed_projects(OuterRef('pk'))
+
+    counters = InvestorProfile.objects.filter(pk=investor.pk).annotate(
+        projects_count=aggregate_subquery(projects, 'COUNT', 'id', count),
+        target_total=aggregate_subquery(projects, 'SUM', 'target_amount', amount),
+        raised_total=aggregate_subquery(projects, 'SUM', 'raised_amount', amount),
+    ).values('projects_count', 'target_total', 'raised_total').get()
+
+    latest_projects = (
+        followed_projects(investor)
+        .order_by('-updated_at', '-id')
+        .values('id', 'title', 'slug', 'startup_id', 'startup__company_name',
+                'target_amount', 'raised_amount', 'currency')[:LATEST_ITEMS]
+    )
+
+    return {
+        'count': counters['projects_count'],
+        'target_total': counters['target_total'],
+        'raised_total': counters['raised_total'],
+        'progress': funding_progress(counters['raised_total'], counters['target_total']),
+        'latest': [
+            {
+                'id': row['id'],
+                'title': row['title'],
+                'slug': row['slug'],
+                'startup_id': row['startup_id'],
+                'company_name': row['startup__company_name'],
+                'target_amount': row['target_amount'],
+                'raised_amount': row['raised_amount'],
+                'currency': row['currency'],
+                'progress': funding_progress(row['raised_amount'], row['target_amount']),
+            }
+            for row in latest_projects
+        ],
+    }
+
+
+def funding_progress(raised, target):
+    """Raised share of the target in percent, one decimal place."""
+    if not target:
+        return 0.0
+    return round(float(raised) / float(target) * 100, 1)
+
+
+def get_dashboard(investor):
+    dashboard = get_or_set_coalesced(
+        dashboard_cache_key(investor.pk),
+        lambda: build_dashboard(investor),
+        timeout=settings.DASHBOARD_CACHE_TIMEOUT,
+    )
+    return {
+        **dashboard,
+        'followed_projects': get_or_set_coalesced(
+            followed_projects_cache_key(investor.pk),
+            lambda: build_followed_projects(investor),
+            timeout=settings.DASHBOARD_PROJECTS_CACHE_TIMEOUT,
+        ),
+    }
@@ -1,3 +1,159 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from apps.investors.models import InvestorProfile
+from apps.projects.models import Pledge, Project
+from apps.startups.models import SavedStartup, StartupProfile
+from apps.user_messages.fanout import PROJECT_STATUS, fan_out_project_update
+from apps.user_messages.models import Notification
+from .summary import dashboard_cache_key, followed_projects_cache_key
+
+User = get_user_model()
+
+
+class InvestorDashboardAPITest(APITestCase):
+    """Tests for GET /api/dashboard/investor/"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="dashboard@example.com",
+            password="password123",
+            first_name="Dash",
+            last_name="Board"
+        )
+        self.investor = InvestorProfile.objects.create(
+            user=self.user,
+            company_name="Dash Fund",
+            full_name="Dash",
+            description="Fund.",
+            investment_range_min=1000,
+            investment_range_max=2000,
+            preferred_industries="AI",
+            website="https://fund.com",
+            email="dashfund@example.com",
+            phone="+380501234567",
+            country="Ukraine",
+            city="Kyiv",
+            address="Street 1",
+            postal_code="01001",
+            partners_brands="",
+        )
+        self.client.force_authenticate(self.user)
+        self.url = reverse('investor-dashboard')
+
+    def create_portfolio(self, size, start=0):
+        for i in range(start, start + size):
+            startup = StartupProfile.objects.create(
+                user=self.user,
+                company_name=f"Portfolio {i}",
+                description="Startup.",
+                founded_year=2021,
+                team_size=3,
+                website="https://startup.com",
+                email=f"portfolio{i}@example.com",
+                phone="+380501112233",
+                city="Lviv",
+                partners_brands="",
+                audit_status="approved",
+            )
+            SavedStartup.objects.create(investor=self.investor, startup=startup, notes="")
+            Project.objects.create(
+                startup=startup,
+                title=f"Round {i}",
+                slug=f"round-{i}",
+                short_description="Round.",
+                description="Round.",
+                status="in_progress",
+                target_amount=1000,
+                raised_amount=250,
+            )
+            Notification.objects.create(
+                user=self.investor,
+                notification_type="update",
+                title=f"Update {i}",
+                message="News.",
+                link_url="https://example.com/news",
+            )
+
+    def test_widgets(self):
+        self.create_portfolio(2)
+        Project.objects.filter(slug="round-1").update(status="draft")
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['saved_startups']['count'], 2)
+        self.assertEqual(response.data['saved_startups']['latest'][0]['company_name'], "Portfolio 1")
+        self.assertEqual(response.data['notifications']['unread_count'], 2)
+        projects = response.data['followed_projects']
+        self.assertEqual(projects['count'], 1)
+        self.assertEqual(projects['progress'], 25.0)
+        self.assertEqual([row['slug'] for row in projects['latest']], ["round-0"])
+
+    def test_query_count_does_not_grow_with_portfolio(self):
+        self.create_portfolio(1)
+        with self.assertNumQueries(6):
+            self.client.get(self.url)
+
+        cache.clear()
+        self.create_portfolio(10, start=1)
+
+        with self.assertNumQueries(6):
+            response = self.client.get(self.url)
+        self.assertEqual(response.data['saved_startups']['count'], 11)
+
+    def test_cached_until_relevant_change(self):
+        self.create_portfolio(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.get(self.url)
+
+        # Investor lookup only.
+        with self.assertNumQueries(1):
+            self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Notification.objects.filter(user=self.investor).get().delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['notifications']['unread_count'], 0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SavedStartup.objects.filter(investor=self.investor).bulk_delete()
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['saved_startups']['count'], 0)
+
+    def test_project_writes_do_not_touch_followers_caches(self):
+        self.create_portfolio(1)
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project = Project.objects.get()
+            project.title = "Renamed round"
+            project.save()
+            Pledge.objects.bulk_create([Pledge(project=project, amount=250) for _ in range(3)])
+
+        self.assertIsNotNone(cache.get(dashboard_cache_key(self.investor.pk)))
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['followed_projects']['progress'], 25.0)
+
+        # The funding widget refreshes once its short TTL runs out.
+        cache.delete(followed_projects_cache_key(self.investor.pk))
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['followed_projects']['progress'], 100.0)
+
+    def test_notification_fan_out_invalidates_recipients(self):
+        self.create_portfolio(1)
+        self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            fan_out_project_update(Project.objects.get().pk, PROJECT_STATUS)
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.data['notifications']['unread_count'], 2)
+
+    def test_requires_investor(self):
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import InvestorDashboardView
+
+urlpatterns = [
+    path('investor/', InvestorDashboardView.as_view(), name='investor-dashboard'),
+]
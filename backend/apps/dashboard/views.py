@@ -1,3 +1,17 @@
-from django.shortcuts import render
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
-# Create your views here.
+from apps.investors.permissions import IsInvestor, get_investor_profile
+from .summary import get_dashboard
+
+
+class InvestorDashboardView(APIView):
+    """
+    All widgets of the investor dashboard in one response.
+    GET /api/dashboard/investor/
+    """
+    permission_classes = [IsAuthenticated, IsInvestor]
+
+    def get(self, request):
+        return Response(get_dashboard(get_investor_profile(request)))
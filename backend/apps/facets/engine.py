@@ -0,0 +1,152 @@
+"""
+Facet counts for browse pages.
+
+A profile contributes one to each of its facets, e.g. a startup in Lviv to
+('city', 'Lviv') and ('region', '10'). Changes are applied as deltas
+({(dimension, value): +-n}) with two statements, so concurrent writers never
+lose increments; rebuild_facet_counts() recomputes everything from scratch.
+"""
+from collections import Counter
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest
+
+from apps.investors.models import REGION_CENTRES, REGION_CHOICES, Industry, InvestorProfile
+from apps.startups.models import StartupProfile, Tag
+from .models import FacetCount
+
+STARTUP = 'startup'
+INVESTOR = 'investor'
+REGION = 'region'
+CITY = 'city'
+INDUSTRY = 'industry'
+# Startups have no industry field; their tags come from partners_brands (Tag.startups_count).
+PARTNER_BRAND = 'partner_brand'
+
+FACETS_CACHE_KEY = 'facets:summary'
+SUMMARY_KEYS = {
+    STARTUP: 'startups',
+    INVESTOR: 'investors',
+    REGION: 'regions',
+    CITY: 'cities',
+    INDUSTRY: 'industries',
+    PARTNER_BRAND: 'partner_brands',
+}
+
+REGION_NAMES = dict(REGION_CHOICES)
+# Startups only have a city; a regional centre counts towards its region.
+REGION_BY_CENTRE = {city.lower(): region for region, city in REGION_CENTRES.items()}
+
+
+def normalize_city(city):
+    return ' '.join((city or '').split()).title()
+
+
+def startup_facets(city):
+    facets = set()
+    city = normalize_city(city)
+    if city:
+        facets.add((CITY, city))
+        region = REGION_BY_CENTRE.get(city.lower())
+        if region is not None:
+            facets.add((REGION, str(region)))
+    return facets
+
+
+def investor_facets(region, city, preferred_industries):
+    facets = {(INDUSTRY, name.lower()) for name in Industry.objects.split_names(preferred_industries)}
+    if region is not None:
+        facets.add((REGION, str(region)))
+    city = normalize_city(city)
+    if city:
+        facets.add((CITY, city))
+    return facets
+
+
+def facet_deltas(before, after):
+    deltas = Counter({facet: 1 for facet in after - before})
+    deltas.update({facet: -1 for facet in before - after})
+    return deltas
+
+
+def invalidate_facet_summary():
+    transaction.on_commit(lambda: cache.delete(FACETS_CACHE_KEY))
+
+
+def apply_facet_deltas(entity, deltas):
+    """Add {(dimension, value): delta} to the stored counts of an entity."""
+    deltas = {facet: delta for facet, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    with transaction.atomic():
+        FacetCount.objects.bulk_create(
+            [FacetCount(entity=entity, dimension=dimension, value=value) for dimension, value in deltas],
+            ignore_conflicts=True,
+        )
+        keys = Q()
+        for dimension, value in deltas:
+            keys |= Q(dimension=dimension, value=value)
+        FacetCount.objects.filter(keys, entity=entity).update(
+            count=Greatest(
+                F('count') + Case(
+                    *[When(dimension=dimension, value=value, then=Value(delta))
+                      for (dimension, value), delta in deltas.items()],
+                    default=Value(0),
+                    output_field=IntegerField(),
+                ),
+                Value(0),
+            )
+        )
+    invalidate_facet_summary()
+
+
+def rebuild_facet_counts(chunk_size=2000):
+    """Recompute all facet counts from the startup and investor profiles."""
+    counts = {STARTUP: Counter(), INVESTOR: Counter()}
+    for city in StartupProfile.objects.values_list('city', flat=True).iterator(chunk_size=chunk_size):
+        counts[STARTUP].update(startup_facets(city))
+    investors = InvestorProfile.objects.values_list('region', 'city', 'preferred_industries')
+    for row in investors.iterator(chunk_size=chunk_size):
+        counts[INVESTOR].update(investor_facets(*row))
+
+    with transaction.atomic():
+        FacetCount.objects.all().delete()
+        FacetCount.objects.bulk_create(
+            [
+                FacetCount(entity=entity, dimension=dimension, value=value, count=count)
+                for entity, entity_counts in counts.items()
+                for (dimension, value), count in entity_counts.items()
+            ],
+            batch_size=chunk_size,
+        )
+    invalidate_facet_summary()
+    return sum(len(entity_counts) for entity_counts in counts.values())
+
+
+def build_facet_summary():
+    """The browse-page payload: facets with a positive count, most common first."""
+    summary = {STARTUP: {REGION: [], CITY: []}, INVESTOR: {REGION: [], CITY: [], INDUSTRY: []}}
+    rows = FacetCount.objects.filter(count__gt=0).order_by('-count', 'value').values_list(
+        'entity', 'dimension', 'value', 'count'
+    )
+    for entity, dimension, value, count in rows:
+        if dimension == REGION:
+            item = {'value': int(value), 'label': REGION_NAMES.get(int(value), value), 'count': count}
+        else:
+            item = {'value': value, 'label': value, 'count': count}
+        summary[entity][dimension].append(item)
+
+    summary[STARTUP][PARTNER_BRAND] = [
+        {'value': name, 'label': name, 'count': count}
+        for name, count in Tag.objects.filter(startups_count__gt=0)
+        .order_by('-startups_count', 'name')
+        .values_list('name', 'startups_count')
+    ]
+
+    return {
+        SUMMARY_KEYS[entity]: {SUMMARY_KEYS[dimension]: items for dimension, items in facets.items()}
+        for entity, facets in summary.items()
+    }
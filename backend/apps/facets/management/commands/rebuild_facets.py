@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from apps.facets.engine import rebuild_facet_counts
+
+
+class Command(BaseCommand):
+    """Django command to recompute the browse-page facet counts."""
+
+    help = 'Rebuild FacetCount from the startup and investor profiles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        stored = rebuild_facet_counts(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {stored} facet count(s).'))
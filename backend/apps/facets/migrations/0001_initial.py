@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FacetCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(choices=[('startup', 'Startup'), ('investor', 'Investor')], max_length=20)),
+                ('dimension', models.CharField(choices=[('region', 'Region'), ('city', 'City'), ('industry', 'Industry')], max_length=20)),
+                ('value', models.CharField(max_length=200)),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Facet Count',
+                'verbose_name_plural': 'Facet Counts',
+                'constraints': [models.UniqueConstraint(fields=('entity', 'dimension', 'value'), name='facet_count_unique')],
+            },
+        ),
+    ]
@@ -0,0 +1,78 @@
+from collections import Counter
+
+from django.db import migrations
+
+CHUNK_SIZE = 2000
+
+# Frozen copies of apps.investors.models.REGION_CENTRES and the Industry.name
+# length, so later changes to the live code do not alter this migration.
+REGION_CENTRES = {
+    0: 'Cherkasy', 1: 'Chernihiv', 2: 'Chernivtsi', 3: 'Dnipro', 4: 'Donetsk', 5: 'Ivano-Frankivsk',
+    6: 'Kherson', 7: 'Kharkiv', 8: 'Kyiv', 9: 'Kropyvnytskyi', 10: 'Lviv', 11: 'Mykolaiv', 12: 'Odesa',
+    13: 'Poltava', 14: 'Rivne', 15: 'Sumy', 16: 'Ternopil', 17: 'Vinnytsia', 18: 'Lutsk',
+    19: 'Khmelnytskyi', 20: 'Zhytomyr', 21: 'Uzhhorod', 22: 'Zaporizhzhia', 23: 'Luhansk',
+}
+REGION_BY_CENTRE = {city.lower(): region for region, city in REGION_CENTRES.items()}
+INDUSTRY_NAME_LENGTH = 100
+
+
+def normalize_city(city):
+    return ' '.join((city or '').split()).title()
+
+
+def startup_facets(city):
+    facets = set()
+    city = normalize_city(city)
+    if city:
+        facets.add(('city', city))
+        region = REGION_BY_CENTRE.get(city.lower())
+        if region is not None:
+            facets.add(('region', str(region)))
+    return facets
+
+
+def investor_facets(region, city, preferred_industries):
+    names = (name.strip()[:INDUSTRY_NAME_LENGTH].strip() for name in (preferred_industries or '').split(','))
+    facets = {('industry', name.lower()) for name in names if name}
+    if region is not None:
+        facets.add(('region', str(region)))
+    city = normalize_city(city)
+    if city:
+        facets.add(('city', city))
+    return facets
+
+
+def backfill_facet_counts(apps, schema_editor):
+    StartupProfile = apps.get_model('startups', 'StartupProfile')
+    InvestorProfile = apps.get_model('investors', 'InvestorProfile')
+    FacetCount = apps.get_model('facets', 'FacetCount')
+
+    counts = {'startup': Counter(), 'investor': Counter()}
+    for city in StartupProfile.objects.values_list('city', flat=True).iterator(chunk_size=CHUNK_SIZE):
+        counts['startup'].update(startup_facets(city))
+    investors = InvestorProfile.objects.values_list('region', 'city', 'preferred_industries')
+    for row in investors.iterator(chunk_size=CHUNK_SIZE):
+        counts['investor'].update(investor_facets(*row))
+
+    FacetCount.objects.all().delete()
+    FacetCount.objects.bulk_create(
+        [
+            FacetCount(entity=entity, dimension=dimension, value=value, count=count)
+            for entity, entity_counts in counts.items()
+            for (dimension, value), count in entity_counts.items()
+        ],
+        batch_size=CHUNK_SIZE,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('facets', '0001_initial'),
+        ('investors', '0004_investment_range'),
+        ('startups', '0009_saved_startup_unique'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_facet_counts, migrations.RunPython.noop),
+    ]
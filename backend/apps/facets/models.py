@@ -0,0 +1,34 @@
+from django.db import models
+
+ENTITY_CHOICES = (
+    ('startup', 'Startup'),
+    ('investor', 'Investor'),
+)
+
+DIMENSION_CHOICES = (
+    ('region', 'Region'),
+    ('city', 'City'),
+    ('industry', 'Industry'),
+)
+
+
+class FacetCount(models.Model):
+    """
+    Number of startups / investors per region, city or industry for browse pages,
+    kept up to date by apps.facets.signals and rebuilt by rebuild_facets.
+    Startups have no industry; their partner-brand tags are Tag.startups_count.
+    """
+    entity = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    dimension = models.CharField(max_length=20, choices=DIMENSION_CHOICES)
+    value = models.CharField(max_length=200)
+    count = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return f"{self.entity} {self.dimension}={self.value}: {self.count}"
+
+    class Meta:
+        verbose_name = "Facet Count"
+        verbose_name_plural = "Facet Counts"
+        constraints = [
+            models.UniqueConstraint(fields=['entity', 'dimension', 'value'], name='facet_count_unique'),
+        ]
@@ -0,0 +1,67 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.common.utils import saves_any
+from apps.investors.models import InvestorProfile
+from apps.startups.models import StartupProfile
+from .engine import (
+    INVESTOR,
+    STARTUP,
+    apply_facet_deltas,
+    facet_deltas,
+    investor_facets,
+    invalidate_facet_summary,
+    startup_facets,
+)
+
+STARTUP_FACET_FIELDS = ('city',)
+INVESTOR_FACET_FIELDS = ('region', 'city', 'preferred_industries')
+
+
+def stored_facets(model, pk, fields, facets):
+    """Facets of the row as currently stored, before the save."""
+    if pk is None:
+        return set()
+    row = model.objects.filter(pk=pk).values_list(*fields).first()
+    return facets(*row) if row else set()
+
+
+@receiver(pre_save, sender=StartupProfile)
+def remember_startup_facets(sender, instance, update_fields=None, **kwargs):
+    if saves_any(update_fields, STARTUP_FACET_FIELDS):
+        instance._facets_before = stored_facets(sender, instance.pk, STARTUP_FACET_FIELDS, startup_facets)
+
+
+@receiver(post_save, sender=StartupProfile)
+def update_startup_facets(sender, instance, update_fields=None, **kwargs):
+    before = instance.__dict__.pop('_facets_before', None)
+    if before is not None:
+        apply_facet_deltas(STARTUP, facet_deltas(before, startup_facets(instance.city)))
+    if saves_any(update_fields, ('partners_brands',)):
+        # Startup partner brands are read from Tag.startups_count.
+        invalidate_facet_summary()
+
+
+@receiver(post_delete, sender=StartupProfile)
+def release_startup_facets(sender, instance, **kwargs):
+    apply_facet_deltas(STARTUP, facet_deltas(startup_facets(instance.city), set()))
+
+
+@receiver(pre_save, sender=InvestorProfile)
+def remember_investor_facets(sender, instance, update_fields=None, **kwargs):
+    if saves_any(update_fields, INVESTOR_FACET_FIELDS):
+        instance._facets_before = stored_facets(sender, instance.pk, INVESTOR_FACET_FIELDS, investor_facets)
+
+
+@receiver(post_save, sender=InvestorProfile)
+def update_investor_facets(sender, instance, **kwargs):
+    before = instance.__dict__.pop('_facets_before', None)
+    if before is not None:
+        after = investor_facets(instance.region, instance.city, instance.preferred_industries)
+        apply_facet_deltas(INVESTOR, facet_deltas(before, after))
+
+
+@receiver(post_delete, sender=InvestorProfile)
+def release_investor_facets(sender, instance, **kwargs):
+    before = investor_facets(instance.region, instance.city, instance.preferred_industries)
+    apply_facet_deltas(INVESTOR, facet_deltas(before, set()))
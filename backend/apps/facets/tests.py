@@ -0,0 +1,139 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.investors.models import InvestorProfile
+from apps.startups.models import StartupProfile
+from .models import FacetCount
+
+User = get_user_model()
+
+
+class FacetCountTest(APITestCase):
+    """Tests for incremental facet counts and the cached summary endpoint"""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email="facets@example.com",
+            password="password123",
+            first_name="Facet",
+            last_name="User"
+        )
+
+    def create_startup(self, name, city, tags=""):
+        return StartupProfile.objects.create(
+            user=self.user,
+            company_name=name,
+            description="Startup.",
+            founded_year=2021,
+            team_size=3,
+            website="https://startup.com",
+            email=f"{name.lower()}@example.com",
+            phone="+380501112233",
+            city=city,
+            partners_brands=tags,
+            audit_status="approved",
+        )
+
+    def create_investor(self, name, region, city, industries):
+        return InvestorProfile.objects.create(
+            user=self.user,
+            company_name=name,
+            full_name=name,
+            description="Fund.",
+            investment_range_min=1000,
+            investment_range_max=2000,
+            preferred_industries=industries,
+            website="https://fund.com",
+            email=f"{name.lower()}@example.com",
+            phone="+380501234567",
+            country="Ukraine",
+            region=region,
+            city=city,
+            address="Street 1",
+            postal_code="01001",
+            partners_brands="",
+        )
+
+    def counts(self, entity):
+        return {
+            (dimension, value): count
+            for dimension, value, count in FacetCount.objects.filter(entity=entity, count__gt=0)
+            .values_list('dimension', 'value', 'count')
+        }
+
+    def test_create_update_delete_startup(self):
+        first = self.create_startup("One", "Lviv")
+        self.create_startup("Two", " lviv ")
+        self.assertEqual(self.counts('startup'), {('city', 'Lviv'): 2, ('region', '10'): 2})
+
+        first.city = "Bucha"
+        first.save()
+        self.assertEqual(self.counts('startup'), {('city', 'Lviv'): 1, ('region', '10'): 1, ('city', 'Bucha'): 1})
+
+        first.delete()
+        self.assertEqual(self.counts('startup'), {('city', 'Lviv'): 1, ('region', '10'): 1})
+
+    def test_region_follows_regional_centre(self):
+        self.create_startup("One", "Dnipro")
+        self.create_startup("Two", "Uzhhorod")
+        self.create_startup("Three", "Volyn")
+
+        self.assertEqual(self.counts('startup'), {
+            ('city', 'Dnipro'): 1, ('region', '3'): 1, ('city', 'Uzhhorod'): 1, ('region', '21'): 1,
+            ('city', 'Volyn'): 1,
+        })
+
+    def test_investor_facets(self):
+        investor = self.create_investor("Fund", 8, "Kyiv", "Fintech, AI")
+        investor.preferred_industries = "fintech, agritech"
+        investor.save()
+
+        self.assertEqual(self.counts('investor'), {
+            ('region', '8'): 1, ('city', 'Kyiv'): 1, ('industry', 'fintech'): 1, ('industry', 'agritech'): 1,
+        })
+
+    def test_unrelated_update_skips_lookup(self):
+        startup = self.create_startup("One", "Lviv")
+
+        # UPDATE only: no pre-save read of the stored facets.
+        with self.assertNumQueries(1):
+            startup.save(update_fields=['website'])
+
+    def test_rebuild_command_repairs_drift(self):
+        self.create_startup("One", "Lviv")
+        FacetCount.objects.all().update(count=9)
+        StartupProfile.objects.update(city="Odesa")
+
+        out = StringIO()
+        call_command('rebuild_facets', stdout=out)
+
+        self.assertEqual(self.counts('startup'), {('city', 'Odesa'): 1, ('region', '12'): 1})
+        self.assertIn('Rebuilt 2 facet count(s).', out.getvalue())
+
+    def test_summary_endpoint_is_cached_and_invalidated(self):
+        self.create_startup("One", "Kyiv", tags="AI")
+        self.create_investor("Fund", 8, "Kyiv", "AI")
+        url = reverse('facets')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['startups']['regions'], [{'value': 8, 'label': 'Kyiv', 'count': 1}])
+        self.assertNotIn('industries', response.data['startups'])
+        self.assertEqual(response.data['startups']['partner_brands'], [{'value': 'AI', 'label': 'AI', 'count': 1}])
+        self.assertEqual(response.data['investors']['industries'], [{'value': 'ai', 'label': 'ai', 'count': 1}])
+
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_startup("Two", "Kyiv")
+        response = self.client.get(url)
+        self.assertEqual(response.data['startups']['cities'], [{'value': 'Kyiv', 'label': 'Kyiv', 'count': 2}])
@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import FacetSummaryView
+
+urlpatterns = [
+    path('', FacetSummaryView.as_view(), name='facets'),
+]
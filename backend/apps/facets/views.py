@@ -0,0 +1,18 @@
+from django.conf import settings
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.common.cache import get_or_set_coalesced
+from .engine import FACETS_CACHE_KEY, build_facet_summary
+
+
+class FacetSummaryView(APIView):
+    """
+    Startup and investor counts per region and city, investor industries and
+    startup partner brands, for browse pages.
+    GET /api/facets/
+    """
+
+    def get(self, request):
+        summary = get_or_set_coalesced(FACETS_CACHE_KEY, build_facet_summary, timeout=settings.FACETS_CACHE_TIMEOUT)
+        return Response(summary)
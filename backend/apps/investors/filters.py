@@ -0,0 +1,61 @@
+from decimal import Decimal, InvalidOperation
+
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Lower
+from psycopg2.extras import NumericRange
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from apps.common.utils import split_comma_list
+from .models import REGION_CHOICES, Industry, InvestorIndustry
+
+
+class InvestorDiscoveryFilterBackend(BaseFilterBackend):
+    """
+    Filters for investor discovery.
+
+    `amount` keeps investors whose investment range covers it, through the GiST
+    index on the generated `investment_range` column; `region` is an exact
+    REGION_CHOICES value; `industry` (repeatable or comma-separated) matches
+    investors preferring any of the industries, through the (industry, investor)
+    index on InvestorIndustry.
+    """
+    regions = dict(REGION_CHOICES)
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+
+        amount = params.get('amount')
+        if amount not in (None, ''):
+            try:
+                amount = Decimal(amount)
+            except InvalidOperation:
+                raise ValidationError({'amount': 'A valid number is required.'})
+            if not amount.is_finite() or amount < 0:
+                raise ValidationError({'amount': 'A valid number is required.'})
+            # A single-point range: `range @> range` is GiST-indexable like `range @> element`.
+            queryset = queryset.filter(investment_range__contains=NumericRange(amount, amount, '[]'))
+
+        region = params.get('region')
+        if region not in (None, ''):
+            try:
+                region = int(region)
+            except ValueError:
+                region = None
+            if region not in self.regions:
+                raise ValidationError({'region': 'A valid region is required.'})
+            queryset = queryset.filter(region=region)
+
+        industry_names = split_comma_list(','.join(params.getlist('industry')))
+        if industry_names:
+            industry_ids = list(
+                Industry.objects
+                .annotate(lower_name=Lower('name'))
+                .filter(lower_name__in=[name.lower() for name in industry_names])
+                .values_list('id', flat=True)
+            )
+            queryset = queryset.filter(
+                Exists(InvestorIndustry.objects.filter(investor=OuterRef('pk'), industry_id__in=industry_ids))
+            )
+
+        return queryset
@@ -0,0 +1,46 @@
+from django.db import models
+from django.db.models import Case, Count, F, OuterRef, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest
+
+
+class InvestorProfileQuerySet(models.QuerySet):
+    """QuerySet helpers for the denormalized unread notifications counter."""
+
+    def adjust_unread_notifications_count(self, deltas):
+        """
+        Apply {investor_id: delta} to the stored counters in a single UPDATE.
+
+        Counters are clamped at zero; drift is repaired by reconcile_unread_notifications.
+        """
+        deltas = {pk: delta for pk, delta in deltas.items() if delta}
+        if not deltas:
+            return 0
+
+        return self.filter(pk__in=deltas).update(
+            unread_notifications_count=Greatest(
+                F('unread_notifications_count') + Case(
+                    *[When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()],
+                    default=Value(0),
+                    output_field=models.IntegerField(),
+                ),
+                Value(0),
+            )
+        )
+
+    def unread_notifications_subquery(self):
+        notification = self.model._meta.get_field('notification').related_model
+        return Coalesce(
+            Subquery(
+                notification.objects
+                .filter(user=OuterRef('pk'), is_read=False)
+                .order_by()
+                .values('user')
+                .annotate(total=Count('id'))
+                .values('total')
+            ),
+            0,
+        )
+
+    def sync_unread_notifications_count(self):
+        """Recount the stored counters of the selected investors from Notification."""
+        return self.update(unread_notifications_count=self.unread_notifications_subquery())
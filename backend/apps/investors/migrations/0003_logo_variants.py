@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:44
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='investorprofile',
+            name='logo_variants',
+            field=models.JSONField(blank=True, default=dict, editable=False),
+        ),
+    ]
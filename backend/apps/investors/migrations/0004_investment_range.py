@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:04
+
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0003_logo_variants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='investorprofile',
+            name='investment_range',
+            field=models.GeneratedField(db_persist=True, expression=models.Func(django.db.models.functions.comparison.Least('investment_range_min', 'investment_range_max'), django.db.models.functions.comparison.Greatest('investment_range_min', 'investment_range_max'), models.Value('[]'), function='NUMRANGE'), output_field=django.contrib.postgres.fields.ranges.DecimalRangeField()),
+        ),
+        migrations.AddIndex(
+            model_name='investorprofile',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['investment_range'], name='investor_range_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='investorprofile',
+            index=models.Index(fields=['region'], name='investor_region_idx'),
+        ),
+    ]
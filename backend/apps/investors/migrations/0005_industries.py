@@ -0,0 +1,54 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:09
+
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0004_investment_range'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Industry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+            ],
+            options={
+                'verbose_name': 'Industry',
+                'verbose_name_plural': 'Industries',
+                'constraints': [models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='industry_name_ci_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='InvestorIndustry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField(default=0)),
+                ('industry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='investor_industries', to='investors.industry')),
+                ('investor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='investor_industries', to='investors.investorprofile')),
+            ],
+            options={
+                'verbose_name': 'Investor Industry',
+                'verbose_name_plural': 'Investor Industries',
+                'ordering': ['position', 'id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='investorprofile',
+            name='industries',
+            field=models.ManyToManyField(blank=True, related_name='investors', through='investors.InvestorIndustry', to='investors.industry'),
+        ),
+        migrations.AddIndex(
+            model_name='investorindustry',
+            index=models.Index(fields=['industry', 'investor'], name='investorindustry_industry_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='investorindustry',
+            constraint=models.UniqueConstraint(fields=('investor', 'industry'), name='investor_industry_unique'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+from django.db import migrations
+
+from apps.common.utils import split_comma_list
+
+BATCH_SIZE = 1000
+
+
+def backfill_industries(apps, schema_editor):
+    InvestorProfile = apps.get_model('investors', 'InvestorProfile')
+    InvestorIndustry = apps.get_model('investors', 'InvestorIndustry')
+    Industry = apps.get_model('investors', 'Industry')
+
+    max_length = Industry._meta.get_field('name').max_length
+    industry_ids = {industry.name.lower(): industry.id for industry in Industry.objects.all()}
+    links = []
+
+    profiles = InvestorProfile.objects.values_list('id', 'preferred_industries').order_by('id')
+    for investor_id, preferred_industries in profiles.iterator(chunk_size=BATCH_SIZE):
+        for position, name in enumerate(split_comma_list(preferred_industries, max_length)):
+            key = name.lower()
+            if key not in industry_ids:
+                industry_ids[key] = Industry.objects.create(name=name).id
+            links.append(InvestorIndustry(investor_id=investor_id, industry_id=industry_ids[key], position=position))
+
+        if len(links) >= BATCH_SIZE:
+            InvestorIndustry.objects.bulk_create(links, ignore_conflicts=True)
+            links = []
+
+    InvestorIndustry.objects.bulk_create(links, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0005_industries'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_industries, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:16
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0007_unread_notifications_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='investorprofile',
+            index=models.Index(fields=['-created_at', '-id'], name='investor_created_idx'),
+        ),
+    ]
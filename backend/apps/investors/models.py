@@ -1,7 +1,13 @@
 from django.db import models
+from django.db.models import Func, Value
+from django.db.models.functions import Greatest, Least, Lower
+from django.contrib.postgres.fields import DecimalRangeField
+from django.contrib.postgres.indexes import GistIndex
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
 from phonenumber_field.modelfields import PhoneNumberField
+from apps.common.managers import CaseInsensitiveNameQuerySet, sync_name_links
+from .managers import InvestorProfileQuerySet
 
 User = get_user_model()
 
@@ -32,6 +38,51 @@ REGION_CHOICES = (
     (23, 'Luhansk'),
 )
 
+# Administrative centre of each region. Several are not named after their region
+# (Dnipro, Kropyvnytskyi, Lutsk, Uzhhorod), so cities are matched against this table.
+REGION_CENTRES = {
+    0: 'Cherkasy',
+    1: 'Chernihiv',
+    2: 'Chernivtsi',
+    3: 'Dnipro',
+    4: 'Donetsk',
+    5: 'Ivano-Frankivsk',
+    6: 'Kherson',
+    7: 'Kharkiv',
+    8: 'Kyiv',
+    9: 'Kropyvnytskyi',
+    10: 'Lviv',
+    11: 'Mykolaiv',
+    12: 'Odesa',
+    13: 'Poltava',
+    14: 'Rivne',
+    15: 'Sumy',
+    16: 'Ternopil',
+    17: 'Vinnytsia',
+    18: 'Lutsk',
+    19: 'Khmelnytskyi',
+    20: 'Zhytomyr',
+    21: 'Uzhhorod',
+    22: 'Zaporizhzhia',
+    23: 'Luhansk',
+}
+
+
+class Industry(models.Model):
+    name = models.CharField(max_length=100)
+
+    objects = CaseInsensitiveNameQuerySet.as_manager()
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        verbose_name = "Industry"
+        verbose_name_plural = "Industries"
+        constraints = [
+            models.UniqueConstraint(Lower('name'), name='industry_name_ci_unique'),
+        ]
+
 
 class InvestorProfile(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -40,7 +91,20 @@ class InvestorProfile(models.Model):
     description = models.TextField()
     investment_range_min = models.DecimalField(max_digits=12, decimal_places=2)
     investment_range_max = models.DecimalField(max_digits=12, decimal_places=2)
-    preferred_industries = models.CharField(max_length=200) # In the future, consider using other table for statuses
+    # numrange[min, max] kept by the database, so "who funds an amount" is a GiST range lookup.
+    investment_range = models.GeneratedField(
+        expression=Func(
+            Least('investment_range_min', 'investment_range_max'),
+            Greatest('investment_range_min', 'investment_range_max'),
+            Value('[]'),
+            function='NUMRANGE',
+        ),
+        output_field=DecimalRangeField(),
+        db_persist=True,
+    )
+    # Comma-separated source text, normalized into `industries` by sync_industries().
+    preferred_industries = models.CharField(max_length=200)
+    industries = models.ManyToManyField(Industry, through='InvestorIndustry', related_name='investors', blank=True)
     website = models.URLField(max_length=200)
     email = models.EmailField(max_length=100, unique=True)
     phone = PhoneNumberField(region='UA')
@@ -53,11 +117,17 @@ class InvestorProfile(models.Model):
     address = models.CharField(max_length=200)
     postal_code = models.CharField(max_length=20)
     logo = models.ImageField(upload_to='media/Investor_logos/')
+    # WebP variants of `logo`, generated in the background: {'source': logo name, 'webp': {width: name}}
+    logo_variants = models.JSONField(default=dict, blank=True, editable=False)
     partners_brands = models.TextField()
     audit_status = models.CharField(max_length=50, default="Pending")
+    # Denormalized count of unread Notification rows, kept in step by signals and NotificationQuerySet.
+    unread_notifications_count = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = InvestorProfileQuerySet.as_manager()
+
     def clean(self):
         if self.investment_range_max < self.investment_range_min:
             raise ValidationError("Maximum investment must be greater than minimum investment.")
@@ -66,6 +136,36 @@ class InvestorProfile(models.Model):
     def __str__(self):
         return self.company_name
 
+    def sync_industries(self):
+        """Mirror the comma-separated preferred_industries into the normalized industry relation."""
+        sync_name_links(self.investor_industries, self.preferred_industries, 'industry')
+
     class Meta:
         verbose_name = "Investor Profile"
         verbose_name_plural = "Investor Profiles"
+        indexes = [
+            # Range containment; combined with the region index through a bitmap AND.
+            GistIndex(fields=['investment_range'], name='investor_range_idx'),
+            models.Index(fields=['region'], name='investor_region_idx'),
+            # Keyset pagination of the discovery list (InvestorDiscoveryViewSet.keyset_ordering).
+            models.Index(fields=['-created_at', '-id'], name='investor_created_idx'),
+        ]
+
+
+class InvestorIndustry(models.Model):
+    investor = models.ForeignKey(InvestorProfile, on_delete=models.CASCADE, related_name='investor_industries')
+    industry = models.ForeignKey(Industry, on_delete=models.CASCADE, related_name='investor_industries')
+    # Order of the industry in preferred_industries.
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Investor Industry"
+        verbose_name_plural = "Investor Industries"
+        ordering = ['position', 'id']
+        constraints = [
+            models.UniqueConstraint(fields=['investor', 'industry'], name='investor_industry_unique'),
+        ]
+        indexes = [
+            # "Investors interested in any of these industries" without touching InvestorProfile.
+            models.Index(fields=['industry', 'investor'], name='investorindustry_industry_idx'),
+        ]
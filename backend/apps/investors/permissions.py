@@ -0,0 +1,22 @@
+from rest_framework.permissions import BasePermission
+
+from .models import InvestorProfile
+
+
+def get_investor_profile(request):
+    """The authenticated user's investor profile (or None), looked up once per request."""
+    if not hasattr(request, '_investor_profile'):
+        user = request.user
+        request._investor_profile = (
+            InvestorProfile.objects.filter(user=user).order_by('id').first()
+            if user and user.is_authenticated else None
+        )
+    return request._investor_profile
+
+
+class IsInvestor(BasePermission):
+    """Allows access only to users with an investor profile."""
+    message = 'An investor profile is required.'
+
+    def has_permission(self, request, view):
+        return get_investor_profile(request) is not None
@@ -0,0 +1,40 @@
+from rest_framework import serializers
+from apps.common.images import logo_srcset
+from .models import InvestorProfile
+
+
+class InvestorDiscoverySerializer(serializers.ModelSerializer):
+    region_name = serializers.CharField(source='get_region_display', read_only=True)
+    logo_url = serializers.SerializerMethodField()
+    logo_srcset = serializers.SerializerMethodField()
+
+    class Meta:
+        model = InvestorProfile
+        fields = [
+            'id',
+            'company_name',
+            'description',
+            'investment_range_min',
+            'investment_range_max',
+            'preferred_industries',
+            'region',
+            'region_name',
+            'city',
+            'website',
+            'logo_url',
+            'logo_srcset',
+            'created_at',
+        ]
+
+    def get_logo_url(self, obj):
+        request = self.context.get('request')
+        if obj.logo and hasattr(obj.logo, 'url'):
+            return request.build_absolute_uri(obj.logo.url) if request else obj.logo.url
+        return None
+
+    def get_logo_srcset(self, obj):
+        request = self.context.get('request')
+        srcset = logo_srcset(obj)
+        if request:
+            return {width: request.build_absolute_uri(url) for width, url in srcset.items()}
+        return srcset
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from apps.common.images import generate_logo_variants, logo_variants_outdated
+from apps.common.tasks import run_in_background
+from .models import InvestorProfile
+
+
+@receiver(post_save, sender=InvestorProfile)
+def schedule_logo_variants(sender, instance, **kwargs):
+    if logo_variants_outdated(instance):
+        run_in_background(generate_logo_variants, InvestorProfile, instance.pk, 'media/Investor_logos/variants')
+
+
+@receiver(post_save, sender=InvestorProfile)
+def sync_investor_industries(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or 'preferred_industries' in update_fields:
+        instance.sync_industries()
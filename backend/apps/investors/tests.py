@@ -1,6 +1,13 @@
+from decimal import Decimal
+
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.test import TestCase
-from apps.investors.models import InvestorProfile
+from django.urls import reverse
+from psycopg2.extras import NumericRange
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.investors.models import Industry, InvestorProfile
 from apps.users.models import User
 
 
@@ -114,3 +121,157 @@ class InvestorProfileModelTest(TestCase):
         investor = InvestorProfile.objects.create(**self.valid_data)
         self.assertEqual(investor.user.email, "investor@example.com")
         self.assertEqual(investor.user.first_name, "Investor")
+
+
+class InvestorDiscoveryAPITest(APITestCase):
+    """Tests for GET /api/investors/investors/"""
+
+    def setUp(self):
+        user = User.objects.create_user(
+            email="discovery@example.com",
+            password="password123",
+            first_name="Disco",
+            last_name="Very"
+        )
+
+        def create(name, range_min, range_max, region, industries):
+            return InvestorProfile.objects.create(
+                user=user,
+                company_name=name,
+                full_name=name,
+                description="Fund.",
+                investment_range_min=range_min,
+                investment_range_max=range_max,
+                preferred_industries=industries,
+                website="https://fund.com",
+                email=f"{name.lower()}@example.com",
+                phone="+380501234567",
+                country="Ukraine",
+                region=region,
+                city="City",
+                address="Street 1",
+                postal_code="01001",
+                partners_brands="",
+            )
+
+        self.kyiv_big = create("KyivBig", 1000000, 5000000, 8, "Fintech, AI")
+        self.kyiv_small = create("KyivSmall", 10000, 100000, 8, "Agritech")
+        self.lviv_big = create("LvivBig", 1000000, 5000000, 10, "fintech")
+        self.url = reverse('investor-list')
+
+    def names(self, params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {item['company_name'] for item in response.data['results']}
+
+    def test_generated_range_column(self):
+        self.kyiv_big.refresh_from_db()
+        self.assertEqual(self.kyiv_big.investment_range.lower, Decimal('1000000'))
+        self.assertEqual(self.kyiv_big.investment_range.upper, Decimal('5000000'))
+
+    def test_logo_srcset(self):
+        InvestorProfile.objects.filter(pk=self.kyiv_big.pk).update(
+            logo='media/Investor_logos/fund.png',
+            logo_variants={'source': 'media/Investor_logos/fund.png',
+                           'webp': {'64': 'media/Investor_logos/variants/fund_64w.webp'}},
+        )
+
+        response = self.client.get(self.url)
+
+        srcsets = {item['company_name']: item['logo_srcset'] for item in response.data['results']}
+        self.assertEqual(srcsets['KyivBig'], {'64': 'http://testserver/media/media/Investor_logos/variants/fund_64w.webp'})
+        self.assertEqual(srcsets['KyivSmall'], {})
+
+    def test_amount_and_region(self):
+        self.assertEqual(self.names({'amount': '2000000', 'region': 8}), {"KyivBig"})
+        # Bounds are inclusive.
+        self.assertEqual(self.names({'amount': '100000'}), {"KyivSmall"})
+
+    def test_industry_matches_any_listed(self):
+        self.assertEqual(self.names({'industry': 'FINTECH'}), {"KyivBig", "LvivBig"})
+        self.assertEqual(self.names({'industry': ['agritech', 'ai']}), {"KyivBig", "KyivSmall"})
+        # Whole entries only, not substrings.
+        self.assertEqual(self.names({'industry': 'tech'}), set())
+
+    def test_invalid_filters(self):
+        for params in ({'amount': 'lots'}, {'amount': '-1'}, {'region': 99}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(self.url, params).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_range_lookup_can_use_gist_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+            plan = InvestorProfile.objects.filter(
+                investment_range__contains=NumericRange(Decimal('2000000'), Decimal('2000000'), '[]')
+            ).explain()
+
+        self.assertIn('investor_range_idx', plan)
+
+
+class InvestorIndustryTest(TestCase):
+    """Tests for the normalized investor industries"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="industries@example.com",
+            password="password123",
+            first_name="Industry",
+            last_name="User"
+        )
+
+    def create_investor(self, name, industries):
+        return InvestorProfile.objects.create(
+            user=self.user,
+            company_name=name,
+            full_name=name,
+            description="Fund.",
+            investment_range_min=1000,
+            investment_range_max=2000,
+            preferred_industries=industries,
+            website="https://fund.com",
+            email=f"{name.lower()}@example.com",
+            phone="+380501234567",
+            country="Ukraine",
+            city="Kyiv",
+            address="Street 1",
+            postal_code="01001",
+            partners_brands="",
+        )
+
+    def industry_names(self, investor):
+        return [link.industry.name for link in investor.investor_industries.select_related('industry')]
+
+    def test_preferred_industries_are_synced(self):
+        investor = self.create_investor("Fund", "Fintech, AI, fintech")
+        self.assertEqual(self.industry_names(investor), ["Fintech", "AI"])
+
+        investor.preferred_industries = "ai, Agritech"
+        investor.save()
+
+        self.assertEqual(self.industry_names(investor), ["AI", "Agritech"])
+        # Industries are shared case-insensitively.
+        self.assertEqual(Industry.objects.count(), 3)
+
+    def test_overlong_industry_is_cut_to_name_length(self):
+        industry = "i" * 150
+        investor = self.create_investor("Fund", f"AI, {industry}")
+
+        self.assertEqual(self.industry_names(investor), ["AI", industry[:100]])
+
+    def test_overlap_query(self):
+        fin = self.create_investor("Fin", "Fintech")
+        agro = self.create_investor("Agro", "agritech, AI")
+        self.create_investor("Health", "Healthtech")
+
+        with self.assertNumQueries(1):
+            matched = set(
+                InvestorProfile.objects.filter(industries__name__in=["Fintech", "agritech"]).values_list('id', flat=True)
+            )
+
+        self.assertEqual(matched, {fin.id, agro.id})
+
+    def test_unrelated_update_does_not_resync(self):
+        investor = self.create_investor("Fund", "Fintech")
+
+        with self.assertNumQueries(1):
+            investor.save(update_fields=['description'])
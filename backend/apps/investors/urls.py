@@ -0,0 +1,7 @@
+from rest_framework.routers import DefaultRouter
+from .views import InvestorDiscoveryViewSet
+
+router = DefaultRouter()
+router.register(r'investors', InvestorDiscoveryViewSet, basename='investor')
+
+urlpatterns = router.urls
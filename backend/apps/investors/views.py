@@ -1,3 +1,21 @@
-from django.shortcuts import render
+from rest_framework import mixins, viewsets
 
-# Create your views here.
+from apps.common.pagination import KeysetPagination
+from .filters import InvestorDiscoveryFilterBackend
+from .models import InvestorProfile
+from .serializers import InvestorDiscoverySerializer
+
+
+class InvestorDiscoveryViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    Find investors for a round.
+    GET /api/investors/investors/?amount=2000000&region=8&industry=fintech
+    """
+    queryset = InvestorProfile.objects.only(
+        'id', 'company_name', 'description', 'investment_range_min', 'investment_range_max',
+        'preferred_industries', 'region', 'city', 'website', 'logo', 'logo_variants', 'created_at',
+    )
+    serializer_class = InvestorDiscoverySerializer
+    filter_backends = [InvestorDiscoveryFilterBackend]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-created_at', '-id')
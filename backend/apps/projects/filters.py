@@ -0,0 +1,52 @@
+from decimal import Decimal, InvalidOperation
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from .models import STATUS_CHOICES
+
+
+class ProjectBrowseFilterBackend(BaseFilterBackend):
+    """
+    Filters for the project browse API, over listed (public, non-draft) projects.
+
+    `status` and `currency` are exact matches with a composite partial index
+    in the listing order; `min_target` / `max_target` bound target_amount
+    through the partial target_amount index (see Project.Meta.indexes).
+    """
+    statuses = {value for value, _ in STATUS_CHOICES if value != 'draft'}
+
+    def parse_amount(self, params, name):
+        value = params.get(name)
+        if value in (None, ''):
+            return None
+        try:
+            amount = Decimal(value)
+        except InvalidOperation:
+            raise ValidationError({name: 'A valid number is required.'})
+        if not amount.is_finite() or amount < 0:
+            raise ValidationError({name: 'A valid number is required.'})
+        return amount
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        filters = {}
+
+        status = params.get('status')
+        if status:
+            if status not in self.statuses:
+                raise ValidationError({'status': f"Choose one of: {', '.join(sorted(self.statuses))}."})
+            filters['status'] = status
+
+        currency = params.get('currency')
+        if currency:
+            filters['currency'] = currency.upper()
+
+        min_target = self.parse_amount(params, 'min_target')
+        if min_target is not None:
+            filters['target_amount__gte'] = min_target
+        max_target = self.parse_amount(params, 'max_target')
+        if max_target is not None:
+            filters['target_amount__lte'] = max_target
+
+        return queryset.filter(**filters)
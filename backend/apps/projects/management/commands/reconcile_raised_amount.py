@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Max
+
+from apps.projects.models import Project
+
+
+class Command(BaseCommand):
+    """Repair drift between Project.raised_amount and the Pledge ledger."""
+
+    help = 'Refold Project.raised_amount from pledges in id-range batches and fix rows that drifted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = Project.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+        repaired = 0
+
+        for start in range(0, last_id + 1, batch_size):
+            batch = Project.objects.filter(id__gte=start, id__lt=start + batch_size)
+            with transaction.atomic():
+                drifted = list(
+                    batch
+                    .annotate(ledger_total=batch.raised_subquery())
+                    .exclude(raised_amount=F('ledger_total'))
+                    .values_list('id', flat=True)
+                )
+                if drifted:
+                    repaired += Project.objects.filter(id__in=drifted).sync_raised_amount()
+
+        self.stdout.write(self.style.SUCCESS(f'Repaired raised_amount for {repaired} project(s).'))
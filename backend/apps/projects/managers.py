@@ -0,0 +1,81 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import models, transaction
+from django.db.models import Case, F, OuterRef, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Now
+from django.dispatch import Signal
+
+# Sent by PledgeQuerySet.bulk_create, which bypasses per-row signals, with the created `pledges`
+# and the `project_ids` whose raised_amount changed.
+pledges_bulk_created = Signal()
+
+
+class ProjectQuerySet(models.QuerySet):
+    def listed(self):
+        """Public, non-draft projects; the predicate of the partial browse indexes."""
+        from .models import LISTED_CONDITION
+
+        return self.filter(LISTED_CONDITION)
+
+    def adjust_raised_amount(self, deltas):
+        """
+        Add {project_id: amount} to the stored raised_amount in a single UPDATE.
+
+        The increment is computed by the database, so concurrent pledges never
+        overwrite each other; the row lock lasts only until the caller commits.
+        updated_at is bumped too, so the change feed picks the new total up.
+        """
+        deltas = {pk: delta for pk, delta in deltas.items() if delta}
+        if not deltas:
+            return 0
+
+        amount = self.model._meta.get_field('raised_amount')
+        return self.filter(pk__in=deltas).update(
+            raised_amount=F('raised_amount') + Case(
+                *[When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()],
+                default=Value(Decimal(0)),
+                output_field=models.DecimalField(max_digits=amount.max_digits, decimal_places=amount.decimal_places),
+            ),
+            updated_at=Now(),
+        )
+
+    def raised_subquery(self):
+        pledge = self.model._meta.get_field('pledges').related_model
+        return Coalesce(
+            Subquery(
+                pledge.objects
+                .filter(project=OuterRef('pk'))
+                .order_by()
+                .values('project')
+                .annotate(total=Sum('amount'))
+                .values('total')
+            ),
+            Value(Decimal(0)),
+        )
+
+    def sync_raised_amount(self):
+        """Refold the stored raised_amount of the selected projects from the ledger."""
+        return self.update(raised_amount=self.raised_subquery(), updated_at=Now())
+
+
+class PledgeQuerySet(models.QuerySet):
+    """
+    Keeps Project.raised_amount in step on bulk_create, which sends no per-row
+    signals, and sends pledges_bulk_created instead. Opening balances are
+    already part of raised_amount and add nothing.
+    """
+
+    def _projects(self):
+        return self.model._meta.get_field('project').related_model.objects
+
+    def bulk_create(self, objs, *args, **kwargs):
+        with transaction.atomic(using=self.db, savepoint=False):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            deltas = defaultdict(Decimal)
+            for obj in objs:
+                if obj.kind != 'opening_balance':
+                    deltas[obj.project_id] += Decimal(obj.amount)
+            self._projects().adjust_raised_amount(deltas)
+            pledges_bulk_created.send(sender=self.model, pledges=objs, project_ids=set(deltas))
+        return objs
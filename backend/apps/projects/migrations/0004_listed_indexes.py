@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0003_search_vector'),
+        ('startups', '0009_saved_startup_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('visibility', 'public'), models.Q(('status', 'draft'), _negated=True)), fields=['-created_at', '-id'], name='project_listed_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('visibility', 'public'), models.Q(('status', 'draft'), _negated=True)), fields=['status', '-created_at', '-id'], name='project_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('visibility', 'public'), models.Q(('status', 'draft'), _negated=True)), fields=['currency', '-created_at', '-id'], name='project_currency_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('visibility', 'public'), models.Q(('status', 'draft'), _negated=True)), fields=['target_amount'], name='project_listed_target_idx'),
+        ),
+    ]
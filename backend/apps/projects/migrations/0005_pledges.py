@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0006_backfill_industries'),
+        ('projects', '0004_listed_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Pledge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('pledge', 'Pledge'), ('correction', 'Correction'), ('opening_balance', 'Opening balance')], default='pledge', max_length=20)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('investor', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='pledges', to='investors.investorprofile')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='pledges', to='projects.project')),
+            ],
+            options={
+                'verbose_name': 'Pledge',
+                'verbose_name_plural': 'Pledges',
+                'indexes': [models.Index(fields=['project', 'id'], name='pledge_project_idx')],
+                'constraints': [models.CheckConstraint(condition=models.Q(('amount', 0), _negated=True), name='pledge_amount_nonzero')],
+            },
+        ),
+    ]
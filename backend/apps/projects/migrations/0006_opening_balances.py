@@ -0,0 +1,35 @@
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def record_opening_balances(apps, schema_editor):
+    """Open the ledger of every project with its current raised_amount, so the two agree."""
+    Project = apps.get_model('projects', 'Project')
+    Pledge = apps.get_model('projects', 'Pledge')
+
+    pledges = []
+    projects = Project.objects.exclude(raised_amount=0).values_list('id', 'raised_amount').order_by('id')
+    for project_id, raised_amount in projects.iterator(chunk_size=BATCH_SIZE):
+        pledges.append(Pledge(project_id=project_id, kind='opening_balance', amount=raised_amount))
+        if len(pledges) >= BATCH_SIZE:
+            Pledge.objects.bulk_create(pledges)
+            pledges = []
+
+    Pledge.objects.bulk_create(pledges)
+
+
+def remove_opening_balances(apps, schema_editor):
+    Pledge = apps.get_model('projects', 'Pledge')
+    Pledge.objects.filter(kind='opening_balance').delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0005_pledges'),
+    ]
+
+    operations = [
+        migrations.RunPython(record_opening_balances, remove_opening_balances),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0006_opening_balances'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectSlugRedirect',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('old_slug', models.SlugField(unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='slug_redirects', to='projects.project')),
+            ],
+            options={
+                'verbose_name': 'Project Slug Redirect',
+                'verbose_name_plural': 'Project Slug Redirects',
+            },
+        ),
+    ]
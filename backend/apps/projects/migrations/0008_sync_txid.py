@@ -0,0 +1,44 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:04
+
+from django.db import migrations, models
+
+
+SYNC_TXID_TRIGGER_SQL = """
+CREATE FUNCTION projects_project_sync_txid_update() RETURNS trigger AS $$
+BEGIN
+    NEW.sync_txid := txid_current();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER project_sync_txid_trigger
+    BEFORE INSERT OR UPDATE
+    ON projects_project
+    FOR EACH ROW EXECUTE FUNCTION projects_project_sync_txid_update();
+"""
+
+DROP_SYNC_TXID_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS project_sync_txid_trigger ON projects_project;
+DROP FUNCTION IF EXISTS projects_project_sync_txid_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0007_slug_redirects'),
+        ('startups', '0010_sync_txid'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='sync_txid',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['sync_txid', 'id'], name='project_sync_txid_idx'),
+        ),
+        migrations.RunSQL(SYNC_TXID_TRIGGER_SQL, DROP_SYNC_TXID_TRIGGER_SQL),
+    ]
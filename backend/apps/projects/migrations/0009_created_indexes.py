@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0007_unread_notifications_count'),
+        ('projects', '0008_sync_txid'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='pledge',
+            index=models.Index(condition=models.Q(('kind', 'opening_balance'), _negated=True), fields=['created_at'], include=('project', 'amount'), name='pledge_created_idx'),
+        ),
+    ]
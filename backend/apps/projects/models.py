@@ -1,5 +1,12 @@
-from django.db import models
+from django.db import models, transaction
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from apps.investors.models import InvestorProfile
 from apps.startups.models import StartupProfile
+from .managers import PledgeQuerySet, ProjectQuerySet
+
+# Projects shown to everyone: public and past the draft stage.
+LISTED_CONDITION = models.Q(visibility='public') & ~models.Q(status='draft')
 
 STATUS_CHOICES = (
     ('draft', 'Draft'),
@@ -15,16 +22,117 @@ class Project(models.Model):
     description = models.TextField()
     status = models.CharField(max_length=20, choices=STATUS_CHOICES)
     target_amount = models.DecimalField(max_digits=12, decimal_places=2)
+    # Running total of the Pledge ledger; record pledges instead of writing it directly.
     raised_amount = models.DecimalField(max_digits=12, decimal_places=2, default=0)
     currency = models.CharField(max_length=3, default="UAH")
     tags = models.TextField()
     visibility = models.CharField(max_length=20, default="public")
+    # Weighted title (A), tags and short_description (B), description (C), maintained by a database trigger.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Id of the transaction that last wrote the row, stamped by a database trigger for the change feed (apps.sync).
+    sync_txid = models.BigIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProjectQuerySet.as_manager()
+
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        # A full save of a loaded row would write back its in-memory raised_amount
+        # and undo pledges committed since; only an explicit update_fields writes it.
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and not field.generated and field.name != 'raised_amount'
+            ]
+        super().save(*args, **kwargs)
+
     class Meta:
         verbose_name = "Project"
-        verbose_name_plural = "Projects"
\ No newline at end of file
+        verbose_name_plural = "Projects"
+        # Partial indexes over listed projects only, matching the keyset-paginated
+        # browse API ordered by (created_at, id).
+        indexes = [
+            GinIndex(fields=['search_vector'], name='project_search_vector_idx'),
+            models.Index(fields=['-created_at', '-id'], name='project_listed_created_idx',
+                         condition=LISTED_CONDITION),
+            models.Index(fields=['status', '-created_at', '-id'], name='project_status_created_idx',
+                         condition=LISTED_CONDITION),
+            models.Index(fields=['currency', '-created_at', '-id'], name='project_currency_created_idx',
+                         condition=LISTED_CONDITION),
+            models.Index(fields=['target_amount'], name='project_listed_target_idx',
+                         condition=LISTED_CONDITION),
+            # Change feed (apps.sync) over all projects; unlisted ones are reported as removed.
+            models.Index(fields=['sync_txid', 'id'], name='project_sync_txid_idx'),
+        ]
+
+
+class ProjectSlugRedirect(models.Model):
+    """
+    A slug a project used before being renamed. Only consulted when no project
+    currently has the requested slug, through the unique index on old_slug.
+    """
+    old_slug = models.SlugField(unique=True)
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='slug_redirects')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.old_slug} -> {self.project_id}"
+
+    class Meta:
+        verbose_name = "Project Slug Redirect"
+        verbose_name_plural = "Project Slug Redirects"
+
+
+PLEDGE_KIND_CHOICES = (
+    ('pledge', 'Pledge'),
+    ('correction', 'Correction'),
+    ('opening_balance', 'Opening balance'),
+)
+
+
+class Pledge(models.Model):
+    """
+    Append-only funding ledger of a project. Rows are never updated or deleted;
+    a withdrawn or wrong pledge is offset by a 'correction' row with a negative
+    amount. Project.raised_amount is the running sum, kept in step by signals
+    with a single F() update per entry; see reconcile_raised_amount.
+    An 'opening_balance' row records money raised before the ledger existed.
+    """
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='pledges')
+    investor = models.ForeignKey(InvestorProfile, on_delete=models.SET_NULL, null=True, blank=True,
+                                 related_name='pledges')
+    kind = models.CharField(max_length=20, choices=PLEDGE_KIND_CHOICES, default='pledge')
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = PledgeQuerySet.as_manager()
+
+    def __str__(self):
+        return f"{self.amount} to {self.project_id}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Pledges are append-only; record a correction instead.")
+        # The INSERT and the raised_amount increment (post_save) commit together;
+        # the project row is locked only from that UPDATE to the commit.
+        with transaction.atomic(using=kwargs.get('using'), savepoint=False):
+            super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Pledges are append-only; record a correction instead.")
+
+    class Meta:
+        verbose_name = "Pledge"
+        verbose_name_plural = "Pledges"
+        constraints = [
+            models.CheckConstraint(condition=~models.Q(amount=0), name='pledge_amount_nonzero'),
+        ]
+        indexes = [
+            models.Index(fields=['project', 'id'], name='pledge_project_idx'),
+            # Recent pledges per project for the trending ranking (apps.trending).
+            models.Index(fields=['created_at'], include=['project', 'amount'], name='pledge_created_idx',
+                         condition=~models.Q(kind='opening_balance')),
+        ]
@@ -0,0 +1,39 @@
+from rest_framework import serializers
+
+from apps.common.utils import split_comma_list
+from .models import Project
+
+
+class ProjectStartupSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    company_name = serializers.CharField()
+    city = serializers.CharField()
+
+
+class ProjectCardSerializer(serializers.ModelSerializer):
+    startup = ProjectStartupSerializer(read_only=True)
+    tags = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Project
+        fields = [
+            'id',
+            'title',
+            'slug',
+            'short_description',
+            'status',
+            'target_amount',
+            'raised_amount',
+            'currency',
+            'tags',
+            'startup',
+            'created_at',
+        ]
+
+    def get_tags(self, obj):
+        return split_comma_list(obj.tags)
+
+
+class ProjectDetailSerializer(ProjectCardSerializer):
+    class Meta(ProjectCardSerializer.Meta):
+        fields = ProjectCardSerializer.Meta.fields + ['description', 'updated_at']
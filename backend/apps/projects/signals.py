@@ -0,0 +1,36 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Pledge, Project
+from .slugs import invalidate_project_slugs, record_slug_change
+
+
+@receiver(post_save, sender=Pledge)
+def add_pledge_to_raised_amount(sender, instance, created, **kwargs):
+    if created and instance.kind != 'opening_balance':
+        Project.objects.adjust_raised_amount({instance.project_id: instance.amount})
+
+
+@receiver(post_save, sender=Project)
+def open_project_ledger(sender, instance, created, **kwargs):
+    # A project created with money already raised starts its ledger from that balance.
+    if created and instance.raised_amount:
+        Pledge.objects.create(project=instance, kind='opening_balance', amount=instance.raised_amount)
+
+
+@receiver(pre_save, sender=Project)
+def remember_project_slug(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is not None and (update_fields is None or 'slug' in update_fields):
+        instance._slug_before = sender.objects.filter(pk=instance.pk).values_list('slug', flat=True).first()
+
+
+@receiver(post_save, sender=Project)
+def redirect_renamed_slug(sender, instance, **kwargs):
+    before = instance.__dict__.pop('_slug_before', None)
+    if before is not None and before != instance.slug:
+        record_slug_change(instance, before)
+
+
+@receiver(post_delete, sender=Project)
+def forget_project_slug(sender, instance, **kwargs):
+    invalidate_project_slugs([instance.slug])
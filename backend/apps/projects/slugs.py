@@ -0,0 +1,42 @@
+"""
+Slug routing for public project URLs.
+
+Current slugs are mapped to primary keys by a bounded in-process LRU cache, so
+a warm detail request fetches the project by pk without a slug index probe.
+Old slugs of renamed projects resolve through ProjectSlugRedirect.
+"""
+from django.conf import settings
+from django.db import transaction
+
+from apps.common.cache import LRUCache
+from .models import Project, ProjectSlugRedirect
+
+project_slug_cache = LRUCache(settings.PROJECT_SLUG_CACHE_SIZE, settings.PROJECT_SLUG_CACHE_TTL)
+
+
+def lookup_project_pk(slug):
+    """pk of the project currently using slug (cached), or None."""
+    pk = project_slug_cache.get(slug)
+    if pk is None:
+        pk = Project.objects.filter(slug=slug).values_list('pk', flat=True).first()
+        if pk is not None:
+            project_slug_cache.set(slug, pk)
+    return pk
+
+
+def redirected_slug(slug):
+    """Current slug of the project that used to be reachable at slug, or None."""
+    return ProjectSlugRedirect.objects.filter(old_slug=slug).values_list('project__slug', flat=True).first()
+
+
+def record_slug_change(project, old_slug):
+    """Keep old_slug resolving to the project and give its new slug precedence over any redirect."""
+    ProjectSlugRedirect.objects.filter(old_slug=project.slug).delete()
+    ProjectSlugRedirect.objects.update_or_create(old_slug=old_slug, defaults={'project': project})
+    invalidate_project_slugs([old_slug, project.slug])
+
+
+def invalidate_project_slugs(slugs):
+    """Forget cached slugs once the transaction commits (this process only; others expire by TTL)."""
+    slugs = list(slugs)
+    transaction.on_commit(lambda: [project_slug_cache.delete(slug) for slug in slugs])
@@ -1,6 +1,19 @@
+import threading
+import time
+from decimal import Decimal
+from io import StringIO
+
 from django.core.exceptions import ValidationError
-from django.test import TestCase
-from apps.projects.models import Project
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from apps.common.cache import LRUCache
+from apps.common.testing import create_project, create_startup, create_user
+from apps.projects.models import Pledge, Project, ProjectSlugRedirect
+from apps.projects.slugs import project_slug_cache
 from apps.startups.models import StartupProfile
 from apps.users.models import User
 
@@ -103,3 +116,256 @@ class ProjectModelTest(TestCase):
         data["tags"] = long_tags
         project = Project.objects.create(**data)
         self.assertIn("tag99", project.tags)
+
+
+def create_browse_startups():
+    user = create_user("browse@example.com")
+    return [create_startup(f"Browse {i}", user=user) for i in range(3)]
+
+
+def create_browse_project(startup, slug, **extra):
+    data = dict(description="Full description.", currency="USD", tags="AI, Pets")
+    data.update(extra)
+    return create_project(startup, slug, **data)
+
+
+class ProjectBrowseAPITest(APITestCase):
+    """Tests for GET /api/projects/projects/"""
+
+    def setUp(self):
+        project_slug_cache.clear()
+        self.startups = create_browse_startups()
+        self.url = reverse('project-list')
+
+    def test_lists_only_public_non_draft_projects(self):
+        create_browse_project(self.startups[0], "listed")
+        create_browse_project(self.startups[0], "draft", status="draft")
+        create_browse_project(self.startups[0], "hidden", visibility="private")
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['slug'] for row in response.data['results']], ["listed"])
+        self.assertEqual(response.data['results'][0]['tags'], ["AI", "Pets"])
+        self.assertEqual(response.data['results'][0]['startup']['company_name'], "Browse 0")
+
+    def test_filters(self):
+        create_browse_project(self.startups[0], "small", target_amount=500)
+        create_browse_project(self.startups[0], "uah", currency="UAH")
+        create_browse_project(self.startups[0], "done", status="completed")
+        create_browse_project(self.startups[0], "large", target_amount=900000)
+
+        def slugs(**params):
+            return sorted(row['slug'] for row in self.client.get(self.url, params).data['results'])
+
+        self.assertEqual(slugs(status="completed"), ["done"])
+        self.assertEqual(slugs(currency="uah"), ["uah"])
+        self.assertEqual(slugs(min_target=1000, max_target=20000), ["done", "uah"])
+        self.assertEqual(self.client.get(self.url, {"status": "draft"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {"min_target": "x"}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_list_query_count_does_not_grow(self):
+        for i in range(6):
+            create_browse_project(self.startups[i % 3], f"round-{i}")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"page_size": 4})
+
+        self.assertEqual(len(response.data['results']), 4)
+        next_page = self.client.get(response.data['next'])
+        seen = [row['slug'] for row in response.data['results'] + next_page.data['results']]
+        self.assertEqual(seen, [f"round-{i}" for i in reversed(range(6))])
+
+    def test_detail_supports_conditional_get(self):
+        project = create_browse_project(self.startups[0], "detail")
+        url = reverse('project-detail', args=[project.slug])
+
+        response = self.client.get(url)
+        self.assertEqual(response.data['description'], "Full description.")
+
+        cached = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(cached.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        Project.objects.filter(pk=project.pk).update(raised_amount=5000)
+        changed = self.client.get(url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(changed.status_code, status.HTTP_200_OK)
+
+    def test_draft_detail_not_found(self):
+        project = create_browse_project(self.startups[0], "draft", status="draft")
+
+        response = self.client.get(reverse('project-detail', args=[project.slug]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class ProjectSlugRoutingTest(APITestCase):
+    """Tests for GET /api/projects/projects/<slug>/ and renamed slugs"""
+
+    def setUp(self):
+        project_slug_cache.clear()
+        self.startups = create_browse_startups()
+
+    def test_warm_slug_is_fetched_by_pk(self):
+        project = create_browse_project(self.startups[0], "warm")
+        url = reverse('project-detail', args=["warm"])
+
+        with self.assertNumQueries(3):  # slug -> pk, validators, object
+            self.client.get(url)
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.data['id'], project.id)
+
+    def test_renamed_slug_redirects(self):
+        project = create_browse_project(self.startups[0], "old-name")
+        self.client.get(reverse('project-detail', args=["old-name"]))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            project.slug = "new-name"
+            project.save()
+
+        response = self.client.get(reverse('project-detail', args=["old-name"]))
+        self.assertEqual(response.status_code, status.HTTP_301_MOVED_PERMANENTLY)
+        self.assertEqual(response['Location'], reverse('project-detail', args=["new-name"]))
+        self.assertEqual(self.client.get(response['Location']).data['id'], project.id)
+
+    def test_reclaimed_slug_wins_over_redirect(self):
+        first = create_browse_project(self.startups[0], "shared")
+        first.slug = "first-renamed"
+        first.save()
+
+        second = create_browse_project(self.startups[1], "shared")
+
+        self.assertEqual(self.client.get(reverse('project-detail', args=["shared"])).data['id'], second.id)
+        second.slug = "second-renamed"
+        second.save()
+        self.assertEqual(ProjectSlugRedirect.objects.get(old_slug="shared").project, second)
+
+    def test_stale_cached_pk_is_refreshed(self):
+        project = create_browse_project(self.startups[0], "moving")
+        self.client.get(reverse('project-detail', args=["moving"]))
+        # Renamed and reused by another process: this process still caches the old pk.
+        Project.objects.filter(pk=project.pk).update(slug="moved")
+        other = create_browse_project(self.startups[1], "moving")
+
+        response = self.client.get(reverse('project-detail', args=["moving"]))
+
+        self.assertEqual(response.data['id'], other.id)
+
+    def test_lru_cache_bounds_size_and_expires(self):
+        lru = LRUCache(maxsize=2, ttl=60)
+        lru.set("a", 1)
+        lru.set("b", 2)
+        lru.get("a")
+        lru.set("c", 3)
+
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual((lru.get("a"), lru.get("c")), (1, 3))
+
+        lru.ttl = 0
+        lru.set("d", 4)
+        self.assertIsNone(lru.get("d"))
+
+
+def create_ledger_project(raised_amount=0):
+    return create_project(create_startup("Ledger"), "hot-round", title="Hot round",
+                          target_amount=1000000, raised_amount=raised_amount)
+
+
+def raised(project):
+    project.refresh_from_db(fields=['raised_amount'])
+    return project.raised_amount
+
+
+class PledgeLedgerTest(TestCase):
+    """Tests for the append-only pledge ledger and Project.raised_amount"""
+
+    def setUp(self):
+        self.project = create_ledger_project(raised_amount=100)
+
+    def test_existing_balance_opens_the_ledger(self):
+        self.assertEqual(self.project.pledges.get().kind, "opening_balance")
+        self.assertEqual(raised(self.project), Decimal("100.00"))
+
+    def test_pledges_and_corrections_update_raised_amount(self):
+        Pledge.objects.create(project=self.project, amount=Decimal("250.50"))
+        Pledge.objects.create(project=self.project, kind="correction", amount=Decimal("-50.50"))
+
+        self.assertEqual(raised(self.project), Decimal("300.00"))
+
+    def test_saving_a_stale_project_keeps_later_pledges(self):
+        stale = Project.objects.get(pk=self.project.pk)
+        Pledge.objects.create(project=self.project, amount=50)
+
+        stale.title = "Renamed round"
+        stale.save()
+
+        self.assertEqual(raised(self.project), Decimal("150.00"))
+        self.assertEqual(Project.objects.get(pk=self.project.pk).title, "Renamed round")
+
+    def test_bulk_create_uses_single_update(self):
+        # INSERT, raised_amount UPDATE and one queued fan-out; followers' dashboards are not looked up.
+        with self.assertNumQueries(3):
+            Pledge.objects.bulk_create([Pledge(project=self.project, amount=10) for _ in range(5)])
+
+        self.assertEqual(raised(self.project), Decimal("150.00"))
+
+    def test_ledger_is_append_only(self):
+        pledge = Pledge.objects.create(project=self.project, amount=10)
+
+        with self.assertRaises(ValueError):
+            pledge.save()
+        with self.assertRaises(ValueError):
+            pledge.delete()
+
+    def test_reconcile_command_refolds_drifted_projects(self):
+        Pledge.objects.create(project=self.project, amount=40)
+        Project.objects.filter(pk=self.project.pk).update(raised_amount=7)
+
+        out = StringIO()
+        call_command('reconcile_raised_amount', stdout=out)
+
+        self.assertEqual(raised(self.project), Decimal("140.00"))
+        self.assertIn("Repaired raised_amount for 1 project(s).", out.getvalue())
+
+
+# Pledges schedule follower notifications; running them inline keeps them from outliving the test's tables.
+@override_settings(BACKGROUND_TASKS_EAGER=True)
+class PledgeConcurrencyTest(TransactionTestCase):
+    """Many threads pledging to one project must neither lose updates nor wait on long locks"""
+
+    threads = 8
+    pledges_per_thread = 25
+
+    def test_concurrent_pledges_sum_exactly(self):
+        project = create_ledger_project()
+        errors = []
+        slowest = []
+        start = threading.Barrier(self.threads)
+
+        def pledge_many():
+            try:
+                with connection.cursor() as cursor:
+                    # A long wait for the project row lock fails the pledge instead of stalling it.
+                    cursor.execute("SET lock_timeout = '2s'")
+                start.wait()
+                for _ in range(self.pledges_per_thread):
+                    began = time.monotonic()
+                    Pledge.objects.create(project_id=project.pk, amount=Decimal("1.25"))
+                    slowest.append(time.monotonic() - began)
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=pledge_many) for _ in range(self.threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        self.assertEqual(errors, [])
+        expected = Decimal("1.25") * self.threads * self.pledges_per_thread
+        self.assertEqual(raised(project), expected)
+        self.assertEqual(project.pledges.count(), self.threads * self.pledges_per_thread)
+        self.assertLess(max(slowest), 2)
@@ -1,3 +1,74 @@
-from django.shortcuts import render
+from django.http import Http404, HttpResponsePermanentRedirect
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from rest_framework import mixins, viewsets
 
-# Create your views here.
+from apps.common.mixins import ConditionalGetMixin
+from apps.common.pagination import KeysetPagination
+from .filters import ProjectBrowseFilterBackend
+from .models import Project
+from .serializers import ProjectCardSerializer, ProjectDetailSerializer
+from .slugs import lookup_project_pk, project_slug_cache, redirected_slug
+
+# Columns read by ProjectCardSerializer.
+CARD_FIELDS = (
+    'id', 'title', 'slug', 'short_description', 'status', 'target_amount', 'raised_amount',
+    'currency', 'tags', 'created_at', 'updated_at',
+    'startup__id', 'startup__company_name', 'startup__city',
+)
+
+
+class ProjectViewSet(ConditionalGetMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
+                     viewsets.GenericViewSet):
+    """
+    Browse listed projects.
+    GET /api/projects/projects/?status=in_progress&currency=USD&min_target=1000&max_target=50000
+    GET /api/projects/projects/<slug>/   old slugs of renamed projects redirect (301)
+    """
+    serializer_class = ProjectCardSerializer
+    lookup_field = 'slug'
+    lookup_value_regex = '[-a-zA-Z0-9_]+'
+    filter_backends = [ProjectBrowseFilterBackend]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+    etag_fields = ('updated_at', 'raised_amount')
+
+    def get_queryset(self):
+        queryset = Project.objects.listed().select_related('startup')
+        if self.action == 'retrieve':
+            return queryset.only(*CARD_FIELDS, 'description')
+        return queryset.only(*CARD_FIELDS)
+
+    def get_serializer_class(self):
+        if self.action == 'retrieve':
+            return ProjectDetailSerializer
+        return ProjectCardSerializer
+
+    def get_lookup_filter(self):
+        # The pk serves the lookup; the slug only confirms a cached pk is still current.
+        return {'pk': self.project_pk, 'slug': self.kwargs['slug']}
+
+    def get_object(self):
+        obj = get_object_or_404(self.get_queryset(), **self.get_lookup_filter())
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    def retrieve(self, request, *args, **kwargs):
+        slug = kwargs['slug']
+        try:
+            return self.retrieve_slug(request, *args, **kwargs)
+        except Http404:
+            # The pk may have been cached before a rename made in another process.
+            if not project_slug_cache.delete(slug):
+                raise
+            return self.retrieve_slug(request, *args, **kwargs)
+
+    def retrieve_slug(self, request, *args, **kwargs):
+        slug = kwargs['slug']
+        self.project_pk = lookup_project_pk(slug)
+        if self.project_pk is None:
+            current = redirected_slug(slug)
+            if current is None:
+                raise Http404
+            return HttpResponsePermanentRedirect(reverse('project-detail', args=[current]))
+        return super().retrieve(request, *args, **kwargs)
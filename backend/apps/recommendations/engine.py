@@ -0,0 +1,301 @@
+"""
+Vectorized investor-to-startup matching.
+
+Candidate features are loaded into NumPy arrays once and a block of investors
+is scored against every startup in a single pass:
+
+    score = 0.5 * industry + 0.3 * amount + 0.2 * region
+
+- industry: share of the investor's preferred industries found among the
+  startup's tags (case-insensitive);
+- amount: 1 if a public, non-draft project of the startup has a target_amount
+  inside the investor's investment range;
+- region: 1 if the startup's city is the investor's city or the centre of
+  the investor's region.
+
+Only the best RECOMMENDATIONS_TOP_K matches with a positive score are stored
+in Recommendation. refresh_investors() recomputes given investors (all of
+them in the periodic refresh_recommendations); refresh_for_startup() scores a
+changed startup against the investors it can match and upserts those rows.
+"""
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, F, Min, Q, Window
+from django.db.models.functions import Lower, RowNumber, Trim
+from psycopg2.extras import NumericRange
+
+from apps.investors.models import REGION_CENTRES, InvestorIndustry, InvestorProfile
+from apps.projects.models import Project
+from apps.startups.models import StartupProfile, StartupTag
+from .models import Recommendation
+
+INDUSTRY_WEIGHT = 0.5
+AMOUNT_WEIGHT = 0.3
+REGION_WEIGHT = 0.2
+
+
+def normalize(value):
+    return (value or '').strip().lower()
+
+
+class InvestorFeatures:
+    """Matching inputs of investors, one array row per investor (ordered by id)."""
+
+    def __init__(self, investor_ids=None):
+        investors = InvestorProfile.objects.order_by('id')
+        links = InvestorIndustry.objects.all()
+        if investor_ids is not None:
+            investors = investors.filter(id__in=investor_ids)
+            links = links.filter(investor_id__in=investor_ids)
+        rows = list(investors.values_list(
+            'id', 'investment_range_min', 'investment_range_max', 'region', 'city'
+        ))
+
+        self.ids = np.array([row[0] for row in rows], dtype=np.int64)
+        self.range_min = np.array([float(row[1]) for row in rows], dtype=np.float64)
+        self.range_max = np.array([float(row[2]) for row in rows], dtype=np.float64)
+        self.regions = [normalize(REGION_CENTRES.get(row[3])) for row in rows]
+        self.cities = [normalize(row[4]) for row in rows]
+
+        position = {investor_id: index for index, investor_id in enumerate(self.ids.tolist())}
+        self.industries = [[] for _ in rows]
+        for investor_id, name in links.values_list('investor_id', 'industry__name'):
+            if investor_id in position:
+                self.industries[position[investor_id]].append(normalize(name))
+
+
+class StartupFeatures:
+    """Matching inputs of startups, one array row per startup (ordered by id)."""
+
+    def __init__(self, startup_ids=None):
+        startups = StartupProfile.objects.order_by('id')
+        links = StartupTag.objects.all()
+        projects = Project.objects.listed()
+        if startup_ids is not None:
+            startups = startups.filter(id__in=startup_ids)
+            links = links.filter(startup_id__in=startup_ids)
+            projects = projects.filter(startup_id__in=startup_ids)
+
+        rows = list(startups.values_list('id', 'city'))
+        self.ids = np.array([row[0] for row in rows], dtype=np.int64)
+        self.cities = [normalize(row[1]) for row in rows]
+        position = {startup_id: index for index, (startup_id, _) in enumerate(rows)}
+
+        # (startup row, tag name) pairs
+        self.tags = [
+            (position[startup_id], normalize(name))
+            for startup_id, name in links.values_list('startup_id', 'tag__name')
+            if startup_id in position
+        ]
+
+        # Project targets grouped by startup row, for np.logical_or.reduceat.
+        targets = sorted(
+            (position[startup_id], float(amount))
+            for startup_id, amount in projects.values_list('startup_id', 'target_amount')
+            if startup_id in position
+        )
+        self.project_owners = np.array([owner for owner, _ in targets], dtype=np.int64)
+        self.project_targets = np.array([amount for _, amount in targets], dtype=np.float64)
+
+
+class MatchingEngine:
+    """Scores InvestorFeatures against StartupFeatures with array operations only."""
+
+    def __init__(self, investors, startups):
+        self.investors = investors
+        self.startups = startups
+
+        # Industries: incidence matrices over the vocabulary investors ask for,
+        # so overlap counts are a single matrix product.
+        vocabulary = {}
+        for names in investors.industries:
+            for name in names:
+                vocabulary.setdefault(name, len(vocabulary))
+        self.investor_industries = np.zeros((len(investors.ids), len(vocabulary)), dtype=np.float32)
+        for row, names in enumerate(investors.industries):
+            self.investor_industries[row, [vocabulary[name] for name in names]] = 1
+        self.startup_industries = np.zeros((len(startups.ids), len(vocabulary)), dtype=np.float32)
+        for row, name in startups.tags:
+            if name in vocabulary:
+                self.startup_industries[row, vocabulary[name]] = 1
+        self.industry_counts = self.investor_industries.sum(axis=1)
+
+        # Places: shared integer codes; blanks get distinct codes so they never match.
+        places = {}
+
+        def encode(names, blank):
+            return np.array([places.setdefault(name, len(places)) if name else blank for name in names],
+                            dtype=np.int64)
+
+        self.investor_regions = encode(investors.regions, -1)
+        self.investor_cities = encode(investors.cities, -1)
+        self.startup_cities = encode(startups.cities, -2)
+
+        owners = startups.project_owners
+        self.project_groups = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]]) if owners.size else owners
+        self.project_group_owners = owners[self.project_groups] if owners.size else owners
+
+    def score(self, block):
+        """(investors in block) x (all startups) score matrix."""
+        industry_counts = self.industry_counts[block, None]
+        overlap = self.investor_industries[block] @ self.startup_industries.T
+        industry = np.divide(overlap, industry_counts, out=np.zeros_like(overlap), where=industry_counts > 0)
+
+        cities = self.startup_cities[None, :]
+        region = (cities == self.investor_regions[block, None]) | (cities == self.investor_cities[block, None])
+
+        amount = np.zeros(region.shape, dtype=bool)
+        if self.project_groups.size:
+            targets = self.startups.project_targets[None, :]
+            fits = (targets >= self.investors.range_min[block, None]) & (targets <= self.investors.range_max[block, None])
+            amount[:, self.project_group_owners] = np.logical_or.reduceat(fits, self.project_groups, axis=1)
+
+        return INDUSTRY_WEIGHT * industry + AMOUNT_WEIGHT * amount + REGION_WEIGHT * region
+
+    def top_matches(self, block, k):
+        """[(investor_id, startup_id, score)] of the k best positive matches per investor in block."""
+        scores = self.score(block)
+        if not scores.size:
+            return []
+
+        k = min(k, scores.shape[1])
+        if k < scores.shape[1]:
+            candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        else:
+            candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+        top_scores = np.take_along_axis(scores, candidates, axis=1)
+
+        matches = []
+        for investor_id, columns, values in zip(self.investors.ids[block], candidates, top_scores):
+            for column, value in zip(columns, values):
+                if value > 0:
+                    matches.append((int(investor_id), int(self.startups.ids[column]), float(value)))
+        return matches
+
+
+def store_recommendations(investor_ids, matches):
+    """Replace the stored recommendations of the given investors."""
+    with transaction.atomic():
+        Recommendation.objects.filter(investor_id__in=investor_ids).delete()
+        Recommendation.objects.bulk_create(
+            [Recommendation(investor_id=investor_id, startup_id=startup_id, score=score)
+             for investor_id, startup_id, score in matches],
+            batch_size=1000,
+        )
+
+
+def refresh_investors(investor_ids=None, batch_size=256):
+    """
+    Recompute the recommendations of the given investors (all when None),
+    scoring `batch_size` investors per pass. Returns the number of rows stored.
+    """
+    investors = InvestorFeatures(investor_ids)
+    if not investors.ids.size:
+        return 0
+
+    engine = MatchingEngine(investors, StartupFeatures())
+    stored = 0
+    for start in range(0, len(investors.ids), batch_size):
+        block = slice(start, start + batch_size)
+        matches = engine.top_matches(block, settings.RECOMMENDATIONS_TOP_K)
+        store_recommendations(investors.ids[block].tolist(), matches)
+        stored += len(matches)
+    return stored
+
+
+def candidate_investors(startup_id, startup):
+    """
+    Ids of the investors a startup can score above zero with: sharing an
+    industry with its tags, its city or region, or a range holding one of its
+    project targets. Investors that already list the startup are included.
+    """
+    match = Q(pk__in=Recommendation.objects.filter(startup_id=startup_id).values('investor_id'))
+    tags = {name for _, name in startup.tags}
+    if tags:
+        match |= Q(pk__in=InvestorIndustry.objects
+                   .alias(name_key=Lower('industry__name'))
+                   .filter(name_key__in=tags)
+                   .values('investor_id'))
+    city = startup.cities[0]
+    if city:
+        regions = [region for region, centre in REGION_CENTRES.items() if normalize(centre) == city]
+        match |= Q(city_key=city) | Q(region__in=regions)
+    for target in Project.objects.listed().filter(startup_id=startup_id).values_list('target_amount', flat=True):
+        match |= Q(investment_range__contains=NumericRange(target, target, '[]'))
+
+    return list(
+        InvestorProfile.objects.alias(city_key=Lower(Trim('city'))).filter(match).values_list('id', flat=True)
+    )
+
+
+def store_startup_scores(startup_id, scores):
+    """
+    Write {investor_id: score} of one startup into the investors' stored top-k:
+    a score enters when the investor has room or it beats their lowest stored
+    score (which then drops out), and a zero score removes the row.
+    Returns the number of rows written.
+    """
+    top_k = settings.RECOMMENDATIONS_TOP_K
+    with transaction.atomic():
+        ranked = {
+            row['investor_id']: row
+            for row in Recommendation.objects
+            .filter(investor_id__in=scores)
+            .exclude(startup_id=startup_id)
+            .values('investor_id')
+            .annotate(stored=Count('id'), lowest=Min('score'))
+        }
+        entering = {
+            investor_id: score
+            for investor_id, score in scores.items()
+            if score > 0 and (
+                investor_id not in ranked
+                or ranked[investor_id]['stored'] < top_k
+                or score > ranked[investor_id]['lowest']
+            )
+        }
+
+        Recommendation.objects.filter(startup_id=startup_id, investor_id__in=scores).exclude(
+            investor_id__in=entering
+        ).delete()
+        Recommendation.objects.bulk_create(
+            [Recommendation(investor_id=investor_id, startup_id=startup_id, score=score)
+             for investor_id, score in entering.items()],
+            update_conflicts=True,
+            unique_fields=['investor', 'startup'],
+            update_fields=['score', 'computed_at'],
+            batch_size=1000,
+        )
+
+        full = [investor_id for investor_id in entering if ranked.get(investor_id, {}).get('stored', 0) >= top_k]
+        if full:
+            overflow = list(
+                Recommendation.objects
+                .filter(investor_id__in=full)
+                .alias(position=Window(RowNumber(), partition_by=F('investor_id'),
+                                       order_by=[F('score').desc(), F('id').desc()]))
+                .filter(position__gt=top_k)
+                .values_list('id', flat=True)
+            )
+            Recommendation.objects.filter(pk__in=overflow).delete()
+    return len(entering)
+
+
+def refresh_for_startup(startup_id):
+    """
+    Update the stored matches of a startup after it or one of its projects changed.
+
+    Only candidate_investors() are scored, and only their rows for this startup
+    are written. Matches of other startups that a lowered score would let back
+    into an investor's top-k wait for the periodic refresh_recommendations.
+    """
+    startup = StartupFeatures([startup_id])
+    if not startup.ids.size:
+        return 0
+    investors = InvestorFeatures(candidate_investors(startup_id, startup))
+    if not investors.ids.size:
+        return 0
+
+    scores = MatchingEngine(investors, startup).score(slice(None))[:, 0]
+    return store_startup_scores(startup_id, dict(zip(investors.ids.tolist(), scores.tolist())))
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.recommendations.engine import refresh_investors
+
+
+class Command(BaseCommand):
+    """Django command to recompute stored investor recommendations."""
+
+    help = 'Score investors against all startups and store their top matches.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--investor', type=int, nargs='*', help='Only refresh these investor ids.')
+        parser.add_argument('--batch-size', type=int, default=256, help='Investors scored per pass.')
+
+    def handle(self, *args, **options):
+        stored = refresh_investors(options['investor'] or None, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Stored {stored} recommendation(s).'))
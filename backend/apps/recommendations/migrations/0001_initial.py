@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('investors', '0003_logo_variants'),
+        ('startups', '0008_logo_variants'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Recommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('investor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='investors.investorprofile')),
+                ('startup', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='startups.startupprofile')),
+            ],
+            options={
+                'verbose_name': 'Recommendation',
+                'verbose_name_plural': 'Recommendations',
+                'indexes': [models.Index(fields=['investor', '-score'], name='recommendation_score_idx')],
+                'constraints': [models.UniqueConstraint(fields=('investor', 'startup'), name='recommendation_investor_startup_unique')],
+            },
+        ),
+    ]
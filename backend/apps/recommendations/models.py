@@ -0,0 +1,29 @@
+from django.db import models
+
+from apps.investors.models import InvestorProfile
+from apps.startups.models import StartupProfile
+
+
+class Recommendation(models.Model):
+    """
+    Precomputed top-k startup matches of an investor, maintained by
+    apps.recommendations.engine (see signals and refresh_recommendations).
+    """
+    investor = models.ForeignKey(InvestorProfile, on_delete=models.CASCADE, related_name='recommendations')
+    startup = models.ForeignKey(StartupProfile, on_delete=models.CASCADE, related_name='recommendations')
+    score = models.FloatField()
+    computed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.investor} -> {self.startup} ({self.score:.3f})"
+
+    class Meta:
+        verbose_name = "Recommendation"
+        verbose_name_plural = "Recommendations"
+        constraints = [
+            models.UniqueConstraint(fields=['investor', 'startup'], name='recommendation_investor_startup_unique'),
+        ]
+        indexes = [
+            # Serves "top matches of an investor" as an index range scan.
+            models.Index(fields=['investor', '-score'], name='recommendation_score_idx'),
+        ]
@@ -0,0 +1,12 @@
+from rest_framework import serializers
+from .models import Recommendation
+
+
+class RecommendationSerializer(serializers.ModelSerializer):
+    startup_id = serializers.IntegerField(source='startup.id', read_only=True)
+    company_name = serializers.CharField(source='startup.company_name', read_only=True)
+    city = serializers.CharField(source='startup.city', read_only=True)
+
+    class Meta:
+        model = Recommendation
+        fields = ['startup_id', 'company_name', 'city', 'score', 'computed_at']
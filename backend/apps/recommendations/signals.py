@@ -0,0 +1,73 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.common.tasks import run_in_background
+from apps.common.utils import saves_any
+from apps.investors.models import InvestorProfile
+from apps.projects.models import Project
+from apps.startups.models import StartupProfile
+from .engine import refresh_for_startup, refresh_investors
+
+# Saves that leave these fields as they were cannot change any score.
+INVESTOR_MATCH_FIELDS = ('preferred_industries', 'investment_range_min', 'investment_range_max', 'region', 'city')
+STARTUP_MATCH_FIELDS = ('city', 'partners_brands')
+PROJECT_MATCH_FIELDS = ('startup', 'target_amount', 'status', 'visibility')
+
+MATCH_FIELDS = {
+    InvestorProfile: INVESTOR_MATCH_FIELDS,
+    StartupProfile: STARTUP_MATCH_FIELDS,
+    Project: PROJECT_MATCH_FIELDS,
+}
+
+
+def match_values(model, values):
+    """{field: value} in the types stored, so assigned and loaded values compare equal."""
+    return {name: model._meta.get_field(name).to_python(value) for name, value in values.items()}
+
+
+@receiver(pre_save, sender=InvestorProfile)
+@receiver(pre_save, sender=StartupProfile)
+@receiver(pre_save, sender=Project)
+def remember_match_fields(sender, instance, update_fields=None, **kwargs):
+    fields = MATCH_FIELDS[sender]
+    if instance.pk is not None and saves_any(update_fields, fields):
+        instance._match_before = sender.objects.filter(pk=instance.pk).values(*fields).first()
+
+
+def match_changed(sender, instance, created):
+    """The stored match fields before a save, if the save created the row or changed any of them."""
+    if '_match_before' not in instance.__dict__:
+        return {} if created else None
+    before = instance.__dict__.pop('_match_before') or {}
+    after = {name: getattr(instance, sender._meta.get_field(name).attname) for name in MATCH_FIELDS[sender]}
+    if created or not before or match_values(sender, before) != match_values(sender, after):
+        return before
+    return None
+
+
+@receiver(post_save, sender=InvestorProfile)
+def refresh_investor_recommendations(sender, instance, created, **kwargs):
+    if match_changed(sender, instance, created) is not None:
+        run_in_background(refresh_investors, [instance.pk])
+
+
+@receiver(post_save, sender=StartupProfile)
+def refresh_startup_recommendations(sender, instance, created, **kwargs):
+    if match_changed(sender, instance, created) is not None:
+        run_in_background(refresh_for_startup, instance.pk)
+
+
+@receiver(post_save, sender=Project)
+def refresh_project_recommendations(sender, instance, created, **kwargs):
+    before = match_changed(sender, instance, created)
+    if before is None:
+        return
+    run_in_background(refresh_for_startup, instance.startup_id)
+    if before.get('startup') not in (None, instance.startup_id):
+        # Moved to another startup: the previous owner loses the project's amount.
+        run_in_background(refresh_for_startup, before['startup'])
+
+
+@receiver(post_delete, sender=Project)
+def refresh_deleted_project_recommendations(sender, instance, **kwargs):
+    run_in_background(refresh_for_startup, instance.startup_id)
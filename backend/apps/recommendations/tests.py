@@ -0,0 +1,202 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.common.testing import create_investor, create_project, create_startup
+from apps.projects.models import Project
+from apps.startups.models import StartupProfile
+from .engine import StartupFeatures, candidate_investors, refresh_for_startup, refresh_investors
+from .models import Recommendation
+
+User = get_user_model()
+
+
+def create_fintech_investor(email, **extra):
+    return create_investor(email, **{'preferred_industries': "Fintech, AI", **extra})
+
+
+def create_matched_startup(name, city, tags, target_amount=None):
+    startup = create_startup(name, city=city, partners_brands=tags)
+    if target_amount is not None:
+        create_project(startup, f"{name.lower()}-round", target_amount=target_amount, tags=tags)
+    return startup
+
+
+class MatchingEngineTest(TestCase):
+    """Tests for vectorized scoring and top-k storage"""
+
+    def setUp(self):
+        self.investor = create_fintech_investor('fin@example.com')
+        self.best = create_matched_startup('PayFlow', 'Kyiv', 'fintech, ai', target_amount=20000)
+        self.partial = create_matched_startup('LedgerX', 'Lviv', 'FINTECH', target_amount=900000)
+        self.unrelated = create_matched_startup('AgroSense', 'Poltava', 'agritech')
+
+    def scores(self):
+        return dict(
+            Recommendation.objects.filter(investor=self.investor).values_list('startup__company_name', 'score')
+        )
+
+    def test_scores_combine_industry_amount_and_region(self):
+        refresh_investors([self.investor.id])
+
+        scores = self.scores()
+        self.assertAlmostEqual(scores['PayFlow'], 1.0)
+        self.assertAlmostEqual(scores['LedgerX'], 0.25)
+        self.assertNotIn('AgroSense', scores)  # zero scores are not stored
+
+    def test_region_matches_regional_centre(self):
+        investor = create_fintech_investor('dnipro@example.com', preferred_industries="agritech",
+                                           region=3, city="Pavlohrad")  # Dnipropetrovsk
+        create_matched_startup('FieldOps', 'Dnipro', 'logistics')
+
+        refresh_investors([investor.id])
+
+        self.assertAlmostEqual(investor.recommendations.get(startup__company_name='FieldOps').score, 0.2)
+
+    def test_draft_projects_do_not_count_for_amount(self):
+        Project.objects.filter(startup=self.best).update(status='draft')
+
+        refresh_investors([self.investor.id])
+
+        self.assertAlmostEqual(self.scores()['PayFlow'], 0.7)
+
+    @override_settings(RECOMMENDATIONS_TOP_K=1)
+    def test_only_top_k_are_stored(self):
+        refresh_investors()
+
+        self.assertEqual(self.scores(), {'PayFlow': 1.0})
+
+    def test_refresh_replaces_previous_rows(self):
+        refresh_investors([self.investor.id])
+        self.investor.preferred_industries = "agritech"
+        self.investor.save()
+
+        refresh_investors([self.investor.id])
+
+        self.assertEqual(set(self.scores()), {'AgroSense', 'PayFlow'})
+
+    def test_blocks_give_same_result(self):
+        create_fintech_investor('agro@example.com', preferred_industries="agritech", region=13, city="Poltava")
+
+        refresh_investors(batch_size=1)
+        one_by_one = set(Recommendation.objects.values_list('investor_id', 'startup_id', 'score'))
+        refresh_investors(batch_size=100)
+
+        self.assertEqual(set(Recommendation.objects.values_list('investor_id', 'startup_id', 'score')), one_by_one)
+
+    @override_settings(RECOMMENDATIONS_TOP_K=2)
+    def test_startup_refresh_upserts_into_top_k(self):
+        refresh_investors([self.investor.id])
+        outsider = create_fintech_investor('agro@example.com', preferred_industries="agritech", region=13,
+                                           city="Poltava", investment_range_min=1, investment_range_max=2)
+        newcomer = create_matched_startup('CoinPay', 'Kyiv', 'fintech')
+
+        candidates = candidate_investors(newcomer.id, StartupFeatures([newcomer.id]))
+        self.assertEqual(candidates, [self.investor.id])
+        self.assertNotIn(outsider.id, candidates)
+
+        self.assertEqual(refresh_for_startup(newcomer.id), 1)
+        self.assertEqual(self.scores(), {'PayFlow': 1.0, 'CoinPay': 0.45})
+
+        newcomer.startup_tags.all().delete()
+        StartupProfile.objects.filter(pk=newcomer.pk).update(city="Lviv")
+        refresh_for_startup(newcomer.id)
+
+        # LedgerX, pushed out above, returns with the next full refresh.
+        self.assertEqual(self.scores(), {'PayFlow': 1.0})
+
+    def test_command_refreshes_all_investors(self):
+        out = StringIO()
+        call_command('refresh_recommendations', stdout=out)
+
+        self.assertIn('Stored 2 recommendation(s).', out.getvalue())
+
+
+@override_settings(BACKGROUND_TASKS_EAGER=True)
+class RecommendationRefreshSignalsTest(TestCase):
+    """Tests for incremental refreshes when profiles or projects change"""
+
+    def test_new_investor_gets_recommendations(self):
+        create_matched_startup('PayFlow', 'Kyiv', 'fintech', target_amount=20000)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            investor = create_fintech_investor('fin@example.com')
+
+        self.assertEqual(investor.recommendations.count(), 1)
+
+    def test_startup_and_project_changes_rerank(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            investor = create_fintech_investor('fin@example.com')
+            startup = create_matched_startup('PayFlow', 'Lviv', 'agritech')
+        self.assertFalse(investor.recommendations.exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            startup.partners_brands = 'fintech'
+            startup.save()
+        self.assertAlmostEqual(investor.recommendations.get().score, 0.25)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Project.objects.create(
+                startup=startup, title="Round", slug="round", short_description="Round.",
+                description="Round.", status="in_progress", target_amount=20000, tags="",
+            )
+        self.assertAlmostEqual(investor.recommendations.get().score, 0.55)
+
+    def test_only_match_field_changes_schedule_refresh(self):
+        investor = create_fintech_investor('fin@example.com')
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            investor.save(update_fields=['description'])
+            investor.description = "Invests early."
+            investor.save()
+            investor.investment_range_min = "10000"
+            investor.save(update_fields=['investment_range_min'])
+
+        self.assertEqual(callbacks, [])
+
+        create_matched_startup('AgroSense', 'Lviv', 'agritech')
+        with self.captureOnCommitCallbacks(execute=True):
+            investor.city = "Lviv"
+            investor.save()
+
+        self.assertAlmostEqual(investor.recommendations.get().score, 0.2)
+
+
+class RecommendationAPITest(APITestCase):
+    """Tests for GET /api/recommendations/"""
+
+    def setUp(self):
+        self.investor = create_fintech_investor('fin@example.com')
+        create_matched_startup('PayFlow', 'Kyiv', 'fintech, ai', target_amount=20000)
+        create_matched_startup('LedgerX', 'Lviv', 'fintech')
+        refresh_investors()
+        self.url = reverse('recommendations')
+
+    def test_lists_matches_best_first(self):
+        self.client.force_authenticate(self.investor.user)
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['company_name'] for row in response.data], ['PayFlow', 'LedgerX'])
+        self.assertAlmostEqual(response.data[0]['score'], 1.0)
+
+    def test_requires_investor_profile(self):
+        user = User.objects.create_user(email='nobody@example.com', password='password123',
+                                        first_name='No', last_name='Body')
+        self.client.force_authenticate(user)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_requires_authentication(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -0,0 +1,25 @@
+from rest_framework import generics
+from rest_framework.permissions import IsAuthenticated
+
+from apps.investors.permissions import IsInvestor, get_investor_profile
+from .models import Recommendation
+from .serializers import RecommendationSerializer
+
+
+class RecommendationListView(generics.ListAPIView):
+    """
+    Precomputed startup matches of the authenticated investor, best first.
+    GET /api/recommendations/
+    """
+    permission_classes = [IsAuthenticated, IsInvestor]
+    serializer_class = RecommendationSerializer
+    pagination_class = None
+
+    def get_queryset(self):
+        return (
+            Recommendation.objects
+            .filter(investor=get_investor_profile(self.request))
+            .select_related('startup')
+            .only('score', 'computed_at', 'startup__id', 'startup__company_name', 'startup__city')
+            .order_by('-score', 'startup_id')
+        )
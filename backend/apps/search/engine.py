@@ -0,0 +1,143 @@
+"""
+Ranked full-text search over startups and projects.
+
+Documents are indexed through the weighted `search_vector` columns that
+database triggers keep current (see the startups and projects migrations).
+Results are cached per normalized query under a generation counter per kind.
+A committed change to a searched field of a startup or project bumps the
+counter of that kind, which retires every cached result set including it.
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Value
+from django.db.models.functions import Replace
+
+from apps.projects.models import Project
+from apps.startups.models import StartupProfile
+
+SEARCH_CONFIG = 'simple'
+SEARCH_KINDS = ('startups', 'projects')
+GENERATION_CACHE_PREFIX = 'search:generation'
+
+# Applied in order ('&' first), so the stored text reaches ts_headline already
+# HTML-escaped and the <mark> tags it inserts are the only markup in a highlight.
+HTML_ESCAPES = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '&quot;'), ("'", '&#x27;'))
+
+HIGHLIGHT_OPTIONS = {
+    'config': SEARCH_CONFIG,
+    'start_sel': '<mark>',
+    'stop_sel': '</mark>',
+}
+
+
+def normalize_query(text):
+    """Case-fold and collapse whitespace so equivalent queries share a cache entry."""
+    return ' '.join(text.lower().split())
+
+
+def generation_key(kind):
+    return f'{GENERATION_CACHE_PREFIX}:{kind}'
+
+
+def get_generations(kinds):
+    """Current generation of each kind, read in one round trip."""
+    keys = [generation_key(kind) for kind in kinds]
+    generations = cache.get_many(keys)
+    for key in keys:
+        if key not in generations:
+            generations[key] = cache.get_or_set(key, 1, timeout=None)
+    return [generations[key] for key in keys]
+
+
+def invalidate_search_cache(kind):
+    """Retire cached result sets that include `kind` once the current transaction commits."""
+    key = generation_key(kind)
+
+    def bump():
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def _cache_key(normalized, kinds, limit):
+    digest = hashlib.sha1(normalized.encode()).hexdigest()
+    generations = '.'.join(map(str, get_generations(kinds)))
+    return f'search:{generations}:{",".join(kinds)}:{limit}:{digest}'
+
+
+def escape_html(field):
+    expression = F(field)
+    for char, entity in HTML_ESCAPES:
+        expression = Replace(expression, Value(char), Value(entity))
+    return expression
+
+
+def _ranked(queryset, query, limit, headline_fields, values):
+    return list(
+        queryset
+        .filter(search_vector=query)
+        .annotate(
+            rank=SearchRank(F('search_vector'), query),
+            **{
+                f'{field}_highlight': SearchHeadline(escape_html(field), query, **options)
+                for field, options in headline_fields.items()
+            },
+        )
+        .order_by('-rank', '-id')
+        .values(*values, 'rank', *(f'{field}_highlight' for field in headline_fields))[:limit]
+    )
+
+
+def search_startups(query, limit):
+    return _ranked(
+        StartupProfile.objects.all(),
+        query,
+        limit,
+        headline_fields={
+            'company_name': {**HIGHLIGHT_OPTIONS, 'highlight_all': True},
+            'description': {**HIGHLIGHT_OPTIONS, 'max_words': 35, 'min_words': 15},
+        },
+        values=('id', 'company_name', 'city'),
+    )
+
+
+def search_projects(query, limit):
+    return _ranked(
+        Project.objects.filter(visibility='public').exclude(status='draft'),
+        query,
+        limit,
+        headline_fields={
+            'title': {**HIGHLIGHT_OPTIONS, 'highlight_all': True},
+            'short_description': {**HIGHLIGHT_OPTIONS, 'max_words': 35, 'min_words': 15},
+        },
+        values=('id', 'slug', 'title', 'startup_id', 'status'),
+    )
+
+
+SEARCHERS = {
+    'startups': search_startups,
+    'projects': search_projects,
+}
+
+
+def search(text, kinds=SEARCH_KINDS, limit=20):
+    """Return {'query': ..., <kind>: [ranked rows]} for the requested kinds."""
+    normalized = normalize_query(text)
+    key = _cache_key(normalized, kinds, limit)
+
+    results = cache.get(key)
+    if results is None:
+        query = SearchQuery(normalized, config=SEARCH_CONFIG, search_type='websearch')
+        results = {'query': normalized}
+        for kind in kinds:
+            results[kind] = SEARCHERS[kind](query, limit)
+        cache.set(key, results, timeout=settings.SEARCH_CACHE_TIMEOUT)
+
+    return results
@@ -0,0 +1,49 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.common.utils import saves_any
+from apps.projects.models import Project
+from apps.startups.models import StartupProfile
+
+from .engine import invalidate_search_cache
+
+SEARCH_KIND = {
+    StartupProfile: 'startups',
+    Project: 'projects',
+}
+
+# Fields that feed the search_vector, the returned rows or the listed filter.
+SEARCHED_FIELDS = {
+    StartupProfile: ('company_name', 'description', 'city'),
+    Project: ('title', 'tags', 'short_description', 'description', 'slug', 'status', 'visibility', 'startup'),
+}
+
+
+def searched_values(sender, instance):
+    return tuple(getattr(instance, sender._meta.get_field(name).attname) for name in SEARCHED_FIELDS[sender])
+
+
+@receiver(pre_save, sender=StartupProfile)
+@receiver(pre_save, sender=Project)
+def remember_searched_fields(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is not None and saves_any(update_fields, SEARCHED_FIELDS[sender]):
+        instance._searched_before = (
+            sender.objects.filter(pk=instance.pk).values_list(*SEARCHED_FIELDS[sender]).first()
+        )
+
+
+@receiver(post_save, sender=StartupProfile)
+@receiver(post_save, sender=Project)
+def invalidate_changed_search_results(sender, instance, created, **kwargs):
+    if '_searched_before' in instance.__dict__:
+        changed = instance.__dict__.pop('_searched_before') != searched_values(sender, instance)
+    else:
+        changed = created
+    if changed:
+        invalidate_search_cache(SEARCH_KIND[sender])
+
+
+@receiver(post_delete, sender=StartupProfile)
+@receiver(post_delete, sender=Project)
+def invalidate_deleted_search_results(sender, **kwargs):
+    invalidate_search_cache(SEARCH_KIND[sender])
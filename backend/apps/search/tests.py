@@ -0,0 +1,143 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.projects.models import Project
+from apps.startups.models import StartupProfile
+
+User = get_user_model()
+
+
+class SearchAPITest(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='search@example.com',
+            password='password123',
+            first_name='Search',
+            last_name='User'
+        )
+        self.agro = StartupProfile.objects.create(
+            user=self.user,
+            company_name="AgroSense",
+            description="Soil sensors and analytics for farmers.",
+            founded_year=2022,
+            team_size=8,
+            website="https://agrosense.ua",
+            email="hello@agrosense.ua",
+            phone="1111111111",
+            city="Poltava",
+            partners_brands="agritech",
+            audit_status="approved"
+        )
+        self.fin = StartupProfile.objects.create(
+            user=self.user,
+            company_name="PayFlow",
+            description="Payments platform. Works with agrosense data exports.",
+            founded_year=2021,
+            team_size=20,
+            website="https://payflow.ua",
+            email="hello@payflow.ua",
+            phone="2222222222",
+            city="Kyiv",
+            partners_brands="fintech",
+            audit_status="approved"
+        )
+        self.project = Project.objects.create(
+            startup=self.agro,
+            title="Soil moisture network",
+            slug="soil-moisture-network",
+            short_description="Wireless sensors for soil moisture.",
+            description="Long range network of sensors.",
+            status="in_progress",
+            target_amount=100000,
+            tags="agritech, iot",
+        )
+        Project.objects.create(
+            startup=self.agro,
+            title="Soil secret draft",
+            slug="soil-secret-draft",
+            short_description="Not public yet.",
+            description="Draft.",
+            status="draft",
+            target_amount=1000,
+            tags="agritech",
+        )
+        self.url = reverse('search')
+
+    def test_results_are_ranked_by_weight(self):
+        response = self.client.get(self.url, {'q': 'agrosense', 'type': 'startups'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [row['id'] for row in response.data['startups']]
+        # A name match (weight A) outranks a description match (weight B).
+        self.assertEqual(ids, [self.agro.id, self.fin.id])
+        self.assertNotIn('projects', response.data)
+
+    def test_results_are_highlighted(self):
+        response = self.client.get(self.url, {'q': 'soil'})
+
+        startup = response.data['startups'][0]
+        self.assertIn('<mark>Soil</mark>', startup['description_highlight'])
+        self.assertEqual([row['id'] for row in response.data['projects']], [self.project.id])
+        self.assertIn('<mark>Soil</mark>', response.data['projects'][0]['title_highlight'])
+
+    def test_highlights_escape_stored_html(self):
+        self.agro.description = 'Soil <img src=x onerror="alert(1)"> & sensors.'
+        self.agro.save()
+
+        response = self.client.get(self.url, {'q': 'soil', 'type': 'startups'})
+
+        highlight = response.data['startups'][0]['description_highlight']
+        self.assertIn('<mark>Soil</mark>', highlight)
+        self.assertIn('&lt;img src=x onerror=&quot;alert(1)&quot;&gt; &amp; sensors.', highlight)
+        self.assertNotIn('<img', highlight)
+
+    def test_search_vector_follows_updates(self):
+        self.fin.company_name = "MoneyRiver"
+        self.fin.save()
+
+        response = self.client.get(self.url, {'q': 'moneyriver', 'type': 'startups'})
+        self.assertEqual([row['id'] for row in response.data['startups']], [self.fin.id])
+
+    def test_repeated_queries_are_served_from_cache(self):
+        self.client.get(self.url, {'q': 'Soil  Sensors'})
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url, {'q': 'soil sensors'})
+
+        self.assertEqual(response.data['query'], 'soil sensors')
+        self.assertEqual(len(response.data['startups']), 1)
+
+    def test_writes_invalidate_cached_results(self):
+        self.client.get(self.url, {'q': 'moisture', 'type': 'startups'})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agro.description = "Soil moisture sensors."
+            self.agro.save()
+
+        response = self.client.get(self.url, {'q': 'moisture', 'type': 'startups'})
+        self.assertEqual([row['id'] for row in response.data['startups']], [self.agro.id])
+
+    def test_only_searched_changes_of_a_kind_invalidate(self):
+        self.client.get(self.url, {'q': 'soil', 'type': 'startups'})
+        self.client.get(self.url, {'q': 'soil', 'type': 'projects'})
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.agro.team_size = 9
+            self.agro.save()
+            self.project.title = "Soil moisture mesh"
+            self.project.save()
+
+        with self.assertNumQueries(0):
+            self.client.get(self.url, {'q': 'soil', 'type': 'startups'})
+        response = self.client.get(self.url, {'q': 'soil', 'type': 'projects'})
+        self.assertEqual(response.data['projects'][0]['title'], "Soil moisture mesh")
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            self.client.get(self.url, {'q': 'x', 'type': 'users'}).status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
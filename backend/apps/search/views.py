@@ -0,0 +1,32 @@
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .engine import SEARCH_KINDS, search
+
+
+class SearchView(APIView):
+    """
+    Ranked full-text search over startups and projects.
+    GET /api/search/?q=<text>[&type=startups|projects][&limit=20]
+    """
+    max_limit = 50
+
+    def get(self, request):
+        text = request.query_params.get('q', '').strip()
+        if not text:
+            raise ValidationError({'q': 'This parameter is required.'})
+
+        kind = request.query_params.get('type')
+        if kind and kind not in SEARCH_KINDS:
+            raise ValidationError({'type': f'Must be one of: {", ".join(SEARCH_KINDS)}.'})
+
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            raise ValidationError({'limit': 'A valid integer is required.'})
+        limit = max(1, min(limit, self.max_limit))
+
+        kinds = (kind,) if kind else SEARCH_KINDS
+        return Response(search(text, kinds=kinds, limit=limit), status=status.HTTP_200_OK)
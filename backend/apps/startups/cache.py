@@ -0,0 +1,34 @@
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import StartupProfile
+
+PROFILE_CACHE_PREFIX = 'startups:profile'
+
+
+def profile_cache_key(pk, updated_at):
+    return f'{PROFILE_CACHE_PREFIX}:{pk}:{int(updated_at.timestamp() * 1_000_000)}'
+
+
+def invalidate_profile_cache(pk, updated_at=None):
+    """
+    Drop the cached public payload of a startup once the current transaction commits,
+    so a concurrent reader cannot re-cache the pre-commit state.
+    """
+    if updated_at is None:
+        updated_at = StartupProfile.objects.filter(pk=pk).values_list('updated_at', flat=True).first()
+        if updated_at is None:
+            return
+
+    key = profile_cache_key(pk, updated_at)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+def invalidate_profile_caches(pks):
+    """invalidate_profile_cache() for many startups, reading their stamps in one query."""
+    keys = [
+        profile_cache_key(pk, updated_at)
+        for pk, updated_at in StartupProfile.objects.filter(pk__in=pks).values_list('pk', 'updated_at')
+    ]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,102 @@
+"""
+Fast read-only rendering for the hot public startup endpoints.
+
+StartupPublicProfileFastSerializer produces exactly the same data as
+StartupPublicProfileSerializer (and therefore byte-identical JSON), but works
+on `.values()` rows with converters compiled once per serializer instead of
+building model instances and walking DRF field objects for every row.
+Tags are loaded for all rows in one query.
+
+`benchmark_startup_serializers` measures both paths and checks they match.
+"""
+import functools
+
+from rest_framework import serializers
+
+from apps.common.images import srcset_from_variants
+from .models import StartupProfile, StartupTag
+from .serializers import StartupPublicProfileSerializer
+
+
+class StartupPublicProfileFastSerializer:
+    """Renders `.values()` rows of StartupProfile for the requested fieldset."""
+
+    serializer_class = StartupPublicProfileSerializer
+
+    def __init__(self, request=None, field_names=None):
+        self.request = request
+        if field_names is None:
+            field_names = self.serializer_class.get_requested_fields(request)
+        self.field_names = list(field_names)
+        self.columns = self.serializer_class.get_model_fields(self.field_names)
+        if 'tags' in self.field_names and 'id' not in self.columns:
+            self.columns.append('id')
+        self.logo_storage = StartupProfile._meta.get_field('logo').storage
+        self.converters = [(name, self.compile_converter(name)) for name in self.field_names]
+
+    def compile_converter(self, name):
+        """Return a row -> value function for one output field."""
+        if name == 'logo_url':
+            return self.convert_logo_url
+        if name == 'logo_srcset':
+            return self.convert_logo_srcset
+        if name == 'tags':
+            return lambda row: self.tags.get(row['id'], [])
+
+        return self.get_value_converter(name)
+
+    @classmethod
+    @functools.cache
+    def get_value_converter(cls, name):
+        """Converter for a plain model-backed field, built once per process."""
+        field = cls.serializer_class().fields[name]
+        if isinstance(field, serializers.CharField):
+            # Same cast as CharField.to_representation (rows may hold e.g. PhoneNumber objects).
+            to_representation = str
+        elif isinstance(field, serializers.IntegerField):
+            to_representation = int
+        else:
+            # Bound once; keeps DRF's exact formatting (e.g. timezone handling of datetimes).
+            to_representation = field.to_representation
+
+        def convert(row):
+            value = row[name]
+            return None if value is None else to_representation(value)
+
+        return convert
+
+    def absolute_url(self, url):
+        return self.request.build_absolute_uri(url) if self.request else url
+
+    def convert_logo_url(self, row):
+        if row['logo']:
+            return self.absolute_url(self.logo_storage.url(row['logo']))
+        return None
+
+    def convert_logo_srcset(self, row):
+        srcset = srcset_from_variants(self.logo_storage, row['logo'], row['logo_variants'])
+        return {width: self.absolute_url(url) for width, url in srcset.items()}
+
+    def project(self, queryset, *extra_columns):
+        """
+        Turn a StartupProfile queryset into a `.values()` queryset reading only the
+        needed columns, plus any the caller relies on (e.g. pagination keys).
+        """
+        columns = list(dict.fromkeys([*self.columns, *extra_columns]))
+        return queryset.prefetch_related(None).values(*columns)
+
+    def load_tags(self, rows):
+        self.tags = {}
+        if 'tags' not in self.field_names or not rows:
+            return
+        links = StartupTag.objects.filter(startup_id__in=[row['id'] for row in rows]).values_list(
+            'startup_id', 'tag__name'
+        )
+        for startup_id, name in links:
+            self.tags.setdefault(startup_id, []).append(name)
+
+    def serialize(self, rows):
+        rows = list(rows)
+        self.load_tags(rows)
+        converters = self.converters
+        return [{name: convert(row) for name, convert in converters} for row in rows]
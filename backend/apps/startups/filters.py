@@ -0,0 +1,54 @@
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Lower
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+from apps.common.utils import split_comma_list
+from .models import StartupTag, Tag
+
+
+class StartupProfileFilterBackend(BaseFilterBackend):
+    """
+    Exact-match filters for the public startup listing.
+
+    Every supported filter has a composite index with the listing order
+    (see StartupProfile.Meta.indexes), so filtered pages stay index scans.
+    `tag` (repeatable or comma-separated) matches startups having any of the
+    tags, through the (tag, startup) index on StartupTag.
+    """
+    string_filters = ('city', 'audit_status')
+    integer_filters = ('team_size', 'founded_year')
+
+    def filter_queryset(self, request, queryset, view):
+        params = request.query_params
+        filters = {}
+
+        for name in self.string_filters:
+            value = params.get(name)
+            if value:
+                filters[name] = value
+
+        for name in self.integer_filters:
+            value = params.get(name)
+            if value in (None, ''):
+                continue
+            try:
+                filters[name] = int(value)
+            except ValueError:
+                raise ValidationError({name: 'A valid integer is required.'})
+
+        queryset = queryset.filter(**filters)
+
+        tag_names = split_comma_list(','.join(params.getlist('tag')))
+        if tag_names:
+            tag_ids = list(
+                Tag.objects
+                .annotate(lower_name=Lower('name'))
+                .filter(lower_name__in=[name.lower() for name in tag_names])
+                .values_list('id', flat=True)
+            )
+            queryset = queryset.filter(
+                Exists(StartupTag.objects.filter(startup=OuterRef('pk'), tag_id__in=tag_ids))
+            )
+
+        return queryset
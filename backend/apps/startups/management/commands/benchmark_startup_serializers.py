@@ -0,0 +1,121 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+
+from apps.startups.fast_serializers import StartupPublicProfileFastSerializer
+from apps.startups.models import StartupProfile, StartupTag, Tag
+from apps.startups.serializers import StartupPublicProfileSerializer
+from apps.startups.views import StartupPublicProfileViewSet
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    """Django command to compare the DRF and fast-path startup serializers."""
+
+    help = (
+        'Render N generated startup profiles with StartupPublicProfileSerializer and '
+        'StartupPublicProfileFastSerializer, check the JSON is identical and report the speedup. '
+        'All generated rows are rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1, 100, 10000])
+        parser.add_argument('--repeat', type=int, default=3, help='Best of N runs per size.')
+        parser.add_argument(
+            '--min-speedup', type=float, default=None,
+            help='Fail if the fast path is slower than this factor at the largest size.',
+        )
+
+    def handle(self, *args, **options):
+        self.results = []
+        try:
+            with transaction.atomic():
+                self.run(options['sizes'], options['repeat'])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        min_speedup = options['min_speedup']
+        if min_speedup is not None and self.results:
+            size, speedup = self.results[-1]
+            if speedup < min_speedup:
+                raise CommandError(f'Speedup at {size} objects is {speedup:.2f}x, expected at least {min_speedup}x.')
+
+    def run(self, sizes, repeat):
+        self.seed(max(sizes))
+        request = Request(RequestFactory().get('/api/startups/startups/'))
+        base_queryset = StartupPublicProfileViewSet.queryset.order_by('-created_at', '-id')
+        renderer = JSONRenderer()
+
+        for size in sorted(sizes):
+            def render_drf():
+                queryset = base_queryset.all()[:size]
+                serializer = StartupPublicProfileSerializer(queryset, many=True, context={'request': request})
+                return renderer.render(serializer.data)
+
+            def render_fast():
+                fast_serializer = StartupPublicProfileFastSerializer(request)
+                rows = fast_serializer.project(base_queryset.all())[:size]
+                return renderer.render(fast_serializer.serialize(rows))
+
+            drf_seconds, drf_output = self.measure(render_drf, repeat)
+            fast_seconds, fast_output = self.measure(render_fast, repeat)
+            if drf_output != fast_output:
+                raise CommandError(f'Fast serializer output differs from the DRF serializer at {size} objects.')
+
+            speedup = drf_seconds / fast_seconds if fast_seconds else float('inf')
+            self.results.append((size, speedup))
+            self.stdout.write(
+                f'{size:>6} objects: drf {drf_seconds * 1000:9.2f} ms '
+                f'({size / drf_seconds:,.0f} obj/s), fast {fast_seconds * 1000:9.2f} ms '
+                f'({size / fast_seconds:,.0f} obj/s), speedup {speedup:.2f}x'
+            )
+
+    @staticmethod
+    def measure(func, repeat):
+        best, output = None, None
+        for _ in range(max(repeat, 1)):
+            started = time.perf_counter()
+            output = func()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best, output
+
+    def seed(self, count):
+        user = get_user_model().objects.create_user(
+            email='benchmark-startups@example.com', password='benchmark',
+            first_name='Benchmark', last_name='User',
+        )
+        tags = [Tag.objects.create(name=f'benchmark-tag-{index}') for index in range(5)]
+        startups = StartupProfile.objects.bulk_create([
+            StartupProfile(
+                user=user,
+                company_name=f'Benchmark Startup {index}',
+                description='Generated for the serializer benchmark.',
+                founded_year=2000 + index % 25,
+                team_size=1 + index % 50,
+                website=f'https://startup{index}.example.com',
+                email=f'startup{index}@example.com',
+                phone='+380501234567',
+                city='Kyiv',
+                address='Benchmark street 1',
+                postal_code='01001',
+                logo=f'media/startup_logos/benchmark_{index}.png' if index % 2 else '',
+                partners_brands='',
+                audit_status='approved',
+            )
+            for index in range(count)
+        ], batch_size=1000)
+        StartupTag.objects.bulk_create([
+            StartupTag(startup=startup, tag=tags[(startup.pk + offset) % len(tags)], position=offset)
+            for startup in startups
+            for offset in range(startup.pk % 3)
+        ], batch_size=1000)
@@ -0,0 +1,172 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import models, transaction
+from django.dispatch import Signal
+from django.db.models import Case, Count, F, FilteredRelation, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce, Greatest, Now
+
+from apps.common.managers import CaseInsensitiveNameQuerySet
+
+# Set while a bulk SavedStartup path maintains the counters itself, so the
+# per-row post_delete receiver does not apply the same change a second time.
+_followers_counter_managed = ContextVar('followers_counter_managed', default=False)
+
+
+# Sent by the SavedStartup bulk paths, which bypass per-row signals, with `investor_ids`.
+saved_startups_bulk_changed = Signal()
+
+
+def followers_counter_managed():
+    return _followers_counter_managed.get()
+
+
+@contextmanager
+def manage_followers_counter():
+    token = _followers_counter_managed.set(True)
+    try:
+        yield
+    finally:
+        _followers_counter_managed.reset(token)
+
+
+class StartupProfileQuerySet(models.QuerySet):
+    """QuerySet helpers for the denormalized followers counter."""
+
+    def adjust_followers_count(self, deltas):
+        """
+        Apply {startup_id: delta} to the stored counters in a single UPDATE.
+
+        Counters are clamped at zero; drift is repaired by reconcile_followers_count.
+        """
+        deltas = {pk: delta for pk, delta in deltas.items() if delta}
+        if not deltas:
+            return 0
+
+        return self.filter(pk__in=deltas).update(
+            followers_count=Greatest(
+                F('followers_count') + Case(
+                    *[When(pk=pk, then=Value(delta)) for pk, delta in deltas.items()],
+                    default=Value(0),
+                    output_field=models.IntegerField(),
+                ),
+                Value(0),
+            ),
+            updated_at=Now(),
+        )
+
+    def followers_subquery(self):
+        saved_startup = self.model._meta.get_field('savedstartup').related_model
+        return Coalesce(
+            Subquery(
+                saved_startup.objects
+                .filter(startup=OuterRef('pk'))
+                .order_by()
+                .values('startup')
+                .annotate(total=Count('id'))
+                .values('total')
+            ),
+            0,
+        )
+
+    def sync_followers_count(self):
+        """Recount the stored counters of the selected startups from SavedStartup."""
+        return self.update(followers_count=self.followers_subquery(), updated_at=Now())
+
+
+PIPELINE_EXPORT_COLUMNS = (
+    'saved_at', 'startup_id', 'company_name', 'city', 'website', 'notes',
+    'project_id', 'project_title', 'project_status', 'target_amount', 'raised_amount', 'currency',
+)
+
+
+class SavedStartupQuerySet(models.QuerySet):
+    """
+    Keeps StartupProfile.followers_count (and the cached public profiles) in step
+    on bulk paths, which do not send per-row signals (bulk_create) or would send
+    one per row (delete, bulk_delete).
+    """
+
+    def _startups(self):
+        return self.model._meta.get_field('startup').related_model.objects
+
+    def _followers_deltas(self):
+        return {
+            startup_id: -total
+            for startup_id, total in self.order_by().values_list('startup_id').annotate(total=Count('id'))
+        }
+
+    def bulk_create(self, objs, *args, **kwargs):
+        from .cache import invalidate_profile_caches
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            startup_ids = {obj.startup_id for obj in objs}
+            if kwargs.get('ignore_conflicts') or kwargs.get('update_conflicts'):
+                # Rows skipped on conflict can't be told apart from inserted ones.
+                self._startups().filter(pk__in=startup_ids).sync_followers_count()
+            else:
+                self._startups().adjust_followers_count(Counter(obj.startup_id for obj in objs))
+            invalidate_profile_caches(startup_ids)
+            saved_startups_bulk_changed.send(sender=self.model, investor_ids={obj.investor_id for obj in objs})
+        return objs
+
+    def delete(self):
+        with transaction.atomic(using=self.db, savepoint=False):
+            deltas = self._followers_deltas()
+            with manage_followers_counter():
+                result = super().delete()
+            self._startups().adjust_followers_count(deltas)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def bulk_delete(self):
+        """
+        Delete the selected rows and return how many were removed. delete() reads
+        them in one SELECT, removes them with a single DELETE and adjusts
+        followers_count once per startup; the per-row signals only queue cache
+        invalidations.
+        """
+        deleted, _ = self.delete()
+        return deleted
+
+    bulk_delete.alters_data = True
+    bulk_delete.queryset_only = True
+
+    def pipeline_rows(self):
+        """
+        Flat rows for exports: one per (saved startup, public non-draft project),
+        or a single row with empty project columns when the startup has none.
+        Keys are the PIPELINE_EXPORT_COLUMNS names.
+        """
+        return (
+            self
+            .alias(listed_project=FilteredRelation(
+                'startup__project',
+                condition=Q(startup__project__visibility='public') & ~Q(startup__project__status='draft'),
+            ))
+            .order_by('-created_at', '-id', 'listed_project__id')
+            .values(
+                'startup_id',
+                'notes',
+                saved_at=F('created_at'),
+                company_name=F('startup__company_name'),
+                city=F('startup__city'),
+                website=F('startup__website'),
+                project_id=F('listed_project__id'),
+                project_title=F('listed_project__title'),
+                project_status=F('listed_project__status'),
+                target_amount=F('listed_project__target_amount'),
+                raised_amount=F('listed_project__raised_amount'),
+                currency=F('listed_project__currency'),
+            )
+        )
+
+
+class TagQuerySet(CaseInsensitiveNameQuerySet):
+    def adjust_startups_count(self, delta):
+        """Add delta to the precomputed facet count of the selected tags."""
+        return self.update(startups_count=Greatest(F('startups_count') + delta, Value(0)))
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:34
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('startups', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='startupprofile',
+            index=models.Index(fields=['-created_at', '-id'], name='startup_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='startupprofile',
+            index=models.Index(fields=['city', '-created_at', '-id'], name='startup_city_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='startupprofile',
+            index=models.Index(fields=['team_size', '-created_at', '-id'], name='startup_team_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='startupprofile',
+            index=models.Index(fields=['founded_year', '-created_at', '-id'], name='startup_founded_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='startupprofile',
+            index=models.Index(fields=['audit_status', '-created_at', '-id'], name='startup_audit_created_idx'),
+        ),
+    ]
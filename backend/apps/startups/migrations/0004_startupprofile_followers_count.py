@@ -0,0 +1,35 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:35
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_followers_count(apps, schema_editor):
+    StartupProfile = apps.get_model('startups', 'StartupProfile')
+    SavedStartup = apps.get_model('startups', 'SavedStartup')
+    followers = (
+        SavedStartup.objects
+        .filter(startup=OuterRef('pk'))
+        .order_by()
+        .values('startup')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    StartupProfile.objects.update(followers_count=Coalesce(Subquery(followers), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('startups', '0003_startupprofile_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='startupprofile',
+            name='followers_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_followers_count, migrations.RunPython.noop),
+    ]
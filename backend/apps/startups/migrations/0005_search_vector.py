@@ -0,0 +1,51 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:38
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+
+SEARCH_VECTOR_TRIGGER_SQL = """
+CREATE FUNCTION startups_startupprofile_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.company_name, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER startupprofile_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF company_name, description
+    ON startups_startupprofile
+    FOR EACH ROW EXECUTE FUNCTION startups_startupprofile_search_vector_update();
+
+UPDATE startups_startupprofile SET company_name = company_name;
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS startupprofile_search_vector_trigger ON startups_startupprofile;
+DROP FUNCTION IF EXISTS startups_startupprofile_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('startups', '0004_startupprofile_followers_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='startupprofile',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='startupprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='startup_search_vector_idx'),
+        ),
+        migrations.RunSQL(SEARCH_VECTOR_TRIGGER_SQL, DROP_SEARCH_VECTOR_TRIGGER_SQL),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 5.2.7 on 2026-10-18 11:39
+
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('startups', '0005_search_vector'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('startups_count', models.PositiveIntegerField(default=0, editable=False)),
+            ],
+            options={
+                'verbose_name': 'Tag',
+                'verbose_name_plural': 'Tags',
+                'constraints': [models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='startup_tag_name_ci_unique')],
+            },
+        ),
+        migrations.CreateModel(
+            name='StartupTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField(default=0)),
+                ('startup', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='startup_tags', to='startups.startupprofile')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='startup_tags', to='startups.tag')),
+            ],
+            options={
+                'verbose_name': 'Startup Tag',
+                'verbose_name_plural': 'Startup Tags',
+                'ordering': ['position', 'id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='startupprofile',
+            name='tags',
+            field=models.ManyToManyField(blank=True, related_name='startups', through='startups.StartupTag', to='startups.tag'),
+        ),
+        migrations.AddIndex(
+            model_name='startuptag',
+            index=models.Index(fields=['tag', 'startup'], name='startuptag_tag_startup_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='startuptag',
+            constraint=models.UniqueConstraint(fields=('startup', 'tag'), name='startup_tag_unique'),
+        ),
+    ]
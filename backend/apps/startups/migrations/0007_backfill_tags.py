@@ -0,0 +1,52 @@
+from django.db import migrations
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from apps.common.utils import split_comma_list
+
+BATCH_SIZE = 1000
+
+
+def backfill_tags(apps, schema_editor):
+    StartupProfile = apps.get_model('startups', 'StartupProfile')
+    StartupTag = apps.get_model('startups', 'StartupTag')
+    Tag = apps.get_model('startups', 'Tag')
+
+    max_length = Tag._meta.get_field('name').max_length
+    tag_ids = {tag.name.lower(): tag.id for tag in Tag.objects.all()}
+    links = []
+
+    profiles = StartupProfile.objects.values_list('id', 'partners_brands').order_by('id')
+    for startup_id, partners_brands in profiles.iterator(chunk_size=BATCH_SIZE):
+        for position, name in enumerate(split_comma_list(partners_brands, max_length)):
+            key = name.lower()
+            if key not in tag_ids:
+                tag_ids[key] = Tag.objects.create(name=name).id
+            links.append(StartupTag(startup_id=startup_id, tag_id=tag_ids[key], position=position))
+
+        if len(links) >= BATCH_SIZE:
+            StartupTag.objects.bulk_create(links, ignore_conflicts=True)
+            links = []
+
+    StartupTag.objects.bulk_create(links, ignore_conflicts=True)
+
+    startups_count = (
+        StartupTag.objects
+        .filter(tag=OuterRef('pk'))
+        .order_by()
+        .values('tag')
+        .annotate(total=Count('id'))
+        .values('total')
+    )
+    Tag.objects.update(startups_count=Coalesce(Subquery(startups_count), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('startups', '0006_tags'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_tags, migrations.RunPython.noop),
+    ]
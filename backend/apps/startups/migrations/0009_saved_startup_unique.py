@@ -0,0 +1,65 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:10
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count, Min, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def remove_duplicate_saved_startups(apps, schema_editor):
+    """Keep the oldest row of every (investor, startup) pair and recount the affected startups."""
+    StartupProfile = apps.get_model('startups', 'StartupProfile')
+    SavedStartup = apps.get_model('startups', 'SavedStartup')
+
+    duplicates = (
+        SavedStartup.objects
+        .order_by()
+        .values('investor_id', 'startup_id')
+        .annotate(total=Count('id'), keep=Min('id'))
+        .filter(total__gt=1)
+    )
+    startup_ids = set()
+    for pair in duplicates:
+        SavedStartup.objects.filter(
+            investor_id=pair['investor_id'], startup_id=pair['startup_id']
+        ).exclude(id=pair['keep']).delete()
+        startup_ids.add(pair['startup_id'])
+
+    if startup_ids:
+        followers = (
+            SavedStartup.objects
+            .filter(startup=OuterRef('pk'))
+            .order_by()
+            .values('startup')
+            .annotate(total=Count('id'))
+            .values('total')
+        )
+        StartupProfile.objects.filter(pk__in=startup_ids).update(
+            followers_count=Coalesce(Subquery(followers), 0)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0003_logo_variants'),
+        ('startups', '0008_logo_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='savedstartup',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(remove_duplicate_saved_startups, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='savedstartup',
+            constraint=models.UniqueConstraint(fields=('investor', 'startup'), name='saved_startup_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='savedstartup',
+            index=models.Index(fields=['investor', '-created_at', '-id'], name='saved_startup_investor_idx'),
+        ),
+    ]
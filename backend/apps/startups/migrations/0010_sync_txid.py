@@ -0,0 +1,45 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+SYNC_TXID_TRIGGER_SQL = """
+CREATE FUNCTION startups_startupprofile_sync_txid_update() RETURNS trigger AS $$
+BEGIN
+    NEW.sync_txid := txid_current();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER startupprofile_sync_txid_trigger
+    BEFORE INSERT OR UPDATE
+    ON startups_startupprofile
+    FOR EACH ROW EXECUTE FUNCTION startups_startupprofile_sync_txid_update();
+"""
+
+DROP_SYNC_TXID_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS startupprofile_sync_txid_trigger ON startups_startupprofile;
+DROP FUNCTION IF EXISTS startups_startupprofile_sync_txid_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('startups', '0009_saved_startup_unique'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='startupprofile',
+            name='sync_txid',
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='startupprofile',
+            index=models.Index(fields=['sync_txid', 'id'], name='startup_sync_txid_idx'),
+        ),
+        migrations.RunSQL(SYNC_TXID_TRIGGER_SQL, DROP_SYNC_TXID_TRIGGER_SQL),
+    ]
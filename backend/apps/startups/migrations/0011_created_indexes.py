@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0007_unread_notifications_count'),
+        ('startups', '0010_sync_txid'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='savedstartup',
+            index=models.Index(fields=['created_at'], include=('startup',), name='saved_startup_created_idx'),
+        ),
+    ]
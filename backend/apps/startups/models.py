@@ -1,9 +1,33 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models.functions import Lower
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.contrib.auth import get_user_model
 from apps.investors.models import InvestorProfile
+from apps.common.managers import sync_name_links
+from .managers import StartupProfileQuerySet, SavedStartupQuerySet, TagQuerySet
 
 User = get_user_model()
 
+
+class Tag(models.Model):
+    name = models.CharField(max_length=100)
+    # Number of startups carrying the tag, updated incrementally by StartupProfile.sync_tags().
+    startups_count = models.PositiveIntegerField(default=0, editable=False)
+
+    objects = TagQuerySet.as_manager()
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        verbose_name = "Tag"
+        verbose_name_plural = "Tags"
+        constraints = [
+            models.UniqueConstraint(Lower('name'), name='startup_tag_name_ci_unique'),
+        ]
+
+
 class StartupProfile(models.Model):
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     company_name = models.CharField(max_length=255)
@@ -18,23 +42,79 @@ class StartupProfile(models.Model):
     postal_code = models.CharField(max_length=20)
     # We need to craete media folder and set MEDIA_URL and MEDIA_ROOT in settings.py
     logo = models.ImageField(upload_to='media/startup_logos/')
+    # WebP variants of `logo`, generated in the background: {'source': logo name, 'webp': {width: name}}
+    logo_variants = models.JSONField(default=dict, blank=True, editable=False)
     partners_brands = models.TextField()
+    tags = models.ManyToManyField(Tag, through='StartupTag', related_name='startups', blank=True)
     audit_status = models.CharField(max_length=100)
+    # Denormalized count of SavedStartup rows, kept in step by signals and SavedStartupQuerySet.
+    followers_count = models.PositiveIntegerField(default=0, editable=False)
+    # Weighted company_name (A) + description (B), maintained by a database trigger.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # Id of the transaction that last wrote the row, stamped by a database trigger for the change feed (apps.sync).
+    sync_txid = models.BigIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = StartupProfileQuerySet.as_manager()
+
     def __str__(self):
         return self.company_name
+
+    def sync_tags(self):
+        """
+        Mirror the comma-separated partners_brands into the normalized tag relation,
+        keeping Tag.startups_count in step with added and removed links.
+        """
+        with transaction.atomic():
+            added, removed = sync_name_links(self.startup_tags, self.partners_brands, 'tag')
+            if removed:
+                Tag.objects.filter(pk__in=removed).adjust_startups_count(-1)
+            if added:
+                Tag.objects.filter(pk__in=added).adjust_startups_count(1)
     
     class Meta:
         verbose_name = "Startup Profile"
         verbose_name_plural = "Startup Profiles"
+        # Composite indexes for the keyset-paginated listing, ordered by (created_at, id).
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='startup_created_id_idx'),
+            models.Index(fields=['city', '-created_at', '-id'], name='startup_city_created_idx'),
+            models.Index(fields=['team_size', '-created_at', '-id'], name='startup_team_created_idx'),
+            models.Index(fields=['founded_year', '-created_at', '-id'], name='startup_founded_created_idx'),
+            models.Index(fields=['audit_status', '-created_at', '-id'], name='startup_audit_created_idx'),
+            # Change feed (apps.sync), read in (sync_txid, id) order.
+            models.Index(fields=['sync_txid', 'id'], name='startup_sync_txid_idx'),
+            GinIndex(fields=['search_vector'], name='startup_search_vector_idx'),
+        ]
+
+
+class StartupTag(models.Model):
+    startup = models.ForeignKey(StartupProfile, on_delete=models.CASCADE, related_name='startup_tags')
+    tag = models.ForeignKey(Tag, on_delete=models.CASCADE, related_name='startup_tags')
+    # Keeps tags in the order they were entered in partners_brands.
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Startup Tag"
+        verbose_name_plural = "Startup Tags"
+        ordering = ['position', 'id']
+        constraints = [
+            models.UniqueConstraint(fields=['startup', 'tag'], name='startup_tag_unique'),
+        ]
+        # Serves tag filtering: "startups having tag X" without touching startup rows first.
+        indexes = [
+            models.Index(fields=['tag', 'startup'], name='startuptag_tag_startup_idx'),
+        ]
 
 
 class SavedStartup(models.Model):
     investor = models.ForeignKey(InvestorProfile, on_delete=models.CASCADE)
     startup = models.ForeignKey(StartupProfile, on_delete=models.CASCADE)
     notes = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = SavedStartupQuerySet.as_manager()
 
     def __str__(self):
         return f'Saved {self.startup.company_name} by {self.investor.company_name}'
@@ -42,3 +122,12 @@ class SavedStartup(models.Model):
     class Meta:
         verbose_name = "Saved Startup"
         verbose_name_plural = "Saved Startups"
+        constraints = [
+            models.UniqueConstraint(fields=['investor', 'startup'], name='saved_startup_unique'),
+        ]
+        indexes = [
+            # An investor's saved list, newest first.
+            models.Index(fields=['investor', '-created_at', '-id'], name='saved_startup_investor_idx'),
+            # New followers per startup for the trending ranking (apps.trending).
+            models.Index(fields=['created_at'], include=['startup'], name='saved_startup_created_idx'),
+        ]
@@ -1,11 +1,21 @@
 from rest_framework import serializers
-from .models import StartupProfile
+from apps.common.images import logo_srcset
+from apps.common.serializers import SparseFieldsetsMixin
+from .models import SavedStartup, StartupProfile, Tag
 
-class StartupPublicProfileSerializer(serializers.ModelSerializer):
+
+class StartupPublicProfileSerializer(SparseFieldsetsMixin, serializers.ModelSerializer):
     logo_url = serializers.SerializerMethodField()
+    logo_srcset = serializers.SerializerMethodField()
     tags = serializers.SerializerMethodField()
     followers_count = serializers.IntegerField(read_only=True)
 
+    model_field_sources = {
+        'logo_url': ('logo',),
+        'logo_srcset': ('logo', 'logo_variants'),
+        'tags': (),  # prefetched startup_tags
+    }
+
     class Meta:
         model = StartupProfile
         fields = [
@@ -19,6 +29,7 @@ class StartupPublicProfileSerializer(serializers.ModelSerializer):
             'phone',
             'city',
             'logo_url',
+            'logo_srcset',
             'tags',
             'followers_count',
             'created_at',
@@ -27,10 +38,53 @@ class StartupPublicProfileSerializer(serializers.ModelSerializer):
     def get_logo_url(self, obj):
         request = self.context.get('request')
         if obj.logo and hasattr(obj.logo, 'url'):
-            return request.build_absolute_uri(obj.logo.url)
+            # Without a request (e.g. when caching) the URL stays relative; see absolutize_urls().
+            return request.build_absolute_uri(obj.logo.url) if request else obj.logo.url
         return None
 
+    def get_logo_srcset(self, obj):
+        request = self.context.get('request')
+        srcset = logo_srcset(obj)
+        if request:
+            return {width: request.build_absolute_uri(url) for width, url in srcset.items()}
+        return srcset
+
     def get_tags(self, obj):
-        if obj.partners_brands:
-            return [tag.strip() for tag in obj.partners_brands.split(',') if tag.strip()]
-        return []
\ No newline at end of file
+        return [link.tag.name for link in obj.startup_tags.all()]
+
+    @staticmethod
+    def absolutize_urls(data, request):
+        """Turn the relative URLs of a request-less representation into absolute ones."""
+        data = dict(data)
+        if data.get('logo_url'):
+            data['logo_url'] = request.build_absolute_uri(data['logo_url'])
+        if data.get('logo_srcset'):
+            data['logo_srcset'] = {
+                width: request.build_absolute_uri(url) for width, url in data['logo_srcset'].items()
+            }
+        return data
+
+
+class TagFacetSerializer(serializers.ModelSerializer):
+    count = serializers.IntegerField(source='startups_count', read_only=True)
+
+    class Meta:
+        model = Tag
+        fields = ['id', 'name', 'count']
+
+
+class SavedStartupSerializer(serializers.ModelSerializer):
+    startup_id = serializers.IntegerField(read_only=True)
+    company_name = serializers.CharField(source='startup.company_name', read_only=True)
+    city = serializers.CharField(source='startup.city', read_only=True)
+
+    class Meta:
+        model = SavedStartup
+        fields = ['startup_id', 'company_name', 'city', 'notes', 'created_at']
+
+
+class StartupIdsSerializer(serializers.Serializer):
+    startup_ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=300)
+
+    def validate_startup_ids(self, value):
+        return list(dict.fromkeys(value))
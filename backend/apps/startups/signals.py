@@ -0,0 +1,51 @@
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from apps.common.images import generate_logo_variants, logo_variants_outdated
+from apps.common.tasks import run_in_background
+from .cache import invalidate_profile_cache
+from .managers import followers_counter_managed
+from .models import SavedStartup, StartupProfile, Tag
+
+
+@receiver(post_save, sender=SavedStartup)
+def increment_followers_count(sender, instance, created, **kwargs):
+    if created:
+        StartupProfile.objects.adjust_followers_count({instance.startup_id: 1})
+
+
+@receiver(post_delete, sender=SavedStartup)
+def decrement_followers_count(sender, instance, **kwargs):
+    if not followers_counter_managed():
+        StartupProfile.objects.adjust_followers_count({instance.startup_id: -1})
+
+
+@receiver(post_save, sender=StartupProfile)
+def sync_startup_tags(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or 'partners_brands' in update_fields:
+        instance.sync_tags()
+
+
+@receiver(pre_delete, sender=StartupProfile)
+def release_startup_tags(sender, instance, **kwargs):
+    Tag.objects.filter(startup_tags__startup=instance).adjust_startups_count(-1)
+
+
+@receiver(post_save, sender=StartupProfile)
+@receiver(post_delete, sender=StartupProfile)
+def invalidate_cached_profile(sender, instance, **kwargs):
+    invalidate_profile_cache(instance.pk, instance.updated_at)
+
+
+@receiver(post_save, sender=SavedStartup)
+@receiver(post_delete, sender=SavedStartup)
+def invalidate_cached_followed_profile(sender, instance, **kwargs):
+    # A managed counter update bumps updated_at, which already retires the cached payload.
+    if not followers_counter_managed():
+        invalidate_profile_cache(instance.startup_id)
+
+
+@receiver(post_save, sender=StartupProfile)
+def schedule_logo_variants(sender, instance, **kwargs):
+    if logo_variants_outdated(instance):
+        run_in_background(generate_logo_variants, StartupProfile, instance.pk, 'media/startup_logos/variants')
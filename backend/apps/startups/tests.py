@@ -1,16 +1,36 @@
 from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.db import IntegrityError, connection, transaction
+from PIL import Image
+import shutil
+import tempfile
 from django.test import TestCase
-from apps.startups.models import StartupProfile, SavedStartup
-from apps.users.models import User
 from apps.investors.models import InvestorProfile
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
-from .models import StartupProfile
+from .models import SavedStartup, StartupProfile, StartupTag, Tag
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from io import BytesIO, StringIO
+import csv
+import json
+from apps.projects.models import Project
+import threading
+from apps.common.cache import get_or_set_coalesced
+from django.test import RequestFactory
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from .fast_serializers import StartupPublicProfileFastSerializer
+from .serializers import StartupPublicProfileSerializer
+from .views import StartupPublicProfileViewSet
 
 User = get_user_model()
 
+
 class StartupProfileModelTest(TestCase):
     """Unit tests for the StartupProfile model"""
 
@@ -175,6 +195,7 @@ class SavedStartupModelTest(TestCase):
 
 class StartupPublicProfileAPITest(APITestCase):
     def setUp(self):
+        cache.clear()
         self.user1 = User.objects.create_user(
             email='user1@example.com',
             password='password123',
@@ -250,7 +271,7 @@ class StartupPublicProfileAPITest(APITestCase):
         
         expected_keys = [
             'id', 'company_name', 'description', 'founded_year', 'team_size',
-            'website', 'email', 'phone', 'city', 'logo_url', 'tags',
+            'website', 'email', 'phone', 'city', 'logo_url', 'logo_srcset', 'tags',
             'followers_count', 'created_at'
         ]
         
@@ -263,4 +284,900 @@ class StartupPublicProfileAPITest(APITestCase):
         """
         url = reverse('startup-detail', kwargs={'id': 999})
         response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class StartupPublicProfileListAPITest(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email='lister@example.com',
+            password='password123',
+            first_name='List',
+            last_name='User'
+        )
+        self.startups = [
+            StartupProfile.objects.create(
+                user=self.user,
+                company_name=f"Startup {i}",
+                description="Listed startup.",
+                founded_year=2020 + i % 2,
+                team_size=5 if i % 2 else 10,
+                website=f"http://startup{i}.com",
+                email=f"startup{i}@example.com",
+                phone="1111111111",
+                city="Kyiv" if i < 3 else "Lviv",
+                partners_brands="tech",
+                audit_status="approved" if i % 2 else "pending"
+            )
+            for i in range(5)
+        ]
+        self.url = reverse('startup-list')
+
+    def test_list_is_ordered_newest_first(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        ids = [item['id'] for item in response.data['results']]
+        self.assertEqual(ids, [startup.id for startup in reversed(self.startups)])
+        self.assertIsNone(response.data['next'])
+
+    def test_cursor_pagination_walks_all_pages(self):
+        seen = []
+        url = f'{self.url}?page_size=2'
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data['results']), 2)
+            seen.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+
+        self.assertEqual(seen, [startup.id for startup in reversed(self.startups)])
+
+    def test_cursor_handles_equal_created_at(self):
+        created_at = self.startups[0].created_at
+        StartupProfile.objects.update(created_at=created_at)
+
+        first = self.client.get(f'{self.url}?page_size=3')
+        second = self.client.get(first.data['next'])
+
+        ids = [item['id'] for item in first.data['results'] + second.data['results']]
+        self.assertEqual(ids, sorted((startup.id for startup in self.startups), reverse=True))
+
+    def test_filters(self):
+        response = self.client.get(self.url, {'city': 'Kyiv', 'audit_status': 'approved'})
+        self.assertEqual(
+            [item['id'] for item in response.data['results']],
+            [self.startups[1].id]
+        )
+
+        response = self.client.get(self.url, {'team_size': 10, 'founded_year': 2020})
+        self.assertCountEqual(
+            [item['id'] for item in response.data['results']],
+            [self.startups[0].id, self.startups[2].id, self.startups[4].id]
+        )
+
+    def test_invalid_filter_and_cursor(self):
+        response = self.client.get(self.url, {'team_size': 'many'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_followers_count_for_page(self):
+        investor_user = User.objects.create_user(
+            email='follower@example.com',
+            password='password123',
+            first_name='Follower',
+            last_name='User'
+        )
+        investor = InvestorProfile.objects.create(
+            user=investor_user,
+            company_name="Follower Fund",
+            full_name="Follower User",
+            description="Fund.",
+            investment_range_min=1000,
+            investment_range_max=2000,
+            preferred_industries="AI",
+            website="https://fund.com",
+            email="fund@example.com",
+            phone="+380441234567",
+            country="Ukraine",
+            city="Kyiv",
+            address="Street 1",
+            postal_code="01001",
+            partners_brands="",
+        )
+        SavedStartup.objects.create(investor=investor, startup=self.startups[4], notes="Follow")
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        counts = {item['id']: item['followers_count'] for item in response.data['results']}
+        self.assertEqual(counts[self.startups[4].id], 1)
+        self.assertEqual(counts[self.startups[0].id], 0)
+
+
+class FollowersCountTest(TestCase):
+    """Tests for the denormalized StartupProfile.followers_count"""
+
+    def setUp(self):
+        owner = User.objects.create_user(
+            email="owner@example.com",
+            password="password123",
+            first_name="Owner",
+            last_name="User"
+        )
+        self.startups = [
+            StartupProfile.objects.create(
+                user=owner,
+                company_name=f"Followed {i}",
+                description="Startup.",
+                founded_year=2021,
+                team_size=3,
+                website="https://followed.com",
+                email=f"followed{i}@example.com",
+                phone="+380501112233",
+                city="Lviv",
+                partners_brands="",
+                audit_status="Approved",
+            )
+            for i in range(2)
+        ]
+        self.investors = []
+        for i in range(3):
+            user = User.objects.create_user(
+                email=f"investor{i}@example.com",
+                password="password123",
+                first_name="Investor",
+                last_name=str(i)
+            )
+            self.investors.append(InvestorProfile.objects.create(
+                user=user,
+                company_name=f"Fund {i}",
+                full_name=f"Investor {i}",
+                description="Fund.",
+                investment_range_min=1000,
+                investment_range_max=2000,
+                preferred_industries="AI",
+                website="https://fund.com",
+                email=f"fund{i}@example.com",
+                phone="+380441234567",
+                country="Ukraine",
+                city="Kyiv",
+                address="Street 1",
+                postal_code="01001",
+                partners_brands="",
+            ))
+
+    def followers(self, startup):
+        startup.refresh_from_db(fields=['followers_count'])
+        return startup.followers_count
+
+    def test_create_and_delete_update_counter(self):
+        saved = SavedStartup.objects.create(investor=self.investors[0], startup=self.startups[0], notes="a")
+        SavedStartup.objects.create(investor=self.investors[1], startup=self.startups[0], notes="b")
+        self.assertEqual(self.followers(self.startups[0]), 2)
+
+        saved.delete()
+        self.assertEqual(self.followers(self.startups[0]), 1)
+        self.assertEqual(self.followers(self.startups[1]), 0)
+
+    def test_counter_changes_touch_updated_at(self):
+        before = self.startups[0].updated_at
+
+        SavedStartup.objects.create(investor=self.investors[0], startup=self.startups[0], notes="")
+        self.startups[0].refresh_from_db(fields=['updated_at'])
+
+        self.assertGreater(self.startups[0].updated_at, before)
+
+    def test_bulk_create_and_queryset_delete_update_counter(self):
+        SavedStartup.objects.bulk_create([
+            SavedStartup(investor=investor, startup=startup, notes="bulk")
+            for investor in self.investors
+            for startup in self.startups
+        ])
+        self.assertEqual(self.followers(self.startups[0]), 3)
+        self.assertEqual(self.followers(self.startups[1]), 3)
+
+        SavedStartup.objects.filter(investor__in=self.investors[:2]).delete()
+        self.assertEqual(self.followers(self.startups[0]), 1)
+        self.assertEqual(self.followers(self.startups[1]), 1)
+
+    def test_cascade_delete_updates_counter(self):
+        SavedStartup.objects.create(investor=self.investors[0], startup=self.startups[0], notes="a")
+        self.investors[0].delete()
+        self.assertEqual(self.followers(self.startups[0]), 0)
+
+    def test_retrieve_reads_stored_counter_without_aggregation(self):
+        cache.clear()
+        SavedStartup.objects.create(investor=self.investors[0], startup=self.startups[0], notes="a")
+        url = reverse('startup-detail', kwargs={'id': self.startups[0].id})
+
+        # updated_at stamp, profile row and the tags prefetch.
+        with self.assertNumQueries(3):
+            response = self.client.get(url)
+
+        self.assertEqual(response.data['followers_count'], 1)
+
+    def test_reconcile_command_repairs_drift(self):
+        SavedStartup.objects.create(investor=self.investors[0], startup=self.startups[0], notes="a")
+        StartupProfile.objects.filter(pk=self.startups[0].pk).update(followers_count=7)
+        StartupProfile.objects.filter(pk=self.startups[1].pk).update(followers_count=2)
+
+        out = StringIO()
+        call_command('reconcile_followers_count', batch_size=1, stdout=out)
+
+        self.assertIn('2 startup(s)', out.getvalue())
+        self.assertEqual(self.followers(self.startups[0]), 1)
+        self.assertEqual(self.followers(self.startups[1]), 0)
+
+
+class StartupTagTest(APITestCase):
+    """Tests for normalized startup tags and tag facets"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            email="tags@example.com",
+            password="password123",
+            first_name="Tag",
+            last_name="User"
+        )
+
+    def create_startup(self, name, partners_brands):
+        return StartupProfile.objects.create(
+            user=self.user,
+            company_name=name,
+            description="Startup.",
+            founded_year=2022,
+            team_size=4,
+            website="https://tagged.com",
+            email=f"{name.lower()}@example.com",
+            phone="+380501112233",
+            city="Kyiv",
+            partners_brands=partners_brands,
+            audit_status="approved",
+        )
+
+    def tag_counts(self):
+        return dict(Tag.objects.values_list('name', 'startups_count'))
+
+    def test_tags_are_synced_from_partners_brands(self):
+        startup = self.create_startup("Alpha", "FinTech, AI, fintech, ")
+        self.create_startup("Beta", "ai, Cloud")
+
+        self.assertEqual(
+            list(startup.startup_tags.values_list('tag__name', flat=True)),
+            ["FinTech", "AI"]
+        )
+        self.assertEqual(self.tag_counts(), {"FinTech": 1, "AI": 2, "Cloud": 1})
+
+    def test_overlong_brand_is_cut_to_tag_length(self):
+        brand = "b" * 101
+        startup = self.create_startup("Alpha", f"ai, {brand}, {brand[:100]}")
+
+        self.assertEqual(
+            list(startup.startup_tags.values_list('tag__name', flat=True)),
+            ["ai", brand[:100]]
+        )
+        self.assertEqual(self.tag_counts(), {"ai": 1, brand[:100]: 1})
+
+    def test_tag_changes_update_counts_incrementally(self):
+        startup = self.create_startup("Alpha", "fintech, ai")
+        startup.partners_brands = "ai, cloud"
+        startup.save()
+
+        self.assertEqual(self.tag_counts(), {"fintech": 0, "ai": 1, "cloud": 1})
+        url = reverse('startup-detail', kwargs={'id': startup.id})
+        self.assertEqual(self.client.get(url).data['tags'], ["ai", "cloud"])
+
+        startup.delete()
+        self.assertEqual(self.tag_counts(), {"fintech": 0, "ai": 0, "cloud": 0})
+        self.assertFalse(StartupTag.objects.exists())
+
+    def test_list_filters_by_any_tag(self):
+        alpha = self.create_startup("Alpha", "fintech, ai")
+        beta = self.create_startup("Beta", "agritech")
+        self.create_startup("Gamma", "cloud")
+
+        response = self.client.get(reverse('startup-list'), {'tag': ['FINTECH', 'agritech']})
+
+        self.assertCountEqual([item['id'] for item in response.data['results']], [alpha.id, beta.id])
+
+        response = self.client.get(reverse('startup-list'), {'tag': 'unknown'})
+        self.assertEqual(response.data['results'], [])
+
+    def test_facet_endpoint_returns_precomputed_counts(self):
+        self.create_startup("Alpha", "fintech, ai")
+        self.create_startup("Beta", "ai")
+        removed = self.create_startup("Gamma", "legacy")
+        removed.delete()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('tag-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [(item['name'], item['count']) for item in response.data],
+            [("ai", 2), ("fintech", 1)]
+        )
+
+
+class StartupProfileCacheTest(APITestCase):
+    """Tests for the read-through cache of the public startup profile"""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(
+            email="cached@example.com",
+            password="password123",
+            first_name="Cached",
+            last_name="User"
+        )
+        self.startup = StartupProfile.objects.create(
+            user=user,
+            company_name="CachedCo",
+            description="Startup.",
+            founded_year=2022,
+            team_size=4,
+            website="https://cached.com",
+            email="cached@example.com",
+            phone="+380501112233",
+            city="Kyiv",
+            logo="media/startup_logos/cached.png",
+            partners_brands="ai",
+            audit_status="approved",
+        )
+        investor_user = User.objects.create_user(
+            email="cache-investor@example.com",
+            password="password123",
+            first_name="Investor",
+            last_name="User"
+        )
+        self.investor = InvestorProfile.objects.create(
+            user=investor_user,
+            company_name="Cache Fund",
+            full_name="Investor User",
+            description="Fund.",
+            investment_range_min=1000,
+            investment_range_max=2000,
+            preferred_industries="AI",
+            website="https://fund.com",
+            email="cache-fund@example.com",
+            phone="+380441234567",
+            country="Ukraine",
+            city="Kyiv",
+            address="Street 1",
+            postal_code="01001",
+            partners_brands="",
+        )
+        self.url = reverse('startup-detail', kwargs={'id': self.startup.id})
+
+    def test_hit_only_reads_updated_at(self):
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(1):
+            second = self.client.get(self.url)
+
+        self.assertEqual(first.data, second.data)
+        self.assertEqual(second.data['logo_url'], 'http://testserver/media/media/startup_logos/cached.png')
+
+    def test_profile_update_is_served_fresh(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.startup.company_name = "RenamedCo"
+            self.startup.save()
+
+        self.assertEqual(self.client.get(self.url).data['company_name'], "RenamedCo")
+
+    def test_saved_startup_changes_invalidate_entry(self):
+        self.client.get(self.url)
+        with self.captureOnCommitCallbacks(execute=True):
+            saved = SavedStartup.objects.create(investor=self.investor, startup=self.startup, notes="a")
+        self.assertEqual(self.client.get(self.url).data['followers_count'], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            saved.delete()
+        self.assertEqual(self.client.get(self.url).data['followers_count'], 0)
+
+    def test_concurrent_misses_are_coalesced(self):
+        calls = []
+        # Another worker holds the recompute lock and publishes the value shortly.
+        cache.add('coalesced:key:lock', 1, 10)
+        publisher = threading.Timer(0.1, lambda: cache.set('coalesced:key', 'fresh', 10))
+        publisher.start()
+
+        value = get_or_set_coalesced('coalesced:key', lambda: calls.append(1) or 'recomputed', timeout=10)
+        publisher.join()
+        self.assertEqual(value, 'fresh')
+        self.assertEqual(calls, [])
+
+        cache.delete('coalesced:key')
+        value = get_or_set_coalesced(
+            'coalesced:key', lambda: calls.append(1) or 'recomputed', timeout=10, wait_timeout=0.1
+        )
+        # The lock holder never finished, so the waiter falls back to computing once.
+        self.assertEqual(value, 'recomputed')
+        self.assertEqual(calls, [1])
+
+    def test_conditional_get_returns_not_modified(self):
+        response = self.client.get(self.url)
+        etag = response['ETag']
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertIn('Last-Modified', response)
+
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified['ETag'], etag)
+
+        not_modified = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_etag_changes_with_followers(self):
+        etag = self.client.get(self.url)['ETag']
+        SavedStartup.objects.create(investor=self.investor, startup=self.startup, notes="a")
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+@override_settings(BACKGROUND_TASKS_EAGER=True)
+class StartupLogoVariantsTest(APITestCase):
+    """Tests for background WebP logo variants"""
+
+    def setUp(self):
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+
+        self.user = User.objects.create_user(
+            email="logo@example.com",
+            password="password123",
+            first_name="Logo",
+            last_name="User"
+        )
+
+    def upload(self, size=(600, 300), color=(200, 30, 30)):
+        buffer = BytesIO()
+        Image.new('RGB', size, color).save(buffer, 'PNG')
+        return SimpleUploadedFile('logo.png', buffer.getvalue(), content_type='image/png')
+
+    def create_startup(self, **extra):
+        with self.captureOnCommitCallbacks(execute=True):
+            return StartupProfile.objects.create(
+                user=self.user,
+                company_name="LogoCo",
+                description="Startup.",
+                founded_year=2022,
+                team_size=4,
+                website="https://logo.com",
+                email="logo@example.com",
+                phone="+380501112233",
+                city="Kyiv",
+                partners_brands="",
+                audit_status="approved",
+                **extra,
+            )
+
+    def test_variants_are_generated_after_upload(self):
+        startup = self.create_startup(logo=self.upload())
+        startup.refresh_from_db()
+
+        self.assertEqual(startup.logo_variants['source'], startup.logo.name)
+        variants = startup.logo_variants['webp']
+        self.assertEqual(sorted(variants, key=int), ['64', '128', '256'])
+        for width, name in variants.items():
+            self.assertRegex(name, rf'^media/startup_logos/variants/[0-9a-f]{{20}}_{width}w\.webp$')
+            with startup.logo.storage.open(name) as variant:
+                image = Image.open(variant)
+                self.assertEqual(image.format, 'WEBP')
+                self.assertEqual(image.size, (int(width), int(width) // 2))
+
+        response = self.client.get(reverse('startup-detail', kwargs={'id': startup.id}))
+        self.assertEqual(
+            response.data['logo_srcset']['128'],
+            f"http://testserver/media/{variants['128']}"
+        )
+
+    def test_identical_uploads_share_variants_and_small_images_are_not_upscaled(self):
+        first = self.create_startup(logo=self.upload(size=(100, 50)))
+        second = self.create_startup(logo=self.upload(size=(100, 50)))
+        first.refresh_from_db()
+        second.refresh_from_db()
+
+        self.assertEqual(first.logo_variants['webp'], second.logo_variants['webp'])
+        with first.logo.storage.open(first.logo_variants['webp']['256']) as variant:
+            self.assertEqual(Image.open(variant).size, (100, 50))
+
+    def test_profiles_without_logo_have_empty_srcset(self):
+        startup = self.create_startup(logo='')
+        startup.refresh_from_db()
+
+        self.assertEqual(startup.logo_variants, {})
+        response = self.client.get(reverse('startup-detail', kwargs={'id': startup.id}))
+        self.assertEqual(response.data['logo_srcset'], {})
+
+
+class StartupBatchAPITest(APITestCase):
+    """Tests for the batch startup profile endpoint"""
+
+    def setUp(self):
+        user = User.objects.create_user(
+            email="batch@example.com",
+            password="password123",
+            first_name="Batch",
+            last_name="User"
+        )
+        self.startups = [
+            StartupProfile.objects.create(
+                user=user,
+                company_name=f"Batch {i}",
+                description="Startup.",
+                founded_year=2022,
+                team_size=4,
+                website="https://batch.com",
+                email=f"batch{i}@example.com",
+                phone="+380501112233",
+                city="Kyiv",
+                partners_brands=f"tag{i}",
+                audit_status="approved",
+            )
+            for i in range(3)
+        ]
+        self.url = reverse('startup-batch')
+
+    def test_get_preserves_order_and_reports_missing(self):
+        ids = [self.startups[2].id, 999999, self.startups[0].id, self.startups[2].id]
+
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'ids': ','.join(map(str, ids))})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item['id'] for item in response.data['results']],
+            [self.startups[2].id, self.startups[0].id]
+        )
+        self.assertEqual(response.data['results'][0]['tags'], ['tag2'])
+        self.assertEqual(response.data['missing'], [999999])
+
+    def test_post_body(self):
+        response = self.client.post(self.url, {'ids': [self.startups[1].id]}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['company_name'], "Batch 1")
+        self.assertEqual(response.data['missing'], [])
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {'ids': '1,x'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            self.client.post(self.url, {'ids': list(range(1, 302))}, format='json').status_code,
+            status.HTTP_400_BAD_REQUEST
+        )
+        for body in ([self.startups[0].id], 42):
+            response = self.client.post(self.url, body, format='json')
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data, {'ids': 'Expected a list of startup ids.'})
+
+
+class StartupSparseFieldsetsTest(APITestCase):
+    """Tests for ?fields= / ?omit= on the public startup endpoints"""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(
+            email="sparse@example.com",
+            password="password123",
+            first_name="Sparse",
+            last_name="User"
+        )
+        self.startup = StartupProfile.objects.create(
+            user=user,
+            company_name="SparseCo",
+            description="A long description that compact cards do not need.",
+            founded_year=2022,
+            team_size=4,
+            website="https://sparse.com",
+            email="sparse@example.com",
+            phone="+380501112233",
+            city="Kyiv",
+            logo="media/startup_logos/sparse.png",
+            partners_brands="ai, cloud",
+            audit_status="approved",
+        )
+
+    def test_list_projects_requested_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('startup-list'), {'fields': 'id,company_name,logo_url'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'][0],
+            {
+                'id': self.startup.id,
+                'company_name': "SparseCo",
+                'logo_url': 'http://testserver/media/media/startup_logos/sparse.png',
+            }
+        )
+        # No tags prefetch, and the heavy text columns are not loaded.
+        self.assertEqual(len(queries), 1)
+        sql = queries[0]['sql']
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn('"partners_brands"', sql)
+        self.assertNotIn('"followers_count"', sql)
+
+    def test_omit_on_batch(self):
+        response = self.client.get(
+            reverse('startup-batch'), {'ids': str(self.startup.id), 'omit': 'description,tags,email'}
+        )
+
+        item = response.data['results'][0]
+        self.assertNotIn('description', item)
+        self.assertNotIn('tags', item)
+        self.assertNotIn('email', item)
+        self.assertEqual(item['followers_count'], 0)
+
+    def test_retrieve_trims_cached_payload(self):
+        url = reverse('startup-detail', kwargs={'id': self.startup.id})
+        self.client.get(url)
+
+        response = self.client.get(url, {'fields': 'id,tags,unknown'})
+
+        self.assertEqual(response.data, {'id': self.startup.id, 'tags': ['ai', 'cloud']})
+
+
+class StartupFastSerializerTest(APITestCase):
+    """Tests that the fast read path renders exactly what the DRF serializer does"""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(
+            email="fast@example.com",
+            password="password123",
+            first_name="Fast",
+            last_name="User"
+        )
+        common = dict(
+            user=user,
+            description="Fast path",
+            founded_year=2021,
+            team_size=7,
+            website="https://fast.com",
+            email="fast@example.com",
+            phone="+380501112233",
+            city="Lviv",
+            audit_status="approved",
+        )
+        self.with_logo = StartupProfile.objects.create(
+            company_name="Ünicode Co", logo="media/startup_logos/fast.png",
+            partners_brands="zeta, Alpha, beta", **common
+        )
+        StartupProfile.objects.filter(pk=self.with_logo.pk).update(logo_variants={
+            'source': "media/startup_logos/fast.png",
+            'webp': {'64': "media/startup_logos/variants/fast_64w.webp"},
+        })
+        self.without_logo = StartupProfile.objects.create(
+            company_name="NoLogo", logo="", partners_brands="", **common
+        )
+
+    def render_both(self, params=None):
+        request = Request(RequestFactory().get('/api/startups/startups/', params or {}))
+        queryset = StartupPublicProfileViewSet.queryset.order_by('id')
+
+        drf = StartupPublicProfileSerializer(queryset, many=True, context={'request': request}).data
+        fast_serializer = StartupPublicProfileFastSerializer(request)
+        fast = fast_serializer.serialize(fast_serializer.project(queryset))
+        return JSONRenderer().render(drf), JSONRenderer().render(fast)
+
+    def test_output_is_byte_identical(self):
+        drf, fast = self.render_both()
+
+        self.assertEqual(drf, fast)
+        self.assertIn(b'"tags":["zeta","Alpha","beta"]', fast)
+        self.assertIn(b'"logo_url":null', fast)
+
+    def test_sparse_fieldsets_match(self):
+        for params in ({'fields': 'id,tags,created_at'}, {'omit': 'id,logo_srcset'}, {'fields': 'logo_url'}):
+            with self.subTest(params=params):
+                drf, fast = self.render_both(params)
+                self.assertEqual(drf, fast)
+
+    def test_list_uses_two_queries_with_tags(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('startup-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(len(queries), 2)
+
+    def test_benchmark_command_checks_output(self):
+        out = StringIO()
+        call_command('benchmark_startup_serializers', sizes=[1, 20], repeat=1, stdout=out)
+
+        self.assertIn('20 objects', out.getvalue())
+        self.assertFalse(StartupProfile.objects.filter(company_name__startswith='Benchmark').exists())
+
+
+class SavedStartupAPITest(APITestCase):
+    """Tests for bulk save / unsave and the saved startups list"""
+
+    def setUp(self):
+        cache.clear()
+        owner = User.objects.create_user(
+            email="savedowner@example.com",
+            password="password123",
+            first_name="Owner",
+            last_name="User"
+        )
+        self.startups = [
+            StartupProfile.objects.create(
+                user=owner,
+                company_name=f"Saved {i}",
+                description="Startup.",
+                founded_year=2021,
+                team_size=3,
+                website="https://saved.com",
+                email=f"saved{i}@example.com",
+                phone="+380501112233",
+                city="Lviv",
+                partners_brands="",
+                audit_status="Approved",
+            )
+            for i in range(3)
+        ]
+        self.user = User.objects.create_user(
+            email="saver@example.com",
+            password="password123",
+            first_name="Saver",
+            last_name="User"
+        )
+        self.investor = InvestorProfile.objects.create(
+            user=self.user,
+            company_name="Saver Fund",
+            full_name="Saver",
+            description="Fund.",
+            investment_range_min=1000,
+            investment_range_max=2000,
+            preferred_industries="AI",
+            website="https://fund.com",
+            email="saverfund@example.com",
+            phone="+380441234567",
+            country="Ukraine",
+            city="Kyiv",
+            address="Street 1",
+            postal_code="01001",
+            partners_brands="",
+        )
+        self.client.force_authenticate(self.user)
+        self.url = reverse('saved-startup-list')
+
+    def followers(self, startup):
+        startup.refresh_from_db(fields=['followers_count'])
+        return startup.followers_count
+
+    def test_bulk_save_is_idempotent(self):
+        ids = [self.startups[0].id, self.startups[1].id, 999999]
+
+        response = self.client.post(self.url, {'startup_ids': ids}, format='json')
+        self.client.post(self.url, {'startup_ids': ids}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['missing'], [999999])
+        self.assertEqual(SavedStartup.objects.filter(investor=self.investor).count(), 2)
+        self.assertEqual(self.followers(self.startups[0]), 1)
+
+    def test_bulk_unsave_uses_single_delete(self):
+        SavedStartup.objects.bulk_create([
+            SavedStartup(investor=self.investor, startup=startup, notes="") for startup in self.startups
+        ])
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse('saved-startup-unsave'),
+                {'startup_ids': [self.startups[0].id, self.startups[1].id]},
+                format='json'
+            )
+
+        self.assertEqual(response.data, {'unsaved': 2})
+        self.assertEqual(sum(query['sql'].startswith('DELETE') for query in queries), 1)
+        self.assertEqual(self.followers(self.startups[0]), 0)
+        self.assertEqual(self.followers(self.startups[2]), 1)
+
+    def test_unique_constraint(self):
+        SavedStartup.objects.create(investor=self.investor, startup=self.startups[0], notes="")
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            SavedStartup.objects.create(investor=self.investor, startup=self.startups[0], notes="")
+
+    def test_list_has_no_n_plus_one(self):
+        SavedStartup.objects.bulk_create([
+            SavedStartup(investor=self.investor, startup=startup, notes="") for startup in self.startups
+        ])
+
+        # Investor profile lookup and one joined page query.
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(response.data['results'][0]['company_name'], "Saved 2")
+
+    def test_requires_investor(self):
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_empty_ids_rejected(self):
+        response = self.client.post(self.url, {'startup_ids': []}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def save_with_projects(self):
+        SavedStartup.objects.create(investor=self.investor, startup=self.startups[0], notes="Call, \"soon\"")
+        SavedStartup.objects.create(investor=self.investor, startup=self.startups[1], notes="")
+        for slug, status_value in (("seed", "in_progress"), ("later", "draft")):
+            Project.objects.create(
+                startup=self.startups[0], title=slug.title(), slug=slug, short_description="Round.",
+                description="Round.", status=status_value, target_amount=1000, tags="",
+            )
+
+    def test_export_csv_streams_rows(self):
+        self.save_with_projects()
+
+        response = self.client.get(reverse('saved-startup-export'))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv; charset=utf-8')
+        rows = list(csv.DictReader(StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual([row['company_name'] for row in rows], ["Saved 1", "Saved 0"])
+        self.assertEqual(rows[0]['project_title'], "")  # no projects: empty columns
+        self.assertEqual(rows[1]['project_title'], "Seed")  # drafts are left out
+        self.assertEqual(rows[1]['notes'], 'Call, "soon"')
+
+    def test_export_csv_neutralizes_formulas(self):
+        notes = ['=HYPERLINK("http://evil.example","x")', '@SUM(A1)', '\tcmd']
+        for startup, note in zip(self.startups, notes):
+            SavedStartup.objects.create(investor=self.investor, startup=startup, notes=note)
+        StartupProfile.objects.filter(pk=self.startups[0].pk).update(company_name="-Minus Labs")
+
+        response = self.client.get(reverse('saved-startup-export'))
+
+        rows = list(csv.DictReader(StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(sorted(row['notes'] for row in rows), sorted("'" + note for note in notes))
+        self.assertIn("'-Minus Labs", [row['company_name'] for row in rows])
+
+        response = self.client.get(reverse('saved-startup-export'), {'file_format': 'ndjson'})
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertIn("-Minus Labs", [json.loads(line)['company_name'] for line in lines])
+
+    def test_export_ndjson(self):
+        self.save_with_projects()
+
+        response = self.client.get(reverse('saved-startup-export'), {'file_format': 'ndjson'})
+
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        rows = [json.loads(line) for line in lines]
+        self.assertEqual(len(rows), 2)
+        self.assertIsNone(rows[0]['project_id'])
+        self.assertEqual(rows[1]['target_amount'], "1000.00")
+
+    @override_settings(EXPORT_CHUNK_SIZE=1)
+    def test_export_reads_rows_while_streaming(self):
+        self.save_with_projects()
+
+        with CaptureQueriesContext(connection) as before:
+            response = self.client.get(reverse('saved-startup-export'))
+        with CaptureQueriesContext(connection) as during:
+            body = b''.join(response.streaming_content)
+
+        self.assertFalse(any('startups_savedstartup' in query['sql'] for query in before))
+        self.assertTrue(any('startups_savedstartup' in query['sql'] for query in during))
+        self.assertEqual(len(body.splitlines()), 3)
+
+    def test_export_rejects_unknown_format(self):
+        response = self.client.get(reverse('saved-startup-export'), {'file_format': 'xlsx'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
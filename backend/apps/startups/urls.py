@@ -1,7 +1,9 @@
 from rest_framework.routers import DefaultRouter
-from .views import StartupPublicProfileViewSet
+from .views import SavedStartupViewSet, StartupPublicProfileViewSet, TagFacetViewSet
 
 router = DefaultRouter()
 router.register(r'startups', StartupPublicProfileViewSet, basename='startup')
+router.register(r'tags', TagFacetViewSet, basename='tag')
+router.register(r'saved', SavedStartupViewSet, basename='saved-startup')
 
 urlpatterns = router.urls
\ No newline at end of file
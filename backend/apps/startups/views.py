@@ -1,8 +1,174 @@
+from django.conf import settings
+from django.db.models import Prefetch
 from rest_framework import viewsets, mixins
-from .models import StartupProfile
-from .serializers import StartupPublicProfileSerializer
-from django.db.models import Count
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from .models import SavedStartup, StartupProfile, StartupTag, Tag
+from .serializers import (
+    SavedStartupSerializer,
+    StartupIdsSerializer,
+    StartupPublicProfileSerializer,
+    TagFacetSerializer,
+)
+from .fast_serializers import StartupPublicProfileFastSerializer
+from .filters import StartupProfileFilterBackend
+from .cache import profile_cache_key
+from .managers import PIPELINE_EXPORT_COLUMNS
+from apps.common.cache import get_or_set_coalesced
+from apps.common.export import EXPORT_WRITERS, streaming_export
+from apps.common.mixins import ConditionalGetMixin
+from apps.common.pagination import KeysetPagination
+from apps.investors.permissions import IsInvestor, get_investor_profile
 
-class StartupPublicProfileViewSet(mixins.RetrieveModelMixin, viewsets.GenericViewSet):
-    queryset = StartupProfile.objects.annotate(followers_count=Count('savedstartup'))
-    serializer_class = StartupPublicProfileSerializer
\ No newline at end of file
+
+class StartupPublicProfileViewSet(ConditionalGetMixin, mixins.ListModelMixin, mixins.RetrieveModelMixin,
+                                  viewsets.GenericViewSet):
+    queryset = StartupProfile.objects.prefetch_related(
+        Prefetch('startup_tags', queryset=StartupTag.objects.select_related('tag'))
+    )
+    serializer_class = StartupPublicProfileSerializer
+    lookup_field = 'id'
+    filter_backends = [StartupProfileFilterBackend]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+    etag_fields = ('updated_at', 'followers_count')
+    batch_max_ids = 300
+
+    def list(self, request, *args, **kwargs):
+        fast_serializer = StartupPublicProfileFastSerializer(request)
+        ordering_columns = [field.lstrip('-') for field in self.keyset_ordering]
+        queryset = fast_serializer.project(self.filter_queryset(self.get_queryset()), *ordering_columns)
+        rows = self.paginate_queryset(queryset)
+        return self.get_paginated_response(fast_serializer.serialize(rows))
+
+    def get_fresh_response(self, request, validator_values, *args, **kwargs):
+        """
+        Serve the public payload from a read-through cache keyed by (pk, updated_at),
+        reusing the stamp already read for the conditional GET validators.
+        """
+        data = get_or_set_coalesced(
+            profile_cache_key(validator_values['pk'], validator_values['updated_at']),
+            lambda: dict(StartupPublicProfileSerializer(self.get_object()).data),
+            timeout=settings.STARTUP_PROFILE_CACHE_TIMEOUT,
+        )
+        data = StartupPublicProfileSerializer.trim(data, request)
+        return Response(StartupPublicProfileSerializer.absolutize_urls(data, request))
+
+    def get_batch_ids(self, request):
+        if request.method == 'POST':
+            raw_ids = request.data.get('ids') if isinstance(request.data, dict) else None
+            if not isinstance(raw_ids, list):
+                raise ValidationError({'ids': 'Expected a list of startup ids.'})
+        else:
+            raw_ids = [value for value in request.query_params.get('ids', '').split(',') if value.strip()]
+
+        try:
+            ids = list(dict.fromkeys(int(value) for value in raw_ids))
+        except (TypeError, ValueError):
+            raise ValidationError({'ids': 'Startup ids must be integers.'})
+
+        if not ids:
+            raise ValidationError({'ids': 'At least one startup id is required.'})
+        if len(ids) > self.batch_max_ids:
+            raise ValidationError({'ids': f'At most {self.batch_max_ids} ids can be requested at once.'})
+        return ids
+
+    @action(detail=False, methods=['get', 'post'])
+    def batch(self, request):
+        """
+        Fetch many profiles in one round trip.
+        GET /api/startups/startups/batch/?ids=1,2,3 or POST {"ids": [1, 2, 3]}
+
+        Profiles come from a single query (plus one for tags); follower counts
+        are the stored column. Results keep the requested order and unknown ids are
+        reported in `missing`.
+        """
+        ids = self.get_batch_ids(request)
+        fast_serializer = StartupPublicProfileFastSerializer(request)
+        queryset = fast_serializer.project(self.get_queryset().filter(pk__in=ids), 'id')
+        startups = {row['id']: row for row in queryset}
+
+        return Response({
+            'results': fast_serializer.serialize(startups[pk] for pk in ids if pk in startups),
+            'missing': [pk for pk in ids if pk not in startups],
+        })
+
+
+class TagFacetViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """Per-tag startup counts, read from the precomputed Tag.startups_count."""
+    queryset = Tag.objects.filter(startups_count__gt=0).order_by('-startups_count', 'name')
+    serializer_class = TagFacetSerializer
+    pagination_class = None
+
+
+class SavedStartupViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    Startups saved by the authenticated investor.
+    GET  /api/startups/saved/                            newest first, keyset paginated
+    GET  /api/startups/saved/export/?file_format=csv|ndjson   streamed pipeline export
+    POST /api/startups/saved/        {"startup_ids": [...]}   save many (idempotent)
+    POST /api/startups/saved/unsave/ {"startup_ids": [...]}   unsave many
+    """
+    serializer_class = SavedStartupSerializer
+    permission_classes = [IsAuthenticated, IsInvestor]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+
+    def get_queryset(self):
+        return (
+            SavedStartup.objects
+            .filter(investor=get_investor_profile(self.request))
+            .select_related('startup')
+            .only('id', 'notes', 'created_at', 'startup__id', 'startup__company_name', 'startup__city')
+        )
+
+    def get_startup_ids(self, request):
+        serializer = StartupIdsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data['startup_ids']
+
+    def create(self, request):
+        """Save many startups in one INSERT; already saved ones are left as they are."""
+        ids = self.get_startup_ids(request)
+        existing = set(StartupProfile.objects.filter(pk__in=ids).values_list('pk', flat=True))
+        investor = get_investor_profile(request)
+
+        SavedStartup.objects.bulk_create(
+            [SavedStartup(investor=investor, startup_id=pk, notes='') for pk in ids if pk in existing],
+            ignore_conflicts=True,
+        )
+        return Response({
+            'saved': [pk for pk in ids if pk in existing],
+            'missing': [pk for pk in ids if pk not in existing],
+        })
+
+    @action(detail=False, methods=['post'])
+    def unsave(self, request):
+        """Remove many saved startups with a single DELETE."""
+        ids = self.get_startup_ids(request)
+        deleted = SavedStartup.objects.filter(
+            investor=get_investor_profile(request), startup_id__in=ids
+        ).bulk_delete()
+        return Response({'unsaved': deleted})
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """
+        Stream the whole pipeline (saved startups, notes and their projects).
+        Rows are read through a server-side cursor and written as they arrive,
+        so memory use does not depend on the portfolio size. `file_format`
+        rather than `format`, which DRF reserves for renderer selection.
+        """
+        file_format = request.query_params.get('file_format', 'csv')
+        if file_format not in EXPORT_WRITERS:
+            raise ValidationError({'file_format': f"Choose one of: {', '.join(EXPORT_WRITERS)}."})
+
+        rows = (
+            SavedStartup.objects
+            .filter(investor=get_investor_profile(request))
+            .pipeline_rows()
+            .iterator(chunk_size=settings.EXPORT_CHUNK_SIZE)
+        )
+        return streaming_export(rows, PIPELINE_EXPORT_COLUMNS, file_format, 'pipeline')
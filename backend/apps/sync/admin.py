@@ -0,0 +1,12 @@
+from django.contrib import admin
+
+from .models import Tombstone
+
+
+@admin.register(Tombstone)
+class TombstoneAdmin(admin.ModelAdmin):
+    list_display = ['entity', 'object_id', 'deleted_at']
+    list_filter = ['entity']
+    search_fields = ['object_id']
+    ordering = ['-deleted_at']
+    readonly_fields = ['entity', 'object_id', 'deleted_at', 'sync_txid']
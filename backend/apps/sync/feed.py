@@ -0,0 +1,183 @@
+"""
+Delta sync in commit order.
+
+Projects, startups and tombstones carry sync_txid, the id of the transaction
+that last wrote the row, stamped by a database trigger on every insert and
+update (queryset updates and COPY included). A client keeps an opaque token
+holding two positions, the last changed row and the last tombstone it has
+seen, as (sync_txid, id). Each call returns rows and tombstones after those
+positions, read through (sync_txid, id) and (entity, sync_txid, id) indexes,
+so a sync with nothing new costs one probe of each.
+
+Reads stop below the oldest transaction still running: every transaction
+below that bound has committed or rolled back, so no row can commit later
+behind a position a client has passed (updated_at is set at save time and
+cannot give that guarantee). A long-running transaction holds the feed back
+until it ends. Tokens also record when their tombstone position was taken,
+so tokens older than SYNC_TOMBSTONE_RETENTION_DAYS, after which tombstones
+are purged, are detected.
+"""
+import base64
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from apps.projects.models import Project
+from apps.projects.serializers import ProjectDetailSerializer
+from apps.projects.views import CARD_FIELDS
+from apps.startups.fast_serializers import StartupPublicProfileFastSerializer
+from apps.startups.models import StartupProfile
+from .models import Tombstone
+
+
+class TokenExpired(APIException):
+    status_code = status.HTTP_410_GONE
+    default_detail = 'Sync token expired; start a full sync without a token.'
+    default_code = 'token_expired'
+
+
+def encode_token(changed, deleted, since):
+    payload = json.dumps({
+        'changed': list(changed) if changed else None,
+        'deleted': list(deleted),
+        'since': since.isoformat(),
+    }, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_token(token):
+    """
+    (changed, deleted, since) of a token; changed is None until the first full
+    pass ends, since is when the deleted position was taken.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token.encode()).decode())
+        if 'since' not in payload:
+            # Issued before the feed moved to transaction ids; the client has to sync from scratch.
+            raise TokenExpired()
+        changed, deleted = payload['changed'], payload['deleted']
+        since = parse_datetime(payload['since'])
+        if since is None:
+            raise ValueError
+        return (
+            (int(changed[0]), int(changed[1])) if changed is not None else None,
+            (int(deleted[0]), int(deleted[1])),
+            since,
+        )
+    except (TypeError, ValueError, KeyError, IndexError, UnicodeDecodeError):
+        raise ValidationError({'token': 'Invalid sync token.'})
+
+
+def committed_txid_bound():
+    """Every transaction with a lower id has committed or rolled back."""
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT txid_snapshot_xmin(txid_current_snapshot())')
+        return cursor.fetchone()[0]
+
+
+def after(field, position):
+    """Rows strictly after (field, id) = position, with a leading bound an index range scan can use."""
+    value, pk = position
+    return Q(**{f'{field}__gte': value}) & (Q(**{f'{field}__gt': value}) | Q(**{field: value, 'id__gt': pk}))
+
+
+class ChangeFeed:
+    """Changed rows of one entity; subclasses decide what clients may see and how it is serialized."""
+    entity = None
+
+    def __init__(self, request):
+        self.request = request
+
+    def get_queryset(self):
+        raise NotImplementedError
+
+    def split(self, rows):
+        """(serialized visible rows, ids of rows clients must drop)."""
+        raise NotImplementedError
+
+    def read(self, token, limit):
+        now = timezone.now()
+        upper = committed_txid_bound()
+        if token:
+            changed_position, deleted_position, since = decode_token(token)
+            if since < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+                raise TokenExpired()
+        else:
+            # A full pass: deletions that commit while it is paged through still count.
+            changed_position, deleted_position = None, (upper, 0)
+
+        rows = self.get_queryset().filter(sync_txid__lt=upper)
+        if changed_position is not None:
+            rows = rows.filter(after('sync_txid', changed_position))
+        rows = list(rows.order_by('sync_txid', 'id')[:limit + 1])
+
+        tombstones = Tombstone.objects.filter(
+            Q(entity=self.entity, sync_txid__lt=upper) & after('sync_txid', deleted_position)
+        )
+        tombstones = list(
+            tombstones.order_by('sync_txid', 'id').values_list('sync_txid', 'id', 'object_id', 'deleted_at')[:limit + 1]
+        )
+
+        more_rows, more_tombstones = len(rows) > limit, len(tombstones) > limit
+        rows, tombstones = rows[:limit], tombstones[:limit]
+
+        if more_rows:
+            changed_position = (self.row_value(rows[-1], 'sync_txid'), self.row_value(rows[-1], 'id'))
+        else:
+            changed_position = (upper, 0)
+        if more_tombstones:
+            deleted_position, since = (tombstones[-1][0], tombstones[-1][1]), tombstones[-1][3]
+        else:
+            deleted_position, since = (upper, 0), now
+
+        changed, removed = self.split(rows)
+        return {
+            'changed': changed,
+            'deleted': removed + [object_id for _, _, object_id, _ in tombstones],
+            'token': encode_token(changed_position, deleted_position, since),
+            'has_more': more_rows or more_tombstones,
+        }
+
+    @staticmethod
+    def row_value(row, name):
+        return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+class ProjectChangeFeed(ChangeFeed):
+    """All projects; ones that stopped being listed are reported as deleted."""
+    entity = 'projects'
+
+    def get_queryset(self):
+        return Project.objects.select_related('startup').only(*CARD_FIELDS, 'description', 'visibility', 'sync_txid')
+
+    def split(self, rows):
+        listed = [row for row in rows if row.visibility == 'public' and row.status != 'draft']
+        hidden = [row.id for row in rows if row.visibility != 'public' or row.status == 'draft']
+        return ProjectDetailSerializer(listed, many=True, context={'request': self.request}).data, hidden
+
+
+class StartupChangeFeed(ChangeFeed):
+    entity = 'startups'
+
+    def __init__(self, request):
+        super().__init__(request)
+        self.serializer = StartupPublicProfileFastSerializer(request)
+
+    def get_queryset(self):
+        return self.serializer.project(StartupProfile.objects.all(), 'sync_txid', 'id')
+
+    def split(self, rows):
+        return self.serializer.serialize(rows), []
+
+
+FEEDS = {
+    'projects': ProjectChangeFeed,
+    'startups': StartupChangeFeed,
+}
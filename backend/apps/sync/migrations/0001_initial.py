@@ -0,0 +1,50 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:29
+
+from django.db import migrations, models
+
+
+SYNC_TXID_TRIGGER_SQL = """
+CREATE FUNCTION sync_tombstone_sync_txid_update() RETURNS trigger AS $$
+BEGIN
+    NEW.sync_txid := txid_current();
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tombstone_sync_txid_trigger
+    BEFORE INSERT OR UPDATE
+    ON sync_tombstone
+    FOR EACH ROW EXECUTE FUNCTION sync_tombstone_sync_txid_update();
+"""
+
+DROP_SYNC_TXID_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS tombstone_sync_txid_trigger ON sync_tombstone;
+DROP FUNCTION IF EXISTS sync_tombstone_sync_txid_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('entity', models.CharField(choices=[('projects', 'Projects'), ('startups', 'Startups')], max_length=20)),
+                ('object_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+                ('sync_txid', models.BigIntegerField(default=0, editable=False)),
+            ],
+            options={
+                'verbose_name': 'Tombstone',
+                'verbose_name_plural': 'Tombstones',
+                'indexes': [models.Index(fields=['entity', 'sync_txid', 'id'], name='tombstone_entity_txid_idx')],
+            },
+        ),
+        migrations.RunSQL(SYNC_TXID_TRIGGER_SQL, DROP_SYNC_TXID_TRIGGER_SQL),
+    ]
@@ -0,0 +1,28 @@
+from django.db import models
+
+ENTITY_CHOICES = (
+    ('projects', 'Projects'),
+    ('startups', 'Startups'),
+)
+
+
+class Tombstone(models.Model):
+    """
+    Marks a deleted row for change-feed clients. Written by apps.sync.signals
+    and purged after SYNC_TOMBSTONE_RETENTION_DAYS (see purge_tombstones).
+    """
+    entity = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    object_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+    # Id of the deleting transaction, stamped by a database trigger; the feed reads tombstones in this order.
+    sync_txid = models.BigIntegerField(default=0, editable=False)
+
+    def __str__(self):
+        return f"{self.entity}:{self.object_id}"
+
+    class Meta:
+        verbose_name = "Tombstone"
+        verbose_name_plural = "Tombstones"
+        indexes = [
+            models.Index(fields=['entity', 'sync_txid', 'id'], name='tombstone_entity_txid_idx'),
+        ]
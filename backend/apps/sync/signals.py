@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from apps.projects.models import Project
+from apps.startups.models import StartupProfile
+from .models import Tombstone
+
+
+@receiver(post_delete, sender=Project)
+def bury_project(sender, instance, **kwargs):
+    Tombstone.objects.create(entity='projects', object_id=instance.pk)
+
+
+@receiver(post_delete, sender=StartupProfile)
+def bury_startup(sender, instance, **kwargs):
+    Tombstone.objects.create(entity='startups', object_id=instance.pk)
@@ -0,0 +1,153 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connections
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITransactionTestCase
+
+from apps.projects.models import Pledge, Project
+from apps.startups.models import StartupProfile
+from .feed import encode_token
+from .models import Tombstone
+
+User = get_user_model()
+
+
+class ChangeFeedAPITest(APITransactionTestCase):
+    """
+    Tests for GET /api/sync/<entity>/. Rows only become visible once their
+    transaction commits, so each write here has to commit on its own.
+    """
+
+    def setUp(self):
+        user = User.objects.create_user(email="sync@example.com", password="password123",
+                                        first_name="Sync", last_name="User")
+        self.startup = StartupProfile.objects.create(
+            user=user,
+            company_name="Syncer",
+            description="Startup.",
+            founded_year=2020,
+            team_size=5,
+            website="https://sync.com",
+            email="sync@example.com",
+            phone="+380441234567",
+            city="Kyiv",
+            partners_brands="AI",
+            audit_status="approved",
+        )
+        self.projects = [
+            Project.objects.create(
+                startup=self.startup, title=f"Round {i}", slug=f"round-{i}", short_description="Round.",
+                description="Round.", status="in_progress", target_amount=1000, tags="",
+            )
+            for i in range(3)
+        ]
+        self.url = reverse('change-feed', args=['projects'])
+
+    def sync(self, token=None, **params):
+        if token:
+            params['token'] = token
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_full_pass_then_no_changes(self):
+        first = self.sync()
+        self.assertEqual([row['slug'] for row in first['changed']], ["round-0", "round-1", "round-2"])
+        self.assertFalse(first['has_more'])
+
+        # The committed transaction bound, one probe of the (sync_txid, id) index and one of the tombstones.
+        with self.assertNumQueries(3):
+            second = self.sync(first['token'])
+
+        self.assertEqual((second['changed'], second['deleted']), ([], []))
+
+    def test_deltas_include_changes_and_deletions(self):
+        token = self.sync()['token']
+
+        self.projects[0].title = "Renamed"
+        self.projects[0].save()
+        Project.objects.filter(pk=self.projects[1].pk).update(status="draft")
+        deleted_id = self.projects[2].pk
+        self.projects[2].delete()
+
+        delta = self.sync(token)
+
+        self.assertEqual([row['title'] for row in delta['changed']], ["Renamed"])
+        self.assertEqual(sorted(delta['deleted']), sorted([self.projects[1].pk, deleted_id]))
+
+    def test_pledges_show_up_as_changes(self):
+        token = self.sync()['token']
+
+        Pledge.objects.create(project=self.projects[1], amount=250)
+
+        delta = self.sync(token)
+        self.assertEqual([row['raised_amount'] for row in delta['changed']], ["250.00"])
+
+    def test_pages_cover_every_row_once(self):
+        seen, token, has_more = [], None, True
+        while has_more:
+            page = self.sync(token, limit=2)
+            seen += [row['id'] for row in page['changed']]
+            token, has_more = page['token'], page['has_more']
+
+        self.assertEqual(seen, [project.pk for project in self.projects])
+
+    def test_rows_wait_for_earlier_transactions_to_commit(self):
+        token = self.sync()['token']
+        slow = connections.create_connection('default')
+        self.addCleanup(slow.close)
+        with slow.cursor() as cursor:
+            cursor.execute('BEGIN')
+            cursor.execute('UPDATE projects_project SET title = %s WHERE id = %s', ["Slow", self.projects[0].pk])
+
+        self.projects[1].title = "Fast"
+        self.projects[1].save()
+
+        # The faster transaction committed first but is held back behind the open one.
+        delta = self.sync(token)
+        self.assertEqual(delta['changed'], [])
+
+        with slow.cursor() as cursor:
+            cursor.execute('COMMIT')
+
+        delta = self.sync(delta['token'])
+        self.assertEqual([row['title'] for row in delta['changed']], ["Slow", "Fast"])
+
+    def test_startup_feed(self):
+        url = reverse('change-feed', args=['startups'])
+        response = self.client.get(url)
+        self.assertEqual(response.data['changed'][0]['tags'], ["AI"])
+
+        token = response.data['token']
+        startup_id = self.startup.pk
+        self.startup.delete()
+
+        delta = self.client.get(url, {'token': token}).data
+        self.assertEqual(delta['deleted'], [startup_id])
+        self.assertEqual(Tombstone.objects.filter(entity='projects').count(), 3)
+
+    def test_bad_tokens(self):
+        stale = timezone.now() - timedelta(days=365)
+        expired = self.client.get(self.url, {'token': encode_token((0, 0), (0, 0), stale)})
+        self.assertEqual(expired.status_code, status.HTTP_410_GONE)
+
+        invalid = self.client.get(self.url, {'token': 'not-a-token'})
+        self.assertEqual(invalid.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(self.client.get(reverse('change-feed', args=['users'])).status_code,
+                         status.HTTP_404_NOT_FOUND)
+
+    def test_purge_tombstones(self):
+        self.projects[0].delete()
+        Tombstone.objects.update(deleted_at=timezone.now() - timedelta(days=90))
+
+        out = StringIO()
+        call_command('purge_tombstones', stdout=out)
+
+        self.assertFalse(Tombstone.objects.exists())
+        self.assertIn("Purged 1 tombstone(s).", out.getvalue())
@@ -0,0 +1,33 @@
+from django.http import Http404
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .feed import FEEDS
+
+
+class ChangeFeedView(APIView):
+    """
+    Rows changed since a sync token.
+    GET /api/sync/projects/?token=<token>&limit=100
+    GET /api/sync/startups/?token=<token>
+
+    Start without a token for a full pass; keep calling with the returned token
+    while `has_more` is true, then store it for the next sync. Apply `changed`
+    before `deleted`. 410 Gone means the token is too old: sync from scratch.
+    """
+    default_limit = 100
+    max_limit = 500
+
+    def get_limit(self, request):
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except (TypeError, ValueError):
+            return self.default_limit
+        return min(max(limit, 1), self.max_limit)
+
+    def get(self, request, entity):
+        feed_class = FEEDS.get(entity)
+        if feed_class is None:
+            raise Http404
+        feed = feed_class(request)
+        return Response(feed.read(request.query_params.get('token'), self.get_limit(request)))
@@ -0,0 +1,124 @@
+"""
+Trending projects.
+
+One set-based statement ranks every listed project and replaces
+TrendingProject, so the feed only reads precomputed rows:
+
+    score = 0.5 * velocity + 0.3 * followers + 0.2 * recency
+
+- velocity: pledged in the last TRENDING_WINDOW_DAYS as a share of the
+  target (opening balances excluded, net withdrawals count as zero, capped at 1);
+- followers: new followers of the parent startup in the same window,
+  saturating as n / (n + 10);
+- recency: halves every 14 days since the project was created.
+
+Recent pledges and followers are aggregated once per project / startup and
+hash-joined, instead of correlated subqueries per row. Only the best
+TRENDING_SIZE projects are stored.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.projects.models import Pledge, Project
+from apps.startups.models import SavedStartup
+from .models import TrendingProject
+
+VELOCITY_WEIGHT = 0.5
+FOLLOWERS_WEIGHT = 0.3
+RECENCY_WEIGHT = 0.2
+
+FOLLOWERS_HALF_SATURATION = 10
+RECENCY_HALF_LIFE_DAYS = 14
+
+RANKING_SQL = """
+WITH pledged AS (
+    SELECT project_id, SUM(amount) AS raised_recent
+    FROM {pledge}
+    WHERE created_at >= %(since)s AND kind <> 'opening_balance'
+    GROUP BY project_id
+),
+followed AS (
+    SELECT startup_id, COUNT(*) AS new_followers
+    FROM {saved_startup}
+    WHERE created_at >= %(since)s
+    GROUP BY startup_id
+),
+scored AS (
+    SELECT
+        project.id AS project_id,
+        COALESCE(pledged.raised_recent, 0) AS raised_recent,
+        COALESCE(followed.new_followers, 0) AS new_followers,
+        %(velocity_weight)s::float8 * COALESCE(
+            LEAST(GREATEST(COALESCE(pledged.raised_recent, 0) / NULLIF(project.target_amount, 0), 0), 1), 0
+        )::float8
+        + %(followers_weight)s::float8 * COALESCE(followed.new_followers, 0)::float8
+            / (COALESCE(followed.new_followers, 0) + %(followers_half_saturation)s::float8)
+        + %(recency_weight)s::float8 * POWER(
+            0.5::float8,
+            GREATEST(EXTRACT(EPOCH FROM (%(now)s - project.created_at))::float8 / 86400, 0)
+                / %(recency_half_life_days)s::float8
+        ) AS score
+    FROM ({listed_projects}) project
+    LEFT JOIN pledged ON pledged.project_id = project.id
+    LEFT JOIN followed ON followed.startup_id = project.startup_id
+),
+ranked AS (
+    SELECT scored.*, ROW_NUMBER() OVER (ORDER BY score DESC, project_id DESC) AS rank
+    FROM scored
+)
+INSERT INTO {trending} (project_id, rank, score, raised_recent, new_followers, computed_at)
+SELECT project_id, rank, score, raised_recent, new_followers, %(now)s
+FROM ranked
+WHERE rank <= %(size)s
+"""
+
+
+def listed_projects_sql():
+    """
+    Project.objects.listed() as an SQL literal, so the ranking uses the same
+    predicate as the browse indexes; '%' is escaped for the named parameters.
+    """
+    listed_sql, listed_params = (
+        Project.objects.listed().order_by().values('id', 'startup_id', 'target_amount', 'created_at')
+        .query.sql_with_params()
+    )
+    with connection.cursor() as cursor:
+        listed_sql = cursor.mogrify(listed_sql, listed_params)
+    if isinstance(listed_sql, bytes):
+        listed_sql = listed_sql.decode()
+    return listed_sql.replace('%', '%%')
+
+
+def compute_trending(now=None, window_days=None, size=None):
+    """Replace the stored ranking in one transaction; returns the number of rows stored."""
+    now = now or timezone.now()
+    window_days = window_days or settings.TRENDING_WINDOW_DAYS
+    size = size or settings.TRENDING_SIZE
+
+    quote = connection.ops.quote_name
+    sql = RANKING_SQL.format(
+        pledge=quote(Pledge._meta.db_table),
+        saved_startup=quote(SavedStartup._meta.db_table),
+        listed_projects=listed_projects_sql(),
+        trending=quote(TrendingProject._meta.db_table),
+    )
+    params = {
+        'now': now,
+        'since': now - timedelta(days=window_days),
+        'size': size,
+        'velocity_weight': VELOCITY_WEIGHT,
+        'followers_weight': FOLLOWERS_WEIGHT,
+        'followers_half_saturation': FOLLOWERS_HALF_SATURATION,
+        'recency_weight': RECENCY_WEIGHT,
+        'recency_half_life_days': RECENCY_HALF_LIFE_DAYS,
+    }
+
+    with transaction.atomic():
+        # DELETE rather than TRUNCATE: readers keep seeing the previous ranking until commit.
+        TrendingProject.objects.all().delete()
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.trending.engine import compute_trending
+
+
+class Command(BaseCommand):
+    """Django command to recompute the trending projects ranking; run it periodically (e.g. from cron)."""
+
+    help = 'Rank listed projects by funding velocity, new followers and recency in one pass.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--window-days', type=int, help='Days of pledges and followers that count.')
+        parser.add_argument('--size', type=int, help='Number of ranked projects to keep.')
+
+    def handle(self, *args, **options):
+        stored = compute_trending(window_days=options['window_days'], size=options['size'])
+        self.stdout.write(self.style.SUCCESS(f'Ranked {stored} trending project(s).'))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('projects', '0007_slug_redirects'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrendingProject',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='trend', serialize=False, to='projects.project')),
+                ('rank', models.PositiveIntegerField()),
+                ('score', models.FloatField()),
+                ('raised_recent', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('new_followers', models.PositiveIntegerField()),
+                ('computed_at', models.DateTimeField()),
+            ],
+            options={
+                'verbose_name': 'Trending Project',
+                'verbose_name_plural': 'Trending Projects',
+                'indexes': [models.Index(fields=['-score', '-project'], name='trending_score_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+from django.db import models
+
+from apps.projects.models import Project
+
+
+class TrendingProject(models.Model):
+    """
+    Precomputed trending rank of a listed project, rewritten as a whole by
+    apps.trending.engine.compute_trending (see the compute_trending command).
+    """
+    project = models.OneToOneField(Project, on_delete=models.CASCADE, primary_key=True, related_name='trend')
+    rank = models.PositiveIntegerField()
+    score = models.FloatField()
+    raised_recent = models.DecimalField(max_digits=12, decimal_places=2)
+    new_followers = models.PositiveIntegerField()
+    computed_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"#{self.rank} {self.project_id} ({self.score:.3f})"
+
+    class Meta:
+        verbose_name = "Trending Project"
+        verbose_name_plural = "Trending Projects"
+        indexes = [
+            # Serves the feed, best first, as an index range scan of page size.
+            models.Index(fields=['-score', '-project'], name='trending_score_idx'),
+        ]
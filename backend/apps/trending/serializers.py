@@ -0,0 +1,12 @@
+from rest_framework import serializers
+
+from apps.projects.serializers import ProjectCardSerializer
+from .models import TrendingProject
+
+
+class TrendingProjectSerializer(serializers.ModelSerializer):
+    project = ProjectCardSerializer(read_only=True)
+
+    class Meta:
+        model = TrendingProject
+        fields = ['rank', 'score', 'raised_recent', 'new_followers', 'computed_at', 'project']
@@ -0,0 +1,112 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from apps.common.testing import create_investor, create_project, create_startup
+from apps.projects.models import Pledge, Project
+from apps.startups.models import SavedStartup
+from .engine import compute_trending
+from .models import TrendingProject
+
+
+def create_startup_project(slug, **extra):
+    return create_project(create_startup(slug.title()), slug, **extra)
+
+
+def create_followers(project, count):
+    for i in range(count):
+        investor = create_investor(f"fan{i}-{project.slug}@example.com")
+        SavedStartup.objects.create(investor=investor, startup=project.startup, notes="")
+
+
+def ranking():
+    return list(TrendingProject.objects.order_by('rank').values_list('project__slug', flat=True))
+
+
+class ComputeTrendingTest(TestCase):
+    """Tests for the set-based trending ranking"""
+
+    def setUp(self):
+        self.now = timezone.now()
+        self.quiet = create_startup_project("quiet")
+        self.funded = create_startup_project("funded")
+        self.followed = create_startup_project("followed")
+        create_startup_project("draft", status="draft")
+
+    def test_ranks_by_velocity_followers_and_recency(self):
+        Pledge.objects.create(project=self.funded, amount=5000)
+        create_followers(self.followed, 2)
+
+        stored = compute_trending(now=self.now)
+
+        self.assertEqual(stored, 3)
+        self.assertEqual(ranking(), ["funded", "followed", "quiet"])
+        funded = TrendingProject.objects.get(project=self.funded)
+        self.assertEqual(funded.raised_recent, 5000)
+        self.assertAlmostEqual(funded.score, 0.5 * 0.5 + 0.2, places=3)
+        self.assertEqual(TrendingProject.objects.get(project=self.followed).new_followers, 2)
+
+    def test_only_the_window_counts(self):
+        pledge = Pledge.objects.create(project=self.funded, amount=5000)
+        Pledge.objects.filter(pk=pledge.pk).update(created_at=self.now - timedelta(days=30))
+
+        compute_trending(now=self.now, window_days=7)
+
+        self.assertEqual(TrendingProject.objects.get(project=self.funded).raised_recent, 0)
+
+    def test_recency_decays(self):
+        Project.objects.filter(pk=self.quiet.pk).update(created_at=self.now - timedelta(days=14))
+
+        compute_trending(now=self.now)
+
+        self.assertAlmostEqual(TrendingProject.objects.get(project=self.quiet).score, 0.1, places=3)
+        self.assertEqual(ranking()[-1], "quiet")
+
+    def test_rerun_replaces_ranking_and_keeps_size(self):
+        compute_trending(now=self.now)
+        Pledge.objects.create(project=self.quiet, amount=1000)
+
+        compute_trending(now=self.now, size=1)
+
+        self.assertEqual(ranking(), ["quiet"])
+
+    def test_command(self):
+        out = StringIO()
+        call_command('compute_trending', stdout=out)
+
+        self.assertIn("Ranked 3 trending project(s).", out.getvalue())
+
+
+class TrendingFeedAPITest(APITestCase):
+    """Tests for GET /api/trending/"""
+
+    def setUp(self):
+        for i in range(5):
+            project = create_startup_project(f"project-{i}")
+            Pledge.objects.create(project=project, amount=1000 * (i + 1))
+        compute_trending()
+        self.url = reverse('trending-projects')
+
+    def test_pages_read_precomputed_ranks(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {'page_size': 3})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([row['rank'] for row in response.data['results']], [1, 2, 3])
+        self.assertEqual(response.data['results'][0]['project']['slug'], "project-4")
+
+        next_page = self.client.get(response.data['next'])
+        self.assertEqual([row['rank'] for row in next_page.data['results']], [4, 5])
+
+    def test_unlisted_projects_drop_out(self):
+        Project.objects.filter(slug="project-4").update(status="draft")
+
+        response = self.client.get(self.url)
+
+        self.assertNotIn("project-4", [row['project']['slug'] for row in response.data['results']])
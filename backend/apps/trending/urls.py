@@ -0,0 +1,6 @@
+from django.urls import path
+from .views import TrendingProjectListView
+
+urlpatterns = [
+    path('', TrendingProjectListView.as_view(), name='trending-projects'),
+]
@@ -0,0 +1,27 @@
+from rest_framework import generics
+
+from apps.common.pagination import KeysetPagination
+from apps.projects.models import Project
+from apps.projects.views import CARD_FIELDS
+from .models import TrendingProject
+from .serializers import TrendingProjectSerializer
+
+
+class TrendingProjectListView(generics.ListAPIView):
+    """
+    Projects ranked by compute_trending, best first.
+    GET /api/trending/
+    """
+    serializer_class = TrendingProjectSerializer
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-score', '-project_id')
+
+    def get_queryset(self):
+        return (
+            TrendingProject.objects
+            # Projects unlisted since the last run drop out without waiting for the next one.
+            .filter(project__in=Project.objects.listed())
+            .select_related('project__startup')
+            .only('rank', 'score', 'raised_recent', 'new_followers', 'computed_at',
+                  *[f'project__{field}' for field in CARD_FIELDS])
+        )
@@ -0,0 +1,153 @@
+"""
+Project update notifications for the investors who saved the project's startup.
+
+queue_project_updates() records a PendingFanOut row in the transaction that
+changed the project and hands delivery to the background pool once it commits;
+the row is deleted only after the fan-out finishes. Updates lost to a restart
+stay queued until the deliver_project_updates command drains them, so delivery
+is at-least-once; a redelivery within the dedupe window skips the investors the
+interrupted run already reached.
+
+fan_out_project_update() does the delivery, only for listed projects.
+Recipients are paged by investor id over the SavedStartup startup index,
+anti-joined against notifications of the same (project, type) sent within
+NOTIFICATION_DEDUPE_MINUTES, and each page is written with bulk_create in its
+own short transaction. A transaction-level advisory lock
+per project covers the selection and insert of one page, so concurrent
+fan-outs never notify an investor twice, and the unread counter rows a page
+updates are released when it commits.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
+
+from apps.common.tasks import run_in_background
+from apps.projects.models import STATUS_CHOICES, Project
+from apps.startups.models import SavedStartup
+from .models import Notification, PendingFanOut
+
+PROJECT_STATUS = 'project_status'
+PROJECT_FUNDING = 'project_funding'
+
+STATUS_NAMES = dict(STATUS_CHOICES)
+
+
+def project_link(slug):
+    return f'{settings.FRONTEND_URL.rstrip("/")}/projects/{slug}'
+
+
+def render_notification(project, notification_type):
+    """(title, message) of an update about the `project` values row."""
+    company, title = project['startup__company_name'], project['title']
+    if notification_type == PROJECT_STATUS:
+        status = STATUS_NAMES.get(project['status'], project['status'])
+        return f'{title}: {status}', f'{company} moved "{title}" to {status}.'
+    currency = project['currency']
+    return (
+        f'{title} raised funds',
+        f'{company} has raised {project["raised_amount"]} {currency} '
+        f'of {project["target_amount"]} {currency} for "{title}".',
+    )
+
+
+def select_recipients(project, notification_type, since, after=0, limit=None):
+    """
+    Investors (by id, above `after`) following the project's startup who were
+    not sent this update since `since`.
+    """
+    recent = Notification.objects.filter(
+        related_project=project['id'],
+        notification_type=notification_type,
+        user=OuterRef('investor_id'),
+        created_at__gte=since,
+    )
+    return list(
+        SavedStartup.objects
+        .filter(startup_id=project['startup_id'], investor_id__gt=after)
+        .filter(~Exists(recent))
+        .order_by('investor_id')
+        .values_list('investor_id', flat=True)[:limit]
+    )
+
+
+def fan_out_project_update(project_id, notification_type, chunk_size=None):
+    """Notify the followers of a project's startup; returns the number of notifications written."""
+    chunk_size = chunk_size or settings.NOTIFICATION_FANOUT_CHUNK_SIZE
+    project = (
+        Project.objects
+        .listed()
+        .filter(pk=project_id)
+        .values('id', 'title', 'slug', 'status', 'target_amount', 'raised_amount', 'currency',
+                'startup_id', 'startup__company_name', 'startup__user_id')
+        .first()
+    )
+    if project is None:
+        return 0
+
+    title, message = render_notification(project, notification_type)
+    link_url = project_link(project['slug'])
+    since = timezone.now() - timedelta(minutes=settings.NOTIFICATION_DEDUPE_MINUTES)
+    written = last_investor_id = 0
+
+    while True:
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT pg_advisory_xact_lock(hashtext(%s))', [f'notifications:project:{project_id}'])
+            chunk = select_recipients(project, notification_type, since, after=last_investor_id, limit=chunk_size)
+            Notification.objects.bulk_create([
+                Notification(
+                    user_id=investor_id,
+                    notification_type=notification_type,
+                    title=title[:200],
+                    message=message,
+                    link_url=link_url,
+                    related_user_id=project['startup__user_id'],
+                    related_project_id=project_id,
+                )
+                for investor_id in chunk
+            ])
+        written += len(chunk)
+        if len(chunk) < chunk_size:
+            return written
+        last_investor_id = chunk[-1]
+
+
+def queue_project_updates(project_ids, notification_type):
+    """Record the updates in the current transaction and fan them out after it commits."""
+    queued_at = timezone.now()
+    PendingFanOut.objects.bulk_create(
+        [PendingFanOut(project_id=project_id, notification_type=notification_type, queued_at=queued_at)
+         for project_id in project_ids],
+        update_conflicts=True,
+        unique_fields=['project', 'notification_type'],
+        update_fields=['queued_at'],
+    )
+    for project_id in project_ids:
+        run_in_background(deliver_project_update, project_id, notification_type)
+
+
+def deliver_project_update(project_id, notification_type):
+    """Fan out a queued update and dequeue it; returns the number of notifications written."""
+    pending = PendingFanOut.objects.filter(project_id=project_id, notification_type=notification_type)
+    queued_at = pending.values_list('queued_at', flat=True).first()
+    if queued_at is None:
+        return 0
+    written = fan_out_project_update(project_id, notification_type)
+    # An update queued again meanwhile moved queued_at and stays for its own delivery.
+    pending.filter(queued_at=queued_at).delete()
+    return written
+
+
+def deliver_pending_updates(queued_before):
+    """Deliver updates queued before `queued_before`, oldest first; returns (updates, notifications)."""
+    pending = list(
+        PendingFanOut.objects
+        .filter(queued_at__lt=queued_before)
+        .order_by('queued_at', 'id')
+        .values_list('project_id', 'notification_type')
+    )
+    written = sum(deliver_project_update(project_id, notification_type) for project_id, notification_type in pending)
+    return len(pending), written
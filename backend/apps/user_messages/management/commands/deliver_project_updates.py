@@ -0,0 +1,22 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.user_messages.fanout import deliver_pending_updates
+
+
+class Command(BaseCommand):
+    """Redeliver project update fan-outs that a restart interrupted or never started."""
+
+    help = 'Fan out PendingFanOut rows queued longer than NOTIFICATION_FANOUT_RETRY_SECONDS ago.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seconds', type=int, default=None, help='Override the minimum queued age in seconds.')
+
+    def handle(self, *args, **options):
+        seconds = options['seconds'] if options['seconds'] is not None else settings.NOTIFICATION_FANOUT_RETRY_SECONDS
+        # Younger rows are still owned by the background task queued with them.
+        updates, written = deliver_pending_updates(timezone.now() - timedelta(seconds=seconds))
+        self.stdout.write(self.style.SUCCESS(f'Delivered {updates} project update(s) as {written} notification(s).'))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F, Max
+
+from apps.investors.models import InvestorProfile
+
+
+class Command(BaseCommand):
+    """Repair drift between InvestorProfile.unread_notifications_count and Notification rows."""
+
+    help = 'Recount InvestorProfile.unread_notifications_count in id-range batches and fix rows that drifted.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = InvestorProfile.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+        repaired = 0
+
+        for start in range(0, last_id + 1, batch_size):
+            batch = InvestorProfile.objects.filter(id__gte=start, id__lt=start + batch_size)
+            with transaction.atomic():
+                drifted = list(
+                    batch
+                    .annotate(actual=batch.unread_notifications_subquery())
+                    .exclude(unread_notifications_count=F('actual'))
+                    .values_list('id', flat=True)
+                )
+                if drifted:
+                    repaired += InvestorProfile.objects.filter(id__in=drifted).sync_unread_notifications_count()
+
+        self.stdout.write(self.style.SUCCESS(f'Repaired unread_notifications_count for {repaired} investor(s).'))
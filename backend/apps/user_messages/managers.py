@@ -0,0 +1,93 @@
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.db import models, transaction
+from django.db.models import Count
+from django.dispatch import Signal
+from django.utils import timezone
+
+# Set while a bulk Notification path maintains the counters itself, so the
+# per-row post_delete receiver does not apply the same change a second time.
+_unread_counter_managed = ContextVar('unread_counter_managed', default=False)
+
+# Sent by the Notification bulk paths, which bypass per-row signals, with `investor_ids`.
+notifications_bulk_changed = Signal()
+
+
+def unread_counter_managed():
+    return _unread_counter_managed.get()
+
+
+@contextmanager
+def manage_unread_counter():
+    token = _unread_counter_managed.set(True)
+    try:
+        yield
+    finally:
+        _unread_counter_managed.reset(token)
+
+
+class NotificationQuerySet(models.QuerySet):
+    """
+    Keeps InvestorProfile.unread_notifications_count (and the cached dashboards)
+    in step on bulk paths, which do not send per-row signals (bulk_create,
+    mark_read) or would send one per row (delete).
+    """
+
+    def _investors(self):
+        return self.model._meta.get_field('user').related_model.objects
+
+    def bulk_create(self, objs, *args, **kwargs):
+        with transaction.atomic(using=self.db, savepoint=False):
+            objs = super().bulk_create(objs, *args, **kwargs)
+            investor_ids = {obj.user_id for obj in objs}
+            if kwargs.get('ignore_conflicts') or kwargs.get('update_conflicts'):
+                # Rows skipped on conflict can't be told apart from inserted ones.
+                self._investors().filter(pk__in=investor_ids).sync_unread_notifications_count()
+            else:
+                self._investors().adjust_unread_notifications_count(
+                    Counter(obj.user_id for obj in objs if not obj.is_read)
+                )
+            notifications_bulk_changed.send(sender=self.model, investor_ids=investor_ids)
+        return objs
+
+    def delete(self):
+        with transaction.atomic(using=self.db, savepoint=False):
+            deltas = {
+                investor_id: -total
+                for investor_id, total in
+                self.filter(is_read=False).order_by().values_list('user_id').annotate(total=Count('id'))
+            }
+            with manage_unread_counter():
+                result = super().delete()
+            self._investors().adjust_unread_notifications_count(deltas)
+        return result
+
+    delete.alters_data = True
+    delete.queryset_only = True
+
+    def mark_read(self):
+        """
+        Mark the selected unread notifications as read with a single UPDATE and
+        return how many changed. The rows are locked first, so concurrent calls
+        never decrement a counter twice for the same notification.
+        """
+        with transaction.atomic(using=self.db, savepoint=False):
+            rows = list(
+                self.filter(is_read=False).order_by('id').select_for_update().values_list('id', 'user_id')
+            )
+            if not rows:
+                return 0
+            updated = self.model.objects.filter(id__in=[pk for pk, _ in rows]).update(
+                is_read=True, read_at=timezone.now()
+            )
+            deltas = Counter()
+            for _, investor_id in rows:
+                deltas[investor_id] -= 1
+            self._investors().adjust_unread_notifications_count(deltas)
+            notifications_bulk_changed.send(sender=self.model, investor_ids=set(deltas))
+        return updated
+
+    mark_read.alters_data = True
+    mark_read.queryset_only = True
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-18 12:42
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('investors', '0006_backfill_industries'),
+        ('projects', '0007_slug_redirects'),
+        ('user_messages', '0002_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['related_project', 'notification_type', 'user', 'created_at'], name='notification_dedupe_idx'),
+        ),
+    ]
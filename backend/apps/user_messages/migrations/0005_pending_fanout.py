@@ -0,0 +1,31 @@
+# Generated by Django 5.2.7 on 2026-10-18 13:42
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('projects', '0009_created_indexes'),
+        ('user_messages', '0004_inbox_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PendingFanOut',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(max_length=50)),
+                ('queued_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='projects.project')),
+            ],
+            options={
+                'verbose_name': 'Pending fan-out',
+                'verbose_name_plural': 'Pending fan-outs',
+                'indexes': [models.Index(fields=['queued_at'], name='pending_fanout_queued_idx')],
+                'constraints': [models.UniqueConstraint(fields=('project', 'notification_type'), name='pending_fanout_unique')],
+            },
+        ),
+    ]
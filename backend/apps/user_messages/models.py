@@ -1,7 +1,9 @@
 from django.db import models
+from django.utils import timezone
 from apps.investors.models import InvestorProfile
 from django.contrib.auth import get_user_model
 from apps.projects.models import Project
+from .managers import NotificationQuerySet
 
 User = get_user_model()
 
@@ -17,9 +19,45 @@ class Notification(models.Model):
     read_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = NotificationQuerySet.as_manager()
+
     def __str__(self):
         return self.title
 
     class Meta:
         verbose_name = "Notification"
-        verbose_name_plural = "Notifications"
\ No newline at end of file
+        verbose_name_plural = "Notifications"
+        indexes = [
+            # Inbox pages, newest first; unread-only pages and badges use the smaller partial index.
+            models.Index(fields=['user', '-created_at', '-id'], name='notification_inbox_idx'),
+            models.Index(fields=['user', '-created_at', '-id'], name='notification_unread_idx',
+                         condition=models.Q(is_read=False)),
+            # Fan-out dedupe: was this investor told about this project update recently?
+            models.Index(fields=['related_project', 'notification_type', 'user', 'created_at'],
+                         name='notification_dedupe_idx'),
+        ]
+
+
+class PendingFanOut(models.Model):
+    """
+    A project update whose followers have not all been notified yet. Written in
+    the transaction that changed the project and deleted once the fan-out
+    finishes, so updates interrupted by a restart are redelivered by the
+    deliver_project_updates command.
+    """
+    project = models.ForeignKey(Project, on_delete=models.CASCADE)
+    notification_type = models.CharField(max_length=50)
+    queued_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f'{self.notification_type} for project {self.project_id}'
+
+    class Meta:
+        verbose_name = "Pending fan-out"
+        verbose_name_plural = "Pending fan-outs"
+        constraints = [
+            models.UniqueConstraint(fields=['project', 'notification_type'], name='pending_fanout_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['queued_at'], name='pending_fanout_queued_idx'),
+        ]
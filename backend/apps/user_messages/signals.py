@@ -0,0 +1,70 @@
+from collections import Counter
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.investors.models import InvestorProfile
+from apps.projects.managers import pledges_bulk_created
+from apps.projects.models import Pledge, Project
+from .fanout import PROJECT_FUNDING, PROJECT_STATUS, queue_project_updates
+from .managers import unread_counter_managed
+from .models import Notification
+
+NOTIFIED_PROJECT_FIELDS = ('status', 'raised_amount')
+
+
+@receiver(pre_save, sender=Project)
+def remember_notified_fields(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is not None and (update_fields is None or not set(NOTIFIED_PROJECT_FIELDS).isdisjoint(update_fields)):
+        instance._notified_before = (
+            sender.objects.filter(pk=instance.pk).values(*NOTIFIED_PROJECT_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=Project)
+def notify_project_followers(sender, instance, update_fields=None, **kwargs):
+    before = instance.__dict__.pop('_notified_before', None)
+    if before is None:
+        return
+    if before['status'] != instance.status:
+        queue_project_updates([instance.pk], PROJECT_STATUS)
+    # Project.save() leaves raised_amount out unless it is named in update_fields.
+    if 'raised_amount' in (update_fields or ()) and instance.raised_amount > before['raised_amount']:
+        queue_project_updates([instance.pk], PROJECT_FUNDING)
+
+
+@receiver(post_save, sender=Pledge)
+def notify_pledge_followers(sender, instance, created, **kwargs):
+    # Pledges raise the total with an UPDATE, so the Project receivers above never see them.
+    if created and instance.kind == 'pledge':
+        queue_project_updates([instance.project_id], PROJECT_FUNDING)
+
+
+@receiver(pledges_bulk_created)
+def notify_bulk_pledge_followers(sender, pledges, **kwargs):
+    project_ids = sorted({pledge.project_id for pledge in pledges if pledge.kind == 'pledge'})
+    if project_ids:
+        queue_project_updates(project_ids, PROJECT_FUNDING)
+
+
+@receiver(pre_save, sender=Notification)
+def remember_unread_state(sender, instance, update_fields=None, **kwargs):
+    if instance.pk is not None and (update_fields is None or not {'is_read', 'user'}.isdisjoint(update_fields)):
+        instance._unread_before = sender.objects.filter(pk=instance.pk).values_list('user_id', 'is_read').first()
+
+
+@receiver(post_save, sender=Notification)
+def update_unread_count(sender, instance, created, **kwargs):
+    before = instance.__dict__.pop('_unread_before', None)
+    deltas = Counter()
+    if before is not None and not before[1]:
+        deltas[before[0]] -= 1
+    if (created or before is not None) and not instance.is_read:
+        deltas[instance.user_id] += 1
+    InvestorProfile.objects.adjust_unread_notifications_count(deltas)
+
+
+@receiver(post_delete, sender=Notification)
+def release_unread_count(sender, instance, **kwargs):
+    if not instance.is_read and not unread_counter_managed():
+        InvestorProfile.objects.adjust_unread_notifications_count({instance.user_id: -1})
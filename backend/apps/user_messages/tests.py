@@ -1,11 +1,20 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 from django.core.exceptions import ValidationError
 from django.utils import timezone
-from apps.user_messages.models import Notification
+from apps.common.testing import create_investor
+from apps.user_messages.models import Notification, PendingFanOut
 from apps.investors.models import InvestorProfile
 from apps.users.models import User
-from apps.projects.models import Project
-from apps.startups.models import StartupProfile
+from apps.projects.models import Pledge, Project
+from apps.startups.models import SavedStartup, StartupProfile
+from .fanout import PROJECT_FUNDING, PROJECT_STATUS, fan_out_project_update
 
 
 class NotificationModelTest(TestCase):
@@ -16,7 +25,6 @@ class NotificationModelTest(TestCase):
 
         # --- Investor user ---
         self.investor_user = User.objects.create(
-            username="investor_user",
             email="investor@example.com",
             password="password123",
             first_name="Investor",
@@ -25,7 +33,6 @@ class NotificationModelTest(TestCase):
 
         # --- Startup user ---
         self.startup_user = User.objects.create(
-            username="startup_user",
             email="startup@example.com",
             password="password456",
             first_name="Startup",
@@ -147,3 +154,266 @@ class NotificationModelTest(TestCase):
         notification.save()
         self.assertTrue(notification.is_read)
         self.assertIsNotNone(notification.read_at)
+
+
+def create_notifications(investor, count, **extra):
+    return [
+        Notification.objects.create(
+            user=investor, notification_type="update", title=f"Update {n}", message="News.",
+            link_url="https://example.com/news", **extra,
+        )
+        for n in range(count)
+    ]
+
+
+@override_settings(BACKGROUND_TASKS_EAGER=True, NOTIFICATION_DEDUPE_MINUTES=60)
+class ProjectUpdateFanOutTest(TestCase):
+    """Tests for notifying the followers of a startup about its project updates"""
+
+    def setUp(self):
+        owner = User.objects.create_user(email="owner@example.com", password="password123",
+                                         first_name="Start", last_name="Up")
+        self.startup = StartupProfile.objects.create(
+            user=owner, company_name="TechStart", description="AI.", founded_year=2021, team_size=10,
+            website="https://techstart.ai", email="contact@techstart.ai", phone="+380441234567", city="Kyiv",
+            address="Khreshchatyk 20", postal_code="01001", partners_brands="AI", audit_status="approved",
+        )
+        self.project = Project.objects.create(
+            startup=self.startup, title="AI Analytics", slug="ai-analytics", short_description="AI.",
+            description="AI.", status="in_progress", target_amount=50000, currency="USD", tags="AI",
+        )
+        self.followers = [self.create_follower(f"fan{n}@example.com") for n in range(3)]
+        self.outsider = create_investor("outsider@example.com")
+
+    def create_follower(self, email):
+        investor = create_investor(email)
+        SavedStartup.objects.create(investor=investor, startup=self.startup, notes="")
+        return investor
+
+    def notified(self, notification_type):
+        return sorted(
+            Notification.objects
+            .filter(related_project=self.project, notification_type=notification_type)
+            .values_list('user_id', flat=True)
+        )
+
+    def test_followers_are_notified_in_chunks(self):
+        # project, then per chunk in a savepoint: lock, recipients, INSERT and counter UPDATE
+        with self.assertNumQueries(1 + 2 * (2 + 4)):
+            written = fan_out_project_update(self.project.pk, PROJECT_STATUS, chunk_size=2)
+
+        self.assertEqual(written, 3)
+        self.assertEqual(self.notified(PROJECT_STATUS), sorted(investor.pk for investor in self.followers))
+        notification = Notification.objects.filter(user=self.followers[0]).get()
+        self.assertEqual(notification.title, "AI Analytics: In Progress")
+        self.assertEqual(notification.related_user, self.startup.user)
+        self.assertTrue(notification.link_url.endswith("/projects/ai-analytics"))
+
+    def test_updates_are_deduplicated_within_window(self):
+        fan_out_project_update(self.project.pk, PROJECT_STATUS)
+        late_follower = self.create_follower("late@example.com")
+
+        self.assertEqual(fan_out_project_update(self.project.pk, PROJECT_STATUS), 1)
+        self.assertEqual(fan_out_project_update(self.project.pk, PROJECT_FUNDING), 4)
+
+        Notification.objects.filter(user=late_follower).update(created_at=timezone.now() - timedelta(hours=2))
+        self.assertEqual(fan_out_project_update(self.project.pk, PROJECT_STATUS), 1)
+
+    def test_status_change_schedules_fan_out(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.status = "completed"
+            self.project.save()
+
+        self.assertEqual(len(self.notified(PROJECT_STATUS)), 3)
+        self.assertEqual(self.notified(PROJECT_FUNDING), [])
+
+    def test_pledges_notify_funding(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Pledge.objects.create(project=self.project, investor=self.outsider, amount=1000)
+            Pledge.objects.create(project=self.project, investor=self.outsider, amount=500)
+
+        self.assertEqual(len(self.notified(PROJECT_FUNDING)), 3)
+        self.assertIn('has raised 1500.00 USD of 50000.00 USD', Notification.objects.first().message)
+
+    def test_bulk_pledges_notify_funding(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Pledge.objects.bulk_create([
+                Pledge(project=self.project, investor=self.outsider, amount=1000),
+                Pledge(project=self.project, investor=self.outsider, amount=500),
+            ])
+
+        self.assertEqual(len(self.notified(PROJECT_FUNDING)), 3)
+        self.assertIn('has raised 1500.00 USD', Notification.objects.first().message)
+
+    def test_unlisted_projects_notify_nobody(self):
+        self.project.visibility = "private"
+        self.project.save(update_fields=['visibility'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Pledge.objects.create(project=self.project, investor=self.outsider, amount=1000)
+
+        self.assertEqual(fan_out_project_update(self.project.pk, PROJECT_STATUS), 0)
+        self.assertFalse(Notification.objects.exists())
+
+    def test_unrelated_saves_do_not_schedule_fan_out(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.project.description = "Updated."
+            self.project.save()
+            self.project.save(update_fields=['title'])
+
+        self.assertFalse(Notification.objects.exists())
+
+    def test_interrupted_fan_out_is_redelivered(self):
+        # The commit callbacks are dropped, as if the process restarted before the pool ran them.
+        with self.captureOnCommitCallbacks(execute=False):
+            self.project.status = "completed"
+            self.project.save()
+        self.assertTrue(PendingFanOut.objects.filter(project=self.project, notification_type=PROJECT_STATUS).exists())
+        self.assertEqual(self.notified(PROJECT_STATUS), [])
+
+        out = StringIO()
+        call_command('deliver_project_updates', seconds=0, stdout=out)
+
+        self.assertIn('Delivered 1 project update(s) as 3 notification(s).', out.getvalue())
+        self.assertEqual(len(self.notified(PROJECT_STATUS)), 3)
+        self.assertFalse(PendingFanOut.objects.exists())
+
+    def test_fan_out_counts_as_unread(self):
+        fan_out_project_update(self.project.pk, PROJECT_STATUS)
+
+        self.followers[0].refresh_from_db()
+        self.assertEqual(self.followers[0].unread_notifications_count, 1)
+
+
+class UnreadNotificationsCounterTest(TestCase):
+    """Tests for InvestorProfile.unread_notifications_count"""
+
+    def setUp(self):
+        self.investor = create_investor("reader@example.com")
+        self.other = create_investor("other@example.com")
+
+    def assertUnread(self, investor, expected):
+        investor.refresh_from_db(fields=['unread_notifications_count'])
+        self.assertEqual(investor.unread_notifications_count, expected)
+
+    def test_per_row_create_read_and_delete(self):
+        first, second = create_notifications(self.investor, 2)
+        create_notifications(self.investor, 1, is_read=True)
+        self.assertUnread(self.investor, 2)
+
+        first.is_read = True
+        first.save()
+        first.save()
+        self.assertUnread(self.investor, 1)
+
+        second.user = self.other
+        second.save(update_fields=['user'])
+        self.assertUnread(self.investor, 0)
+        self.assertUnread(self.other, 1)
+
+        second.delete()
+        first.delete()
+        self.assertUnread(self.other, 0)
+
+    def test_bulk_create_and_mark_read(self):
+        Notification.objects.bulk_create([
+            Notification(user=investor, notification_type="update", title="Update", message="News.",
+                         link_url="https://example.com/news")
+            for investor in (self.investor, self.investor, self.other)
+        ])
+        self.assertUnread(self.investor, 2)
+        self.assertUnread(self.other, 1)
+
+        self.assertEqual(Notification.objects.filter(user=self.investor).mark_read(), 2)
+        self.assertEqual(Notification.objects.filter(user=self.investor).mark_read(), 0)
+        self.assertUnread(self.investor, 0)
+        self.assertUnread(self.other, 1)
+        self.assertFalse(Notification.objects.filter(user=self.investor, read_at__isnull=True).exists())
+
+    def test_queryset_delete(self):
+        create_notifications(self.investor, 3)
+        create_notifications(self.investor, 1, is_read=True)
+
+        Notification.objects.filter(user=self.investor).delete()
+
+        self.assertUnread(self.investor, 0)
+
+    def test_reconcile_command_repairs_drift(self):
+        create_notifications(self.investor, 2)
+        InvestorProfile.objects.filter(pk=self.investor.pk).update(unread_notifications_count=7)
+
+        out = StringIO()
+        call_command('reconcile_unread_notifications', stdout=out)
+
+        self.assertUnread(self.investor, 2)
+        self.assertIn('for 1 investor(s)', out.getvalue())
+
+
+class NotificationInboxAPITest(APITestCase):
+    """Tests for /api/messages/notifications/"""
+
+    def setUp(self):
+        self.investor = create_investor("reader@example.com")
+        self.notifications = create_notifications(self.investor, 3)
+        create_notifications(create_investor("other@example.com"), 2)
+        self.client.force_authenticate(self.investor.user)
+
+    def test_inbox_is_keyset_paginated(self):
+        url = reverse('notification-list')
+
+        first = self.client.get(url, {'page_size': 2})
+        second = self.client.get(first.data['next'])
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        ids = [row['id'] for row in first.data['results'] + second.data['results']]
+        self.assertEqual(ids, [n.id for n in reversed(self.notifications)])
+        self.assertIsNone(second.data['next'])
+
+    def test_unread_filter(self):
+        Notification.objects.filter(pk=self.notifications[0].pk).mark_read()
+
+        response = self.client.get(reverse('notification-list'), {'unread': 'true'})
+
+        self.assertEqual([row['id'] for row in response.data['results']],
+                         [self.notifications[2].id, self.notifications[1].id])
+
+    def test_unread_count_reads_stored_counter(self):
+        # Investor profile lookup only; no COUNT over notifications.
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('notification-unread-count'))
+
+        self.assertEqual(response.data, {'unread_count': 3})
+
+    def test_mark_one_and_all_read(self):
+        response = self.client.post(reverse('notification-read', args=[self.notifications[0].pk]))
+        self.assertEqual(response.data, {'marked_read': 1, 'unread_count': 2})
+
+        response = self.client.post(reverse('notification-read', args=[self.notifications[0].pk]))
+        self.assertEqual(response.data, {'marked_read': 0, 'unread_count': 2})
+
+        response = self.client.post(reverse('notification-read-all'))
+        self.assertEqual(response.data, {'marked_read': 2, 'unread_count': 0})
+
+    def test_cannot_mark_other_investors_notifications(self):
+        foreign = Notification.objects.exclude(user=self.investor).first()
+
+        response = self.client.post(reverse('notification-read', args=[foreign.pk]))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Notification.objects.get(pk=foreign.pk).is_read)
+
+    def test_unknown_notification_ids_are_not_found(self):
+        url = reverse('notification-list')
+        for suffix in (f'{Notification.objects.order_by("-pk").first().pk + 1}/read/', 'abc/read/'):
+            response = self.client.post(url + suffix)
+
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_requires_investor_profile(self):
+        user = User.objects.create_user(email="nobody@example.com", password="password123",
+                                        first_name="No", last_name="Body")
+        self.client.force_authenticate(user)
+
+        response = self.client.get(reverse('notification-list'))
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
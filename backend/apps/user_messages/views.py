@@ -1,3 +1,57 @@
-from django.shortcuts import render
+from django.http import Http404
+from rest_framework import mixins, viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
-# Create your views here.
+from apps.common.pagination import KeysetPagination
+from apps.investors.models import InvestorProfile
+from apps.investors.permissions import IsInvestor, get_investor_profile
+from .models import Notification
+from .serializers import NotificationSerializer
+
+
+class NotificationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """
+    Inbox of the authenticated investor.
+    GET  /api/messages/notifications/               newest first, keyset paginated (?unread=true: unread only)
+    GET  /api/messages/notifications/unread-count/  badge counter, read from InvestorProfile
+    POST /api/messages/notifications/<id>/read/     mark one as read
+    POST /api/messages/notifications/read-all/      mark all as read
+    """
+    serializer_class = NotificationSerializer
+    permission_classes = [IsAuthenticated, IsInvestor]
+    pagination_class = KeysetPagination
+    keyset_ordering = ('-created_at', '-id')
+    lookup_value_regex = r'\d+'
+
+    def get_queryset(self):
+        queryset = Notification.objects.filter(user=get_investor_profile(self.request))
+        if self.request.query_params.get('unread', '').lower() in ('1', 'true'):
+            # Served by the partial notification_unread_idx.
+            queryset = queryset.filter(is_read=False)
+        return queryset.only(*NotificationSerializer.Meta.fields)
+
+    def unread_response(self, marked_read):
+        investor = get_investor_profile(self.request)
+        unread_count = InvestorProfile.objects.filter(pk=investor.pk).values_list(
+            'unread_notifications_count', flat=True
+        ).get()
+        return Response({'marked_read': marked_read, 'unread_count': unread_count})
+
+    @action(detail=False, methods=['get'], url_path='unread-count')
+    def unread_count(self, request):
+        return Response({'unread_count': get_investor_profile(request).unread_notifications_count})
+
+    @action(detail=True, methods=['post'])
+    def read(self, request, pk=None):
+        notification = self.get_queryset().filter(pk=pk)
+        marked_read = notification.mark_read()
+        # Nothing marked: already read, or not one of this investor's notifications.
+        if not marked_read and not notification.exists():
+            raise Http404
+        return self.unread_response(marked_read)
+
+    @action(detail=False, methods=['post'], url_path='read-all')
+    def read_all(self, request):
+        return self.unread_response(self.get_queryset().mark_read())
@@ -39,6 +39,7 @@ DJANGO_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
 ]
 
 THIRD_PARTY_APPS = [
@@ -50,9 +51,14 @@ THIRD_PARTY_APPS = [
 LOCAL_APPS = [
     'apps.common',
     'apps.dashboard',
+    'apps.facets',
     'apps.investors',
     'apps.projects',
+    'apps.recommendations',
+    'apps.search',
     'apps.startups',
+    'apps.sync',
+    'apps.trending',
     'apps.user_messages',
     'apps.users',
     'apps.authentication',
@@ -104,6 +110,25 @@ DATABASES = {
         'PORT': os.environ.get('POSTGRES_PORT', 5432), }
 }
 
+# The cache must be shared by all worker processes: the miss-coalescing locks
+# (apps.common.cache) and the on-commit invalidations only reach other
+# processes through it. Without REDIS_URL (local runs, tests) every process
+# gets a private LocMemCache.
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -175,3 +200,30 @@ DEFAULT_FROM_EMAIL = os.environ.get('DEFAULT_FROM_EMAIL', 'noreply@siskidomain.c
 AUTH_USER_MODEL = 'users.User'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
+STARTUP_PROFILE_CACHE_TIMEOUT = int(os.environ.get('STARTUP_PROFILE_CACHE_TIMEOUT', 600))
+SEARCH_CACHE_TIMEOUT = int(os.environ.get('SEARCH_CACHE_TIMEOUT', 300))
+FACETS_CACHE_TIMEOUT = int(os.environ.get('FACETS_CACHE_TIMEOUT', 300))
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_CACHE_TIMEOUT', 120))
+# The followed projects widget is not invalidated by project or pledge writes; it expires instead.
+DASHBOARD_PROJECTS_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_PROJECTS_CACHE_TIMEOUT', 60))
+
+BACKGROUND_TASKS_EAGER = os.environ.get('BACKGROUND_TASKS_EAGER', 'False').lower() == 'true'
+BACKGROUND_TASK_WORKERS = int(os.environ.get('BACKGROUND_TASK_WORKERS', 4))
+
+RECOMMENDATIONS_TOP_K = int(os.environ.get('RECOMMENDATIONS_TOP_K', 50))
+
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', 2000))
+
+PROJECT_SLUG_CACHE_SIZE = int(os.environ.get('PROJECT_SLUG_CACHE_SIZE', 10000))
+PROJECT_SLUG_CACHE_TTL = int(os.environ.get('PROJECT_SLUG_CACHE_TTL', 300))
+
+TRENDING_WINDOW_DAYS = int(os.environ.get('TRENDING_WINDOW_DAYS', 7))
+TRENDING_SIZE = int(os.environ.get('TRENDING_SIZE', 1000))
+
+SYNC_TOMBSTONE_RETENTION_DAYS = int(os.environ.get('SYNC_TOMBSTONE_RETENTION_DAYS', 30))
+
+NOTIFICATION_DEDUPE_MINUTES = int(os.environ.get('NOTIFICATION_DEDUPE_MINUTES', 60))
+NOTIFICATION_FANOUT_CHUNK_SIZE = int(os.environ.get('NOTIFICATION_FANOUT_CHUNK_SIZE', 1000))
+# Queued fan-outs older than this are redelivered by the deliver_project_updates command.
+NOTIFICATION_FANOUT_RETRY_SECONDS = int(os.environ.get('NOTIFICATION_FANOUT_RETRY_SECONDS', 300))
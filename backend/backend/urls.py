@@ -23,6 +23,15 @@ urlpatterns = [
     path('api/auth/', include('apps.authentication.urls')),
 
     path('api/startups/', include('apps.startups.urls')),
+    path('api/investors/', include('apps.investors.urls')),
+    path('api/projects/', include('apps.projects.urls')),
+    path('api/search/', include('apps.search.urls')),
+    path('api/facets/', include('apps.facets.urls')),
+    path('api/dashboard/', include('apps.dashboard.urls')),
+    path('api/recommendations/', include('apps.recommendations.urls')),
+    path('api/trending/', include('apps.trending.urls')),
+    path('api/sync/', include('apps.sync.urls')),
+    path('api/messages/', include('apps.user_messages.urls')),
     path('api/', include('api.authorization.urls')),
     path('common/', include('apps.common.urls')),
 ]